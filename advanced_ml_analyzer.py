@@ -6,15 +6,10 @@ Uses parsed telegram data to train ML models and predict signal success
 
 import pandas as pd
 import numpy as np
-import re
 from datetime import datetime
 import json
-import matplotlib.pyplot as plt
-import seaborn as sns
-from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
-from sklearn.model_selection import train_test_split, cross_val_score
-from sklearn.metrics import accuracy_score, classification_report, confusion_matrix
-from sklearn.preprocessing import StandardScaler
+from feature_engineering import FEATURE_SOURCE_COLUMNS, engineer_signal_features, parse_mc_value
+from signal_store import load_signal_data
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -22,18 +17,17 @@ class AdvancedMLAnalyzer:
     def __init__(self):
         self.df = None
         self.ml_model = None
-        self.scaler = StandardScaler()
+        self.scaler = None  # Created when training (sklearn is imported lazily)
         self.feature_columns = []
         
     def load_parsed_data(self):
         """Load parsed telegram data"""
         try:
-            self.df = pd.read_csv('parsed_telegram_data.csv')
+            self.df = load_signal_data(columns=FEATURE_SOURCE_COLUMNS + [
+                'initial_lp_sol', 'lp_tokens_percent', 'top_holders_percent', 'max_gain'
+            ])
             print(f"✅ Loaded {len(self.df)} parsed signals")
             
-            # Convert date column
-            self.df['date'] = pd.to_datetime(self.df['date'])
-            
             # Filter signals with complete data
             complete_signals = self.df[
                 (self.df['initial_mc'].notna()) & 
@@ -54,45 +48,7 @@ class AdvancedMLAnalyzer:
         """Engineer features for ML model"""
         print("\n🔧 ENGINEERING FEATURES...")
         
-        # Parse market cap values
-        self.df['initial_mc_value'] = self.df['initial_mc'].apply(self.parse_mc_value)
-        self.df['call_mc_value'] = self.df['call_mc'].apply(self.parse_mc_value)
-        
-        # Calculate wallet concentration metrics
-        self.df['max_wallet_percent'] = self.df['wallet_percentages'].apply(
-            lambda x: max(eval(x)) if isinstance(x, str) and x != '[]' else 0
-        )
-        self.df['avg_wallet_percent'] = self.df['wallet_percentages'].apply(
-            lambda x: np.mean(eval(x)) if isinstance(x, str) and x != '[]' else 0
-        )
-        self.df['wallet_count'] = self.df['wallet_percentages'].apply(
-            lambda x: len(eval(x)) if isinstance(x, str) and x != '[]' else 0
-        )
-        
-        # Time-based features
-        self.df['hour'] = self.df['date'].dt.hour
-        self.df['day_of_week'] = self.df['date'].dt.dayofweek
-        self.df['month'] = self.df['date'].dt.month
-        
-        # Binary features
-        self.df['freeze_disabled_int'] = self.df['freeze_disabled'].astype(int)
-        self.df['mint_disabled_int'] = self.df['mint_disabled'].astype(int)
-        self.df['lp_burned_int'] = self.df['lp_burned'].astype(int)
-        
-        # Strategy encoding
-        self.df['strategy_encoded'] = self.df['strategy'].map({
-            'Viper Vision': 1,
-            'Cobra Scan': 2,
-            'Eagle Eye': 3,
-            'Phoenix Sight': 4,
-            'Pheonix Sight': 4,  # Same as Phoenix
-            'Hydra Hunt': 5,
-            'Dragon Detector': 6,
-            'Wolf Watch': 7,
-            'Tiger Trace': 8,
-            'Tiger Trace 2': 8,
-            'Scorpion Sweep': 9
-        }).fillna(0)
+        self.df = engineer_signal_features(self.df)
         
         # Target variable
         self.df['success_5x'] = (self.df['max_gain'] >= 5).astype(int)
@@ -103,26 +59,15 @@ class AdvancedMLAnalyzer:
     
     def parse_mc_value(self, mc_str):
         """Parse market cap string to numeric value"""
-        if pd.isna(mc_str):
-            return 0
-        
-        mc_str = str(mc_str).replace('$', '').replace(',', '').strip()
-        
-        try:
-            if 'K' in mc_str:
-                return float(re.sub(r'[^\d.]', '', mc_str)) * 1000
-            elif 'M' in mc_str:
-                return float(re.sub(r'[^\d.]', '', mc_str)) * 1000000
-            elif 'B' in mc_str:
-                return float(re.sub(r'[^\d.]', '', mc_str)) * 1000000000
-            else:
-                return float(re.sub(r'[^\d.]', '', mc_str))
-        except:
-            return 0
+        return parse_mc_value(mc_str)
     
     def train_ml_models(self, target='success_5x'):
         """Train multiple ML models"""
         print(f"\n🤖 TRAINING ML MODELS FOR {target.upper()}...")
+        from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
+        from sklearn.metrics import accuracy_score
+        from sklearn.model_selection import train_test_split
+        from sklearn.preprocessing import StandardScaler
         
         # Feature columns
         feature_cols = [
@@ -154,6 +99,7 @@ class AdvancedMLAnalyzer:
         )
         
         # Scale features
+        self.scaler = StandardScaler()
         X_train_scaled = self.scaler.fit_transform(X_train)
         X_test_scaled = self.scaler.transform(X_test)
         
@@ -304,6 +250,7 @@ class AdvancedMLAnalyzer:
     def create_visualizations(self):
         """Create analysis visualizations"""
         print("\n📊 CREATING VISUALIZATIONS...")
+        import matplotlib.pyplot as plt
         
         plt.style.use('default')
         fig, axes = plt.subplots(2, 3, figsize=(18, 12))
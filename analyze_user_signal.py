@@ -3,18 +3,12 @@
 Analyze the user's specific signal
 """
 
-from realtime_signal_analyzer import RealtimeSignalAnalyzer
+from datetime import datetime
+from scoring_daemon import DaemonUnavailable, call
 
 def analyze_user_signal():
     """Analyze the specific signal provided by the user"""
     
-    # Initialize analyzer
-    analyzer = RealtimeSignalAnalyzer()
-    
-    # Load model and insights
-    if not analyzer.load_model_and_insights():
-        print("❌ Could not load model. Using basic analysis.")
-    
     # User's actual signal
     user_signal = """🤖 0xBot AI Agent | Solana Network (https://t.me/ai_agent_solana_0xbot) 
 🏖 buy and retire | 401k | (Pump.Fun💊)
@@ -66,13 +60,24 @@ i give normal signal"""
         'freeze_disabled': True,
         'mint_disabled': True,
         'lp_burned': False,
-        'date': analyzer.parse_signal_message(user_signal)['date']
+        'date': datetime.now()
     }
     
     # Analyze with both methods
     try:
-        analysis = analyzer.analyze_signal(user_signal)
-        analyzer.print_analysis(analysis)
+        try:
+            # Warm model in the scoring daemon, if it is running
+            call('analyze', signal=user_signal, show=True)
+        except DaemonUnavailable:
+            from realtime_signal_analyzer import RealtimeSignalAnalyzer
+            analyzer = RealtimeSignalAnalyzer()
+            
+            # Load model and insights
+            if not analyzer.load_model_and_insights():
+                print("❌ Could not load model. Using basic analysis.")
+            
+            analysis = analyzer.analyze_signal(user_signal)
+            analyzer.print_analysis(analysis)
     except Exception as e:
         print(f"❌ Analysis error: {e}")
         
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+🔁 Background Event Loop
+Vienas asyncio event loop atskiroje daemon gijoje visam procesui.
+
+Sinchroninis kodas (Streamlit skriptas) paduoda korutinas per
+run_coroutine_threadsafe, todėl aiohttp sesija, jungčių pool'as ir analizatorių
+cache'ai išlieka tarp užklausų, o ne kuriami su kiekvienu new_event_loop().
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+
+class BackgroundLoop:
+    """Event loop, sukasi savo gijoje, kol iškviečiamas close()"""
+
+    def __init__(self, name: str = '0xbot-event-loop'):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    @property
+    def running(self) -> bool:
+        return self._thread.is_alive() and not self.loop.is_closed()
+
+    def submit(self, coro: Awaitable) -> concurrent.futures.Future:
+        """Paleidžia korutiną loop'e; grąžina thread-safe Future"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Awaitable, timeout: Optional[float] = None,
+            on_wait: Optional[Callable[[float], Any]] = None, poll_interval: float = 0.25) -> Any:
+        """Laukia korutinos rezultato iš kitos gijos.
+
+        on_wait(elapsed) kviečiamas kas poll_interval - Streamlit'e tai UI atnaujinimas,
+        per kurį skriptas gali būti nutrauktas (rerun / naršymas). Bet kokia išimtis
+        laukiant (ir timeout) atšaukia korutiną loop'e."""
+        future = self.submit(coro)
+        start = time.perf_counter()
+        try:
+            while True:
+                done, _ = concurrent.futures.wait([future], timeout=poll_interval)
+                if done:
+                    return future.result()
+                elapsed = time.perf_counter() - start
+                if timeout is not None and elapsed >= timeout:
+                    raise TimeoutError(f"coroutine did not finish in {timeout:g}s")
+                if on_wait:
+                    on_wait(elapsed)
+        except BaseException:
+            future.cancel()
+            raise
+
+    def close(self, timeout: float = 5.0):
+        """Atšaukia likusias užduotis ir sustabdo loop'ą"""
+        if not self.running:
+            return
+
+        async def _cancel_pending():
+            tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        try:
+            self.submit(_cancel_pending()).result(timeout)
+        except Exception:
+            pass
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout)
+        if not self._thread.is_alive():
+            self.loop.close()
+
+
+if __name__ == "__main__":
+    background = BackgroundLoop()
+
+    async def _work(i):
+        await asyncio.sleep(0.1)
+        return i * i
+
+    start = time.perf_counter()
+    results = [background.run(_work(i)) for i in range(3)]
+    print(f"🔁 {results} in {time.perf_counter() - start:.2f}s on one loop")
+    background.close()
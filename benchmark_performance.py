@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+⏱️ Performance Benchmarks
+Visi benchmark'ai viena komanda. Kiekviena sritis turi savo skriptą benchmarks/ kataloge:
+parsing, network, rpc, scoring, dashboard, storage (python -m benchmarks.<sritis>).
+
+Naudojimas: python benchmark_performance.py [benchmark ...]
+"""
+
+from benchmarks import dashboard, network, parsing, rpc, scoring, storage
+from benchmarks.common import run_benchmarks
+
+BENCHMARKS = {
+    **parsing.BENCHMARKS,
+    **network.BENCHMARKS,
+    **rpc.BENCHMARKS,
+    **scoring.BENCHMARKS,
+    **dashboard.BENCHMARKS,
+    **storage.BENCHMARKS,
+}
+
+
+def main():
+    run_benchmarks(BENCHMARKS, '0xbot performance benchmarks')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Greitaveikos benchmark'ai pagal sritis (python -m benchmarks.<sritis> [benchmark ...])"""
@@ -0,0 +1,222 @@
+"""
+⏱️ Benchmark Common
+Bendri benchmark'ų įrankiai: sintetiniai 0xBot pranešimai ir eksportai (pagal realius
+šablonus), laiko matavimas ir lokalus Solscan/DexScreener stub API.
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from typing import Dict, List
+
+import pandas as pd
+
+BASE58_ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
+
+SIGNAL_TEMPLATE = """🤖 0xBot AI Agent | Solana Network (https://t.me/ai_agent_solana_0xbot)
+🏖 {token_name} | {token_symbol} | (Pump.Fun💊)
+
+🛒 Token Address:
+{token_address}
+
+📚 Supply: {supply} Tokens
+📊 Initial MC: ${initial_mc}
+💲 Call MC: ${call_mc}
+💎 Initial LP: {initial_lp_sol} SOL | $14.52K
+💧 Call Liquidity: {initial_lp_sol} SOL | $14.51K
+⚙️ LP Tokens: {lp_tokens_percent}%
+
+💼 Top 10 holders: (https://solscan.io/token/{token_address}#holders) {top_holders_percent}%
+{holders}
+
+🛠️ Deployer (https://solscan.io/account/{deployer}) 0.0 SOL | 0.0 Tokens
+
+❄️ FREEZE: {freeze}
+💼 MINT: {mint}
+🔥 LP STATUS: {lp_status}
+
+📬 SOCIALS: WEB (https://example.com) | X (https://x.com/i/communities/1926833339710750951)
+
+🔗 PHOTON (https://photon-sol.tinyastro.io/en/lp/{token_address}) | RUGCHECK (https://rugcheck.xyz/tokens/{token_address}) | SCREEN (https://dexscreener.com/solana/{token_address})
+💡 Strategy: {strategy}
+
+Our VIP members get 30s early calls and more premium signals than the public group. 👉 @pay0x_bot"""
+
+GAINS_TEMPLATE = """{token_symbol} gains 🚀 {gain}x 🚀
+Call MC: ${call_mc}
+Current MC: ${current_mc}"""
+
+CHATTER_TEMPLATES = [
+    "gm degens",
+    "anyone aped {token_symbol}?",
+    "Our VIP members get 30s early calls 👉 @pay0x_bot",
+]
+
+
+def random_address(rng: random.Random, length: int = 44) -> str:
+    """Atsitiktinis base58 adresas"""
+    return ''.join(rng.choice(BASE58_ALPHABET) for _ in range(length))
+
+
+def _field(row: Dict, key: str, default):
+    """Eilutės reikšmė arba default, jei jos nėra / NaN"""
+    value = row.get(key)
+    return default if value is None or pd.isna(value) else value
+
+
+def render_signal_message(row: Dict, rng: random.Random, holder_pool: List[str] = None) -> str:
+    """Sugeneruoja 0xBot signalo tekstą iš parsed_telegram_data eilutės"""
+    holder_pool = holder_pool or [random_address(rng) for _ in range(50)]
+    percentages = sorted((round(rng.uniform(1, 4), 2) for _ in range(10)), reverse=True)
+    holder_links = [f"{p}% (https://solscan.io/address/{rng.choice(holder_pool)})" for p in percentages]
+    holders = ' | '.join(holder_links[:5]) + '\n' + ' | '.join(holder_links[5:])
+
+    return SIGNAL_TEMPLATE.format(
+        token_name=_field(row, 'token_name', 'Token'),
+        token_symbol=_field(row, 'token_symbol', 'TKN'),
+        token_address=_field(row, 'token_address', None) or random_address(rng),
+        supply=_field(row, 'supply', '1000M'),
+        initial_mc=_field(row, 'initial_mc', '70K'),
+        call_mc=_field(row, 'call_mc', '70K'),
+        initial_lp_sol=_field(row, 'initial_lp_sol', 85.0),
+        lp_tokens_percent=int(_field(row, 'lp_tokens_percent', 20)),
+        top_holders_percent=_field(row, 'top_holders_percent', 20.0),
+        holders=holders,
+        deployer=rng.choice(holder_pool[:10]),
+        freeze='✅ Disabled' if _field(row, 'freeze_disabled', True) else '❌ Enabled',
+        mint='✅ Disabled' if _field(row, 'mint_disabled', True) else '❌ Enabled',
+        lp_status='✅ Burned' if _field(row, 'lp_burned', False) else '❌ Not Burned',
+        strategy=_field(row, 'strategy', 'Cobra Scan'),
+    )
+
+
+def render_gains_message(row: Dict, rng: random.Random) -> str:
+    """Sugeneruoja gains update tekstą"""
+    gain = round(rng.uniform(1.5, 20), 2)
+    return GAINS_TEMPLATE.format(
+        token_symbol=_field(row, 'token_symbol', 'TKN'),
+        gain=gain,
+        call_mc=_field(row, 'call_mc', '70K'),
+        current_mc=f"{gain * 70:.1f}K",
+    )
+
+
+def load_history_rows(path: str = 'parsed_telegram_data.csv') -> List[Dict]:
+    """Istorinės signalų eilutės kaip dict sąrašas"""
+    return pd.read_csv(path).to_dict('records')
+
+
+def synthetic_signal_messages(n: int = None, seed: int = 42) -> List[str]:
+    """Signalų tekstai pagal istorinius duomenis (default - visa istorija)"""
+    rng = random.Random(seed)
+    rows = load_history_rows()
+    if n is not None:
+        rows = [rows[i % len(rows)] for i in range(n)]
+    holder_pool = [random_address(rng) for _ in range(500)]
+    return [render_signal_message(row, rng, holder_pool) for row in rows]
+
+
+def write_synthetic_chat_export(path: str, messages: int, seed: int = 42) -> Dict[str, int]:
+    """Telegram eksporto CSV (id, date, from, text): signalai, jų gains update'ai, pokalbiai, tuščios žinutės.
+
+    Rašoma eilutė po eilutės, todėl ir milijoninis eksportas negeneruojamas atmintyje."""
+    import csv
+    from datetime import datetime, timedelta, timezone
+
+    rng = random.Random(seed)
+    rows = load_history_rows()
+    holder_pool = [random_address(rng) for _ in range(500)]
+    recent: List[Dict] = []
+    counts = {'signal': 0, 'gains': 0, 'chatter': 0, 'empty': 0}
+    moment = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['id', 'date', 'from', 'text'])
+        for message_id in range(messages):
+            moment += timedelta(seconds=rng.randint(5, 120))
+            roll = rng.random()
+            if roll < 0.35 or not recent:
+                row = rows[counts['signal'] % len(rows)]
+                text, kind = render_signal_message(row, rng, holder_pool), 'signal'
+                recent = (recent + [row])[-50:]
+            elif roll < 0.70:
+                text, kind = render_gains_message(rng.choice(recent), rng), 'gains'
+            elif roll < 0.98:
+                template = rng.choice(CHATTER_TEMPLATES)
+                text, kind = template.format(token_symbol=_field(rng.choice(recent), 'token_symbol', 'TKN')), 'chatter'
+            else:
+                text, kind = '', 'empty'  # Media / sticker be teksto
+            counts[kind] += 1
+            writer.writerow([message_id, moment.isoformat(sep=' '), '0xBot', text])
+    return counts
+
+
+def best_of(fn, repeat: int = 3) -> float:
+    """Mažiausias fn() vykdymo laikas iš kelių bandymų"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def report(label: str, count: int, elapsed: float):
+    print(f"   {label:<45} {count:>8} msgs  {elapsed:8.3f}s  {count / elapsed:>10,.0f} msg/s")
+
+
+def percentiles(samples: List[float]) -> Dict[str, float]:
+    """p50 / p99 milisekundėmis"""
+    ordered = sorted(samples)
+    pick = lambda q: ordered[min(len(ordered) - 1, int(len(ordered) * q))] * 1000
+    return {'p50': pick(0.50), 'p99': pick(0.99)}
+
+
+STUB_HANDSHAKE_DELAY = 0.05  # Imituotas TCP+TLS+DNS kaštas kiekvienai naujai jungčiai (s)
+
+
+async def start_stub_api(connections: set, port: int = 0, latency: float = 0.0, transactions: int = 0,
+                         requests: list = None):
+    """Lokalus Solscan/DexScreener stub serveris; skaičiuoja naujas TCP jungtis (ir užklausas)"""
+    from aiohttp import web
+
+    payload = {'data': [{'blockTime': 1748200000 + i, 'signature': f"sig{i:060d}"} for i in range(transactions)]}
+
+    async def handler(request):
+        if requests is not None:
+            requests.append(request.path_qs)
+        peer = request.transport.get_extra_info('peername')
+        if peer not in connections:
+            connections.add(peer)
+            await asyncio.sleep(STUB_HANDSHAKE_DELAY)
+        await asyncio.sleep(latency)
+        if request.path.startswith('/dex/'):
+            return web.json_response({'pairs': []})
+        return web.json_response(payload)
+
+    app = web.Application()
+    app.router.add_get('/{tail:.*}', handler)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', port)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+def run_benchmarks(benchmarks: Dict, description: str, argv: List[str] = None):
+    """CLI: paleidžia nurodytus benchmark'us (default - visus) iš benchmarks žodyno"""
+    arg_parser = argparse.ArgumentParser(description=description)
+    arg_parser.add_argument('benchmarks', nargs='*',
+                            help=f"Benchmarks to run: {', '.join(sorted(benchmarks))} (default: all)")
+    args = arg_parser.parse_args(argv)
+
+    names = args.benchmarks or sorted(benchmarks)
+    unknown = [name for name in names if name not in benchmarks]
+    if unknown:
+        arg_parser.error(f"unknown benchmark(s): {', '.join(unknown)}")
+
+    for name in names:
+        benchmarks[name]()
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+🌐 Network Benchmarks
+Solscan / DexScreener analizė prieš lokalų stub API: jungtys, response cache, batch.
+
+Naudojimas: python -m benchmarks.network [benchmark ...]
+"""
+
+import asyncio
+import random
+import socket
+import time
+
+from benchmarks.common import (
+    STUB_HANDSHAKE_DELAY, load_history_rows, random_address, render_signal_message, run_benchmarks,
+    start_stub_api,
+)
+
+
+def benchmark_http(signals: int = 30):
+    """Per-signal latency: nauja sesija kiekvienam signalui vs bendra pooled sesija"""
+    import contextlib
+    import io
+    import tempfile
+    from rate_limiter import TokenBucket
+    from real_blockchain_analyzer import RealBlockchainAnalyzer
+    from response_cache import ResponseCache
+
+    # Atskiras tuščias kešas, kad matuotume tik jungčių pakartotinį naudojimą
+    cache_dir = tempfile.TemporaryDirectory()
+    response_cache = ResponseCache(f"{cache_dir.name}/http.db", max_bytes=0)
+
+    rng = random.Random(7)
+    rows = load_history_rows()
+    messages = [render_signal_message(rows[i], rng) for i in range(signals)]
+
+    def point_at_stub(analyzer, base_url):
+        for target in (analyzer, analyzer.intel):
+            target.solscan_api = target.dexscreener_api = base_url
+        analyzer.rate_limiter = analyzer.intel.rate_limiter = TokenBucket(0)  # Matuojamas tinklas, ne rate limit
+
+    async def per_signal_sessions(base_url):
+        latencies = []
+        for text in messages:
+            start = time.perf_counter()
+            async with RealBlockchainAnalyzer(response_cache=response_cache) as analyzer:
+                point_at_stub(analyzer, base_url)
+                await analyzer.analyze_signal_complete(text)
+            latencies.append(time.perf_counter() - start)
+        return latencies
+
+    async def shared_session(base_url):
+        latencies = []
+        async with RealBlockchainAnalyzer(response_cache=response_cache) as analyzer:
+            point_at_stub(analyzer, base_url)
+            for text in messages:
+                start = time.perf_counter()
+                await analyzer.analyze_signal_complete(text)
+                latencies.append(time.perf_counter() - start)
+        return latencies
+
+    async def run(mode):
+        connections = set()
+        runner, base_url = await start_stub_api(connections)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                latencies = await mode(base_url)
+        finally:
+            await runner.cleanup()
+        return latencies, len(connections)
+
+    print(f"\n🌐 HTTP SESSION REUSE ({signals} signals, local stub API, "
+          f"{STUB_HANDSHAKE_DELAY * 1000:.0f}ms simulated handshake per new connection)")
+    for label, mode in [('New session per signal (old)', per_signal_sessions),
+                        ('Shared pooled session', shared_session)]:
+        latencies, connections = asyncio.run(run(mode))
+        latencies.sort()
+        print(f"   {label:<32} p50 {latencies[len(latencies) // 2] * 1000:7.1f}ms  "
+              f"max {latencies[-1] * 1000:7.1f}ms  connections {connections:>4}")
+    response_cache.close()
+    cache_dir.cleanup()
+
+
+def benchmark_response_cache(signals: int = 30, latency: float = 0.1):
+    """Persistentinis response cache: šaltas paleidimas vs paleidimas po 'restart' su tuo pačiu failu"""
+    import contextlib
+    import io
+    import tempfile
+    from rate_limiter import TokenBucket
+    from real_blockchain_analyzer import RealBlockchainAnalyzer
+    from response_cache import ResponseCache
+
+    rng = random.Random(11)
+    rows = load_history_rows()
+    messages = [render_signal_message(rows[i], rng) for i in range(signals)]
+    cache_dir = tempfile.TemporaryDirectory()
+    cache_file = f"{cache_dir.name}/http.db"
+    with socket.socket() as probe:  # Tas pats portas abiem paleidimams -> tie patys URL raktai
+        probe.bind(('127.0.0.1', 0))
+        port = probe.getsockname()[1]
+
+    async def run(cache):
+        connections = set()
+        runner, base_url = await start_stub_api(connections, port, latency=latency, transactions=100)
+        latencies = []
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                async with RealBlockchainAnalyzer(response_cache=cache) as analyzer:
+                    for target in (analyzer, analyzer.intel):
+                        target.solscan_api = target.dexscreener_api = base_url
+                    analyzer.rate_limiter = analyzer.intel.rate_limiter = TokenBucket(0)
+                    for text in messages:
+                        start = time.perf_counter()
+                        await analyzer.analyze_signal_complete(text)
+                        latencies.append(time.perf_counter() - start)
+        finally:
+            await runner.cleanup()
+        return sorted(latencies)
+
+    print(f"\n🗄️ PERSISTENT RESPONSE CACHE ({signals} signals, stub API {latency * 1000:.0f}ms/request)")
+    for label in ('Cold cache', 'Warm cache (new process)'):
+        cache = ResponseCache(cache_file)  # Kiekvienas paleidimas atidaro failą iš naujo
+        latencies = asyncio.run(run(cache))
+        print(f"   {label:<32} p50 {latencies[len(latencies) // 2] * 1000:7.1f}ms")
+        print("   ", end='')
+        cache.report()
+        cache.close()
+    cache_dir.cleanup()
+
+
+def benchmark_batch(signals: int = 40, latency: float = 0.05):
+    """Signalai su šaltu analyzer kiekvienam vs analyze_signal_complete x N vs analyze_signals_batch"""
+    import contextlib
+    import io
+    import tempfile
+    from rate_limiter import TokenBucket
+    from real_blockchain_analyzer import RealBlockchainAnalyzer
+    from response_cache import ResponseCache
+    from signal_parser import parse_signal
+
+    # Dienos backlog: keli deployeriai ir "whale" pinigines kartojasi per daug signalų
+    rng = random.Random(13)
+    rows = load_history_rows()
+    holder_pool = [random_address(rng) for _ in range(150)]
+    messages = [render_signal_message(rows[i], rng, holder_pool) for i in range(signals)]
+    parsed = [parse_signal(text) for text in messages]
+    unique = len({p.deployer_address for p in parsed} | {h for p in parsed for _, h in p.holders[:5]})
+
+    def point_to_stub(analyzer, base_url):
+        for target in (analyzer, analyzer.intel):
+            target.solscan_api = target.dexscreener_api = base_url
+        analyzer.rate_limiter = analyzer.intel.rate_limiter = TokenBucket(50, 50)
+
+    async def run(mode):
+        requests = []
+        runner, base_url = await start_stub_api(set(), latency=latency, requests=requests)
+        cache_dir = tempfile.TemporaryDirectory()
+        cache = ResponseCache(f"{cache_dir.name}/http.db", max_bytes=0)  # Tik in-flight / objektų cache
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                start = time.perf_counter()
+                if mode == 'cold':
+                    results = []
+                    for text in messages:
+                        async with RealBlockchainAnalyzer(response_cache=cache) as analyzer:
+                            point_to_stub(analyzer, base_url)
+                            results.append(await analyzer.analyze_signal_complete(text))
+                else:
+                    async with RealBlockchainAnalyzer(response_cache=cache) as analyzer:
+                        point_to_stub(analyzer, base_url)
+                        if mode == 'batch':
+                            results = [r async for r in analyzer.analyze_signals_batch(messages)]
+                        else:
+                            results = [await analyzer.analyze_signal_complete(text) for text in messages]
+                elapsed = time.perf_counter() - start
+        finally:
+            await runner.cleanup()
+            cache.close()
+            cache_dir.cleanup()
+        return elapsed, len(requests), len(results)
+
+    print(f"\n📦 BATCH ANALYSIS ({signals} signals sharing 150 holder wallets, {unique} unique deployer/holder "
+          f"addresses, stub API {latency * 1000:.0f}ms, 50 req/s)")
+    for label, mode in [('New analyzer per signal (no reuse)', 'cold'),
+                        ('analyze_signal_complete x N', 'sequential'),
+                        ('analyze_signals_batch', 'batch')]:
+        elapsed, requests, results = asyncio.run(run(mode))
+        print(f"   {label:<36} {elapsed:7.2f}s  {elapsed / results * 1000:7.1f}ms/signal  HTTP requests {requests:>4}")
+
+
+BENCHMARKS = {
+    'http': benchmark_http,
+    'response_cache': benchmark_response_cache,
+    'batch': benchmark_batch,
+}
+
+
+if __name__ == "__main__":
+    run_benchmarks(BENCHMARKS, '0xbot network benchmarks')
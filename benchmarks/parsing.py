@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+📨 Parsing Benchmarks
+Signalų parseris ir Telegram eksporto skaitymas: throughput, RSS, shard'ai, incremental re-parse.
+
+Naudojimas: python -m benchmarks.parsing [--messages N] [benchmark ...]
+(--messages: parallel benchmark'o eksporto dydis, default 1M žinučių)
+"""
+
+import argparse
+import functools
+import json
+import subprocess
+import sys
+import time
+
+import pandas as pd
+
+from benchmarks.common import (
+    best_of, report, run_benchmarks, synthetic_signal_messages, write_synthetic_chat_export,
+)
+
+
+def benchmark_parser():
+    """Vieno praėjimo parserio greitaveika su visa istorija"""
+    from signal_parser import parse_signal_uncached, _parse_cached
+    from telegram_data_parser import TelegramDataParser
+    from real_blockchain_analyzer import RealBlockchainAnalyzer
+    from realtime_signal_analyzer import RealtimeSignalAnalyzer
+    from telegram_analyzer import TelegramCoinAnalyzer
+
+    messages = synthetic_signal_messages()
+    print(f"\n📨 PARSER THROUGHPUT ({len(messages)} synthetic 0xBot signals, best of 3)")
+
+    elapsed = best_of(lambda: [parse_signal_uncached(text) for text in messages])
+    report('signal_parser.parse_signal_uncached', len(messages), elapsed)
+
+    # Senieji entry points deleguoja į signal_parser; 17k unikalių tekstų > LRU dydis,
+    # todėl kiekvienas pranešimas parsinamas iš naujo, o penki extract_* dalinasi vienu parse
+    _parse_cached.cache_clear()
+    data_parser = TelegramDataParser()
+    analyzer = RealBlockchainAnalyzer()
+    realtime = RealtimeSignalAnalyzer()
+    coin_analyzer = TelegramCoinAnalyzer()
+
+    def coin_extract_all():
+        for text in messages:
+            coin_analyzer.extract_coin_gains(text)
+            coin_analyzer.extract_token_address(text)
+            coin_analyzer.extract_wallets_and_percentages(text)
+            coin_analyzer.extract_financial_data(text)
+            coin_analyzer.extract_security_features(text)
+
+    entry_points = [
+        ('TelegramDataParser.extract_signal_data',
+         lambda: [data_parser.extract_signal_data(text, '2025-05-25 21:28:05+00:00') for text in messages]),
+        ('RealBlockchainAnalyzer.parse_signal_improved',
+         lambda: [analyzer.parse_signal_improved(text) for text in messages]),
+        ('RealtimeSignalAnalyzer.parse_signal_message',
+         lambda: [realtime.parse_signal_message(text) for text in messages]),
+        ('TelegramCoinAnalyzer extract_* (x5, 1 parse)', coin_extract_all),
+    ]
+    for label, fn in entry_points:
+        report(label, len(messages), best_of(fn))
+
+
+INGESTION_CHILD = """
+import json, resource, sys, time
+import pandas as pd
+from telegram_data_parser import TelegramDataParser
+from wallet_database_builder import WalletDatabaseBuilder, SIGNAL_MARKER
+from chat_export_reader import iter_chat_messages
+
+variant, path = sys.argv[1], sys.argv[2]
+baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+parser = TelegramDataParser()
+if variant == 'parser_legacy':
+    # Ankstesnis load_raw_data + parse_signals: visas eksportas DataFrame'e, iterrows
+    df = pd.read_csv(path)
+    signals, gains = [], []
+    for idx, row in df.iterrows():
+        text, date = str(row['text']), row['date']
+        if parser.is_signal_announcement(text):
+            signals.append(parser.extract_signal_data(text, date))
+        elif parser.is_gains_update(text):
+            gains.append(parser.extract_gains_data(text, date))
+    count = len(signals)
+elif variant == 'parser_streaming':
+    parser.load_raw_data(path)
+    count = len(parser.parse_signals())
+elif variant == 'wallet_legacy':
+    # Ankstesnis load_historical_data: du pilni eksportai + pd.concat + filtras
+    df = pd.concat([pd.read_csv(path), pd.read_csv(path)], ignore_index=True)
+    count = sum(1 for _ in df[df['text'].str.contains(SIGNAL_MARKER, na=False)].copy().iterrows())
+else:
+    count = sum(1 for _ in iter_chat_messages([path, path], (SIGNAL_MARKER,)))
+elapsed = time.perf_counter() - start
+peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({'count': count, 'elapsed': elapsed, 'peak_mb': (peak - baseline) / 1024}))
+"""
+
+
+def benchmark_ingestion(sizes=(50_000, 200_000)):
+    """Chat eksporto skaitymas: visas DataFrame vs gabalai + prefiltras (laikas ir RSS prieaugis)"""
+    import contextlib
+    import io
+    import os
+    import tempfile
+
+    print("\n📥 CHAT EXPORT INGESTION (separate process per run, peak RSS growth after imports)")
+    with tempfile.TemporaryDirectory() as export_dir:
+        for size in sizes:
+            path = os.path.join(export_dir, f"chat_{size}.csv")
+            counts = write_synthetic_chat_export(path, size)
+            print(f"   {size:,} messages ({os.path.getsize(path) / 1e6:.0f} MB, {counts['signal']:,} signals)")
+            for label, variant in [('TelegramDataParser: read_csv + iterrows', 'parser_legacy'),
+                                   ('TelegramDataParser: streaming', 'parser_streaming'),
+                                   ('WalletDatabaseBuilder: 2 exports + concat', 'wallet_legacy'),
+                                   ('WalletDatabaseBuilder: streaming', 'wallet_streaming')]:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    result = subprocess.run([sys.executable, '-c', INGESTION_CHILD, variant, path],
+                                            capture_output=True, text=True)
+                if result.returncode != 0:
+                    print(f"      {label:<42} ❌ {result.stderr.strip().splitlines()[-1]}")
+                    continue
+                stats = json.loads(result.stdout.strip().splitlines()[-1])
+                print(f"      {label:<42} {stats['elapsed']:7.2f}s  peak +{stats['peak_mb']:7.1f} MB  "
+                      f"({stats['count']:,} signals)")
+
+
+PARALLEL_MESSAGES = 1_000_000  # Mastelio matavimas: sintetinis 1M žinučių eksportas
+TYPICAL_MESSAGES = 15_000      # Tipinis < 20k žinučių eksportas (papildomas paleidimas)
+
+
+def benchmark_parallel(messages: int = PARALLEL_MESSAGES, worker_counts=(1, 2, 4, 8),
+                       extra_runs=(TYPICAL_MESSAGES,)):
+    """TelegramDataParser.parse_signals: serial vs ProcessPoolExecutor shard'ai, 1/2/4/8 worker'iai"""
+    for size in (messages, *[size for size in extra_runs if size != messages]):
+        _parallel_scaling(size, worker_counts)
+
+
+def _parallel_scaling(messages: int, worker_counts):
+    """Vienas eksportas: parse_signals su kiekvienu worker'ių skaičiumi, rezultatas lyginamas su serial"""
+    import contextlib
+    import hashlib
+    import io
+    import os
+    import tempfile
+    from telegram_data_parser import TelegramDataParser, shard_rows
+
+    with tempfile.TemporaryDirectory() as export_dir:
+        path = os.path.join(export_dir, 'chat_export.csv')
+        start = time.perf_counter()
+        counts = write_synthetic_chat_export(path, messages)
+        print(f"\n🧵 PARALLEL PARSING ({messages:,} messages, {os.path.getsize(path) / 1e6:.0f} MB, "
+              f"{counts['signal']:,} signals, {counts['gains']:,} gains; generated in "
+              f"{time.perf_counter() - start:.0f}s; {os.cpu_count()} CPU)")
+
+        baseline = None
+        for workers in worker_counts:
+            parser = TelegramDataParser()
+            with contextlib.redirect_stdout(io.StringIO()):
+                parser.load_raw_data(path)
+                start = time.perf_counter()
+                signals = parser.parse_signals(workers=workers)
+                elapsed = time.perf_counter() - start
+            digest = hashlib.sha256(repr(signals).encode()).hexdigest()
+            baseline = baseline or (elapsed, digest)
+            same = '✅ same as serial' if digest == baseline[1] else '❌ differs from serial'
+            shards = -(-messages // shard_rows(messages, workers)) if workers > 1 else 1
+            print(f"   {workers} worker(s) {shards:>3} shard(s) {elapsed:8.2f}s  {messages / elapsed:>10,.0f} msg/s  "
+                  f"x{baseline[0] / elapsed:4.2f}  {same}")
+            del signals
+
+
+def benchmark_incremental(messages: int = 200_000, appended: int = 5_000):
+    """Eksportas papildytas naujomis žinutėmis: --full vs parse_incremental nuo checkpoint'o"""
+    import contextlib
+    import filecmp
+    import io
+    import os
+    import tempfile
+    from telegram_data_parser import TelegramDataParser
+
+    with tempfile.TemporaryDirectory() as export_dir:
+        path = os.path.join(export_dir, 'chat_export.csv')
+        write_synthetic_chat_export(path, messages)
+        export = pd.read_csv(path, dtype=str, keep_default_na=False)
+        export.iloc[:messages - appended].to_csv(path, index=False)
+
+        outputs = {}
+        print(f"\n🔁 INCREMENTAL RE-PARSE ({messages - appended:,} parsed + {appended:,} new messages, "
+              f"{os.path.getsize(path) / 1e6:.0f} MB before)")
+        for label, full in [('full re-parse', True), ('incremental', False)]:
+            output = os.path.join(export_dir, f"parsed_{'full' if full else 'incremental'}.csv")
+            export.iloc[:messages - appended].to_csv(path, index=False)
+            with contextlib.redirect_stdout(io.StringIO()):
+                parser = TelegramDataParser()
+                parser.load_raw_data(path)
+                parser.parse_signals()
+                parser.save_parsed_data(output)
+                parser.save_checkpoint(output)
+            export.to_csv(path, index=False)
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                parser = TelegramDataParser()
+                parser.load_raw_data(path)
+                start = time.perf_counter()
+                signals = parser.parse_signals() if full else parser.parse_incremental(output)
+                elapsed = time.perf_counter() - start
+                parser.save_parsed_data(output)
+            outputs[label] = output
+            print(f"   {label:<16} {elapsed:7.2f}s  ({len(signals):,} signals)")
+
+        same = filecmp.cmp(outputs['full re-parse'], outputs['incremental'], shallow=False)
+        print(f"   {'✅' if same else '❌'} parsed_telegram_data.csv {'identical' if same else 'differs'}")
+
+
+BENCHMARKS = {
+    'parser': benchmark_parser,
+    'ingestion': benchmark_ingestion,
+    'parallel': benchmark_parallel,
+    'incremental': benchmark_incremental,
+}
+
+
+if __name__ == "__main__":
+    # --messages keičia tik parallel eksporto dydį; likę argumentai - benchmark'ų vardai
+    option_parser = argparse.ArgumentParser(add_help=False)
+    option_parser.add_argument('--messages', type=int, default=PARALLEL_MESSAGES)
+    options, names = option_parser.parse_known_args()
+    BENCHMARKS['parallel'] = functools.partial(benchmark_parallel, options.messages)
+    run_benchmarks(BENCHMARKS, '0xbot parsing benchmarks', names)
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+🛰️ RPC Benchmarks
+Solana JSON-RPC klientas: failover, hedged requests ir token account batch.
+
+Naudojimas: python -m benchmarks.rpc [benchmark ...]
+"""
+
+import asyncio
+import json
+import random
+import time
+from typing import Dict, List
+
+from benchmarks.common import best_of, random_address, run_benchmarks
+
+
+async def _start_stub_rpc(delay, status: int = 200):
+    """Lokalus JSON-RPC stub; delay - sekundės arba funkcija, grąžinanti sekundes"""
+    from aiohttp import web
+
+    async def handler(request):
+        body = await request.json()
+        await asyncio.sleep(delay() if callable(delay) else delay)
+        if status != 200:
+            return web.Response(status=status)
+        return web.json_response({'jsonrpc': '2.0', 'id': body['id'], 'result': {'slot': 1}})
+
+    app = web.Application()
+    app.router.add_post('/', handler)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    return runner, f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}/"
+
+
+def benchmark_rpc(calls: int = 200, tail_rate: float = 0.03):
+    """RPC failover (vienas endpoint'as neveikia) ir hedged requests prieš lėtą uodegą"""
+    from rpc_client import SolanaRPCClient
+
+    rng = random.Random(3)
+
+    def jittery():
+        return 1.0 if rng.random() < tail_rate else 0.02
+
+    async def measure(endpoints, **kwargs):
+        latencies = []
+        async with SolanaRPCClient(endpoints, backoff=0.01, **kwargs) as rpc:
+            for _ in range(calls):
+                start = time.perf_counter()
+                await rpc.call('getSlot')
+                latencies.append(time.perf_counter() - start)
+        latencies.sort()
+        return latencies, rpc.stats
+
+    async def run():
+        stubs = [await _start_stub_rpc(0, status=503), await _start_stub_rpc(jittery), await _start_stub_rpc(jittery)]
+        down, first, second = (url for _, url in stubs)
+        try:
+            results = [
+                ('Single endpoint', await measure([first])),
+                ('Failover (1st endpoint down)', await measure([down, first, second], hedge=False)),
+                ('Failover + hedged requests', await measure([down, first, second])),
+            ]
+        finally:
+            for runner, _ in stubs:
+                await runner.cleanup()
+        return results
+
+    print(f"\n🛰️ SOLANA RPC CLIENT ({calls} calls, stub endpoints with {tail_rate:.0%} 1s latency tail)")
+    for label, (latencies, stats) in asyncio.run(run()):
+        print(f"   {label:<32} p50 {latencies[len(latencies) // 2] * 1000:7.1f}ms  "
+              f"p99 {latencies[int(len(latencies) * 0.99) - 1] * 1000:7.1f}ms  "
+              f"retries {stats.retries:>3}  hedges {stats.hedges:>3} (won {stats.hedge_wins})")
+
+
+def _token_account_fixtures(mint: str, holders: int, rng: random.Random) -> List[Dict]:
+    """Sintetiniai SPL token account'ai: (pubkey, owner bytes, amount)"""
+    return [
+        {'pubkey': random_address(rng), 'owner': rng.randbytes(32), 'amount': int(rng.paretovariate(1.2) * 1e9)}
+        for _ in range(holders)
+    ]
+
+
+def _render_token_account(mint: str, account: Dict, compact: bool, decimals: int) -> Dict:
+    """Token account taip, kaip jį grąžina getProgramAccounts (jsonParsed arba base64 + dataSlice)"""
+    import base64
+    import struct
+    from spl_token import TOKEN_PROGRAM_ID, base58_encode
+
+    if compact:
+        data = [base64.b64encode(account['owner'] + struct.pack('<Q', account['amount'])).decode(), 'base64']
+    else:
+        amount = account['amount']
+        data = {
+            'parsed': {
+                'info': {
+                    'isNative': False, 'mint': mint, 'owner': base58_encode(account['owner']), 'state': 'initialized',
+                    'tokenAmount': {'amount': str(amount), 'decimals': decimals, 'uiAmount': amount / 10 ** decimals,
+                                    'uiAmountString': str(amount / 10 ** decimals)}
+                },
+                'type': 'account'
+            },
+            'program': 'spl-token',
+            'space': 165
+        }
+    return {'pubkey': account['pubkey'], 'account': {
+        'data': data, 'executable': False, 'lamports': 2039280, 'owner': TOKEN_PROGRAM_ID,
+        'rentEpoch': 18446744073709551615, 'space': 165}}
+
+
+async def _start_stub_token_rpc(fixtures: Dict[str, List[Dict]], latency: float, decimals: int = 6):
+    """JSON-RPC stub su getProgramAccounts / getTokenSupply ir batch palaikymu"""
+    from aiohttp import web
+
+    def answer(request):
+        if request['method'] == 'getTokenSupply':
+            result = {'context': {'slot': 1}, 'value': {'amount': '1', 'decimals': decimals, 'uiAmount': 1.0}}
+        else:
+            config = request['params'][1]
+            mint = config['filters'][1]['memcmp']['bytes']
+            compact = config['encoding'] == 'base64'
+            result = [_render_token_account(mint, acc, compact, decimals) for acc in fixtures[mint]]
+        return {'jsonrpc': '2.0', 'id': request['id'], 'result': result}
+
+    async def handler(request):
+        body = await request.json()
+        await asyncio.sleep(latency)
+        reply = [answer(item) for item in body] if isinstance(body, list) else answer(body)
+        return web.json_response(reply)
+
+    app = web.Application(client_max_size=1 << 24)
+    app.router.add_post('/', handler)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    return runner, f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}/"
+
+
+def benchmark_token_accounts(tokens: int = 20, holders: int = 1000, latency: float = 0.05):
+    """getProgramAccounts: vienas POST per token vs JSON-RPC batch vs batch + base64/dataSlice"""
+    from enhanced_signal_processor import EnhancedSignalProcessor
+    from spl_token import parse_compact_accounts, parse_json_accounts
+
+    rng = random.Random(5)
+    mints = [random_address(rng) for _ in range(tokens)]
+    fixtures = {mint: _token_account_fixtures(mint, holders, rng) for mint in mints}
+
+    async def fetch(base_url, compact, batched):
+        processor = EnhancedSignalProcessor(compact_accounts=compact)
+        processor.rpc_endpoints[:] = [base_url]
+        processor.rpc = type(processor.rpc)([base_url], hedge=False)
+        start = time.perf_counter()
+        if batched:
+            accounts = await processor.get_token_accounts_batch(mints)
+        else:
+            accounts = {mint: await processor._get_token_accounts(mint) for mint in mints}
+        elapsed = time.perf_counter() - start
+        stats = processor.rpc.stats
+        await processor.close_session()
+        return accounts, elapsed, stats
+
+    async def run():
+        runner, base_url = await _start_stub_token_rpc(fixtures, latency)
+        try:
+            return [
+                ('jsonParsed, 1 POST per token', await fetch(base_url, False, False)),
+                ('jsonParsed, batched', await fetch(base_url, False, True)),
+                ('base64 + dataSlice, batched', await fetch(base_url, True, True)),
+            ]
+        finally:
+            await runner.cleanup()
+
+    # Grynas parse laikas tam pačiam tokenui (be tinklo)
+    sample = fixtures[mints[0]]
+    json_result = [_render_token_account(mints[0], acc, False, 6) for acc in sample]
+    compact_result = [_render_token_account(mints[0], acc, True, 6) for acc in sample]
+    parse_json = best_of(lambda: parse_json_accounts(json.loads(json.dumps(json_result))), repeat=5)
+    parse_compact = best_of(lambda: parse_compact_accounts(json.loads(json.dumps(compact_result)), 6), repeat=5)
+
+    print(f"\n🪙 TOKEN ACCOUNTS ({tokens} tokens x {holders} holders, stub RPC {latency * 1000:.0f}ms/POST)")
+    results = asyncio.run(run())
+    for label, (accounts, elapsed, stats) in results:
+        print(f"   {label:<32} {elapsed:7.3f}s  POSTs {stats.calls:>3}  "
+              f"{stats.bytes_received / tokens / 1024:8.1f} KB/token")
+    print(f"   Decode + parse per token: jsonParsed {parse_json * 1000:.2f}ms, "
+          f"base64/dataSlice {parse_compact * 1000:.2f}ms")
+    baseline = results[0][1][0]
+    print(f"   Identical holders across modes: {all(r[1][0] == baseline for r in results)}")
+
+
+BENCHMARKS = {
+    'rpc': benchmark_rpc,
+    'token_accounts': benchmark_token_accounts,
+}
+
+
+if __name__ == "__main__":
+    run_benchmarks(BENCHMARKS, '0xbot rpc benchmarks')
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+🎯 Scoring Benchmarks
+ML signalų vertinimas: latency, CLI paleidimo laikas ir scoring daemon.
+
+Naudojimas: python -m benchmarks.scoring [benchmark ...]
+"""
+
+import subprocess
+import sys
+import time
+from typing import Dict
+
+import pandas as pd
+
+from benchmarks.common import best_of, percentiles, report, run_benchmarks, synthetic_signal_messages
+
+
+def benchmark_scoring(signals: int = 300):
+    """RealtimeSignalAnalyzer: DataFrame pipeline + predict_proba + predict vs NumPy vektorius + vienas predict_proba"""
+    import contextlib
+    import io
+    from realtime_signal_analyzer import RealtimeSignalAnalyzer
+
+    analyzer = RealtimeSignalAnalyzer()
+    with contextlib.redirect_stdout(io.StringIO()):
+        if not analyzer.load_model_and_insights():
+            print("❌ Model could not be loaded")
+            return
+    messages = synthetic_signal_messages(signals, seed=7)
+
+    def dataframe_path(message):
+        # Ankstesnis analyze_signal: vienos eilutės DataFrame, visas pandas pipeline, du forest praėjimai
+        signal_data = analyzer.parse_signal_message(message)
+        df = analyzer._engineer_features(pd.DataFrame([signal_data]))
+        X = df[analyzer.feature_columns].fillna(0)
+        success_prob = analyzer.ml_model.predict_proba(X)[0][1]
+        success_prediction = analyzer.ml_model.predict(X)[0]
+        return analyzer._build_analysis(signal_data, success_prob, success_prediction)
+
+    print(f"\n🎯 SINGLE-SIGNAL SCORING LATENCY ({signals} signals, {len(analyzer.ml_model.estimators_)} trees)")
+    for label, fn in [('DataFrame pipeline + predict_proba + predict', dataframe_path),
+                      ('analyze_signal (NumPy vector)', analyzer.analyze_signal)]:
+        fn(messages[0])  # Warm-up
+        timings = []
+        for message in messages:
+            start = time.perf_counter()
+            fn(message)
+            timings.append(time.perf_counter() - start)
+        stats = percentiles(timings)
+        print(f"   {label:<45} p50 {stats['p50']:7.2f}ms  p99 {stats['p99']:7.2f}ms")
+
+    elapsed = best_of(lambda: analyzer.analyze_signals(messages))
+    report('analyze_signals (batch)', len(messages), elapsed)
+
+
+STARTUP_MODULES = ['quick_analyzer', 'easy_analyzer', 'simple_signal_interface',
+                   'telegram_analyzer', 'realtime_signal_analyzer', 'enhanced_signal_processor',
+                   'advanced_ml_analyzer', 'enhanced_telegram_analyzer']
+
+
+HEAVY_PACKAGES = ['matplotlib', 'seaborn', 'sklearn', 'scipy', 'bs4', 'requests']
+
+
+def _import_profile(module: str) -> Dict:
+    """python -X importtime -c 'import module': importo laikas (ms) ir įkelti sunkieji paketai"""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            capture_output=True, text=True)
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative_us, name = line[len('import time:'):].split('|')
+        cumulative[name.strip()] = int(cumulative_us)
+    return {
+        'import_ms': cumulative.get(module, 0) / 1000,
+        'heavy': [package for package in HEAVY_PACKAGES if package in cumulative]
+    }
+
+
+def benchmark_startup(repeat: int = 3):
+    """CLI modulių paleidimo (importo) laikas pagal -X importtime"""
+    print(f"\n🚀 STARTUP IMPORT TIME (python -X importtime, best of {repeat})")
+    for module in STARTUP_MODULES:
+        profiles = [_import_profile(module) for _ in range(repeat)]
+        best = min(profiles, key=lambda profile: profile['import_ms'])
+        heavy = ', '.join(best['heavy']) or '-'
+        print(f"   {module:<30} {best['import_ms']:8.1f}ms   heavy: {heavy}")
+
+
+def benchmark_daemon(requests: int = 200):
+    """CLI paleidimas su modelio įkėlimu procese vs plonas klientas + scoring daemon"""
+    import os
+    import tempfile
+    import scoring_daemon
+
+    socket_path = os.path.join(tempfile.mkdtemp(), 'scoring.sock')
+    env = dict(os.environ, OXBOT_SCORING_SOCKET=socket_path)
+
+    def cli_run() -> float:
+        start = time.perf_counter()
+        subprocess.run([sys.executable, 'analyze_user_signal.py'], env=env, capture_output=True, check=True)
+        return time.perf_counter() - start
+
+    print(f"\n🛰️ SCORING DAEMON (analyze_user_signal.py wall time best of 3; {requests} socket requests)")
+    in_process = min(cli_run() for _ in range(3))
+    print(f"   {'CLI, model loaded in-process':<45} {in_process * 1000:8.1f}ms")
+
+    daemon = subprocess.Popen([sys.executable, 'scoring_daemon.py', '--socket', socket_path],
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        deadline = time.perf_counter() + 60
+        while not scoring_daemon.daemon_available(socket_path):
+            if time.perf_counter() > deadline or daemon.poll() is not None:
+                print("❌ Scoring daemon did not start")
+                return
+            time.sleep(0.1)
+
+        thin_client = min(cli_run() for _ in range(3))
+        print(f"   {'CLI, thin client -> daemon':<45} {thin_client * 1000:8.1f}ms")
+
+        messages = synthetic_signal_messages(requests, seed=3)
+        timings = []
+        for message in messages:
+            start = time.perf_counter()
+            scoring_daemon.call('analyze', socket_path=socket_path, signal=message)
+            timings.append(time.perf_counter() - start)
+        stats = percentiles(timings)
+        print(f"   {'analyze request round-trip':<45} p50 {stats['p50']:7.2f}ms  p99 {stats['p99']:7.2f}ms")
+    finally:
+        if daemon.poll() is None:
+            scoring_daemon.call('shutdown', socket_path=socket_path)
+            daemon.wait(timeout=10)
+
+
+BENCHMARKS = {
+    'scoring': benchmark_scoring,
+    'startup': benchmark_startup,
+    'daemon': benchmark_daemon,
+}
+
+
+if __name__ == "__main__":
+    run_benchmarks(BENCHMARKS, '0xbot scoring benchmarks')
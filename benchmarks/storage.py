@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+🗄️ Storage Benchmarks
+Signalų saugykla (CSV vs Parquet) ir wallet DB incremental update.
+
+Naudojimas: python -m benchmarks.storage [benchmark ...]
+"""
+
+import time
+
+import pandas as pd
+
+from benchmarks.common import best_of, run_benchmarks, write_synthetic_chat_export
+
+
+def benchmark_storage(repeat: int = 5):
+    """parsed_telegram_data: pd.read_csv + parsinimas vs tipizuotas Parquet su stulpelių projekcija"""
+    import os
+    import shutil
+    import tempfile
+    from feature_engineering import FEATURE_SOURCE_COLUMNS
+    from signal_store import SIGNAL_DATA_FILE, columnar_path, load_signal_data, write_columnar_copy
+
+    consumers = {
+        'dashboard history (all columns)': None,
+        'realtime_signal_analyzer training': FEATURE_SOURCE_COLUMNS + [
+            'top_holders_percent', 'initial_lp_sol', 'max_gain'],
+        'advanced_ml_analyzer': FEATURE_SOURCE_COLUMNS + [
+            'initial_lp_sol', 'lp_tokens_percent', 'top_holders_percent', 'max_gain'],
+        'wallet_database_builder': ['token_name', 'max_gain', 'date', 'strategy'],
+    }
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        csv_path = os.path.join(data_dir, os.path.basename(SIGNAL_DATA_FILE))
+        shutil.copyfile(SIGNAL_DATA_FILE, csv_path)
+        parquet_path = write_columnar_copy(pd.read_csv(csv_path), csv_path)
+        if parquet_path is None:
+            return
+
+        print(f"\n🗄️ SIGNAL STORAGE (CSV {os.path.getsize(csv_path) / 1e6:.2f} MB, "
+              f"Parquet {os.path.getsize(parquet_path) / 1e6:.2f} MB, best of {repeat})")
+
+        def legacy_load():
+            # Ankstesni skaitytojai: visas CSV, date parsinama kiekvieną kartą
+            df = pd.read_csv(csv_path)
+            df['date'] = pd.to_datetime(df['date'])
+            return df
+
+        for consumer, columns in consumers.items():
+            print(f"   {consumer}")
+            for label, load in [('read_csv + to_datetime', legacy_load),
+                                ('load_signal_data (Parquet)', lambda: load_signal_data(csv_path, columns))]:
+                elapsed = best_of(load, repeat)
+                memory = load().memory_usage(deep=True).sum() / 1e6
+                print(f"      {label:<42} {elapsed * 1000:8.1f}ms  {memory:6.2f} MB")
+
+        os.remove(columnar_path(csv_path))
+        elapsed = best_of(lambda: load_signal_data(csv_path), repeat)
+        print(f"   {'CSV fallback (typed, no Parquet)':<45} {elapsed * 1000:8.1f}ms")
+
+
+def benchmark_wallet_update(messages: int = 100_000, gold_messages: int = 30_000, appended: float = 0.05):
+    """Abu eksportai papildyti naujomis žinutėmis: build_complete_database vs update_database"""
+    import contextlib
+    import io
+    import os
+    import sqlite3
+    import tempfile
+    from telegram_data_parser import TelegramDataParser
+    from wallet_database_builder import CHAT_EXPORT_FILES, WalletDatabaseBuilder
+
+    def write_exports(exports, fraction):
+        for name, export in zip(CHAT_EXPORT_FILES, exports):
+            export.iloc[:int(len(export) * fraction)].to_csv(name, index=False)
+        parser = TelegramDataParser()
+        parser.load_raw_data(CHAT_EXPORT_FILES[0])
+        parser.parse_incremental()
+        parser.save_parsed_data()
+        parser.save_checkpoint()
+
+    def table_rows(db_file):
+        with sqlite3.connect(db_file) as conn:
+            return {table: sorted(conn.execute(f"SELECT * FROM {table}"))
+                    for table in ('deployers', 'top_holders', 'wallet_aggregates', 'wallet_tokens')}
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as export_dir:
+        exports = []
+        for name, size, seed in zip(CHAT_EXPORT_FILES, (messages, gold_messages), (42, 7)):
+            path = os.path.join(export_dir, name)
+            write_synthetic_chat_export(path, size, seed)
+            exports.append(pd.read_csv(path, dtype=str, keep_default_na=False))
+
+        os.chdir(export_dir)
+        try:
+            print(f"\n🏦 WALLET DB UPDATE ({messages:,} + {gold_messages:,} messages, last {appended:.0%} new)")
+            with contextlib.redirect_stdout(io.StringIO()):
+                write_exports(exports, 1 - appended)
+                builder = WalletDatabaseBuilder()
+                builder.db_file = 'incremental.db'
+                builder.build_complete_database()
+                write_exports(exports, 1)
+
+            timings = {}
+            for label, db_file, update in [('full rebuild', 'full.db', False), ('incremental', 'incremental.db', True)]:
+                builder = WalletDatabaseBuilder()
+                builder.db_file = db_file
+                with contextlib.redirect_stdout(io.StringIO()):
+                    start = time.perf_counter()
+                    builder.update_database() if update else builder.build_complete_database()
+                    timings[label] = time.perf_counter() - start
+                print(f"   {label:<14} {timings[label]:7.2f}s")
+
+            same = table_rows('full.db') == table_rows('incremental.db')
+            print(f"   x{timings['full rebuild'] / timings['incremental']:.1f}  "
+                  f"{'✅ same wallet stats as full rebuild' if same else '❌ differs from full rebuild'}")
+        finally:
+            os.chdir(cwd)
+
+
+BENCHMARKS = {
+    'storage': benchmark_storage,
+    'wallet_update': benchmark_wallet_update,
+}
+
+
+if __name__ == "__main__":
+    run_benchmarks(BENCHMARKS, '0xbot storage benchmarks')
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+📥 Chat Export Reader
+Telegram chat eksportų (CSV) skaitymas fiksuoto dydžio gabalais.
+
+Vietoj viso eksporto DataFrame'o (ar kelių, sujungtų pd.concat) skaitomi tik
+date / text stulpeliai po CHUNK_SIZE eilučių, kiekviename gabale pigiu substring
+prefiltru (be regex) atmetamos nereikalingos žinutės, o likusios grąžinamos
+generatoriumi. Atmintis priklauso nuo gabalo dydžio, ne nuo eksporto dydžio.
+
+iter_chat_chunks() grąžina tas pačias žinutes sąrašais po vieną gabalą (eilučių
+intervalą) - tai shard'ai lygiagrečiam parsinimui keliuose procesuose; jų dydis
+parenkamas pagal count_export_rows(), kad kiekvienam procesui tektų keli shard'ai.
+Su start poslinkiu skaitoma tik eksporto pabaiga (papildymas po ankstesnio parsinimo),
+su end - tik baitai iki jo (eilutės, prirašytos jau pradėjus parsinti, lieka kitam kartui).
+"""
+
+import hashlib
+import io
+import operator
+from contextlib import ExitStack
+from functools import reduce
+from typing import Any, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Union
+
+import pandas as pd
+
+CHUNK_SIZE = 20_000
+SIGNATURE_SAMPLE = 64 * 1024
+EXPORT_COLUMNS = ('id', 'date', 'text')
+
+# Prefiltrai: žinutė praleidžiama toliau, jei turi bent vieną žymę
+SIGNAL_MARKERS = (
+    'Token Address:', 'Supply:', 'Initial MC:', 'LP Tokens:',
+    'Top 10 holders:', 'FREEZE:', 'MINT:', 'LP STATUS:'
+)
+GAINS_MARKERS = ('gains 🚀',)
+
+
+class ChatMessage(NamedTuple):
+    """Viena eksporto žinutė"""
+    index: int    # Eilutės numeris per visus failus (kaip pd.concat(..., ignore_index=True))
+    date: Any
+    text: str
+    id: Any = None  # Telegram žinutės id, jei eksporte yra 'id' stulpelis
+
+
+class _LimitedReader(io.RawIOBase):
+    """Binarinis failas, kurio skaitymas baigiasi po limit baitų"""
+
+    def __init__(self, f, limit: int):
+        self._f = f
+        self._left = max(0, limit)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self._f.read(min(len(buffer), self._left))
+        buffer[:len(data)] = data
+        self._left -= len(data)
+        return len(data)
+
+
+def _marker_mask(text: pd.Series, markers: Sequence[str]) -> pd.Series:
+    return reduce(operator.or_, (text.str.contains(marker, regex=False, na=False) for marker in markers))
+
+
+def iter_chat_chunks(paths: Union[str, Iterable[str]], markers: Optional[Sequence[str]] = None,
+                     chunk_size: int = CHUNK_SIZE, start: int = 0,
+                     end: Optional[int] = None) -> Iterator[List[ChatMessage]]:
+    """Prefiltruotos žinutės po vieną chunk_size eilučių gabalą (tušti gabalai praleidžiami).
+
+    start - baitų poslinkis (eilutės pradžia) vieninteliame eksporte: skaitomos tik po jo
+    esančios eilutės, o index skaičiuojamas nuo poslinkio.
+    end - baitų poslinkis, ties kuriuo skaitymas baigiamas (pvz. failo dydis parsinimo pradžioje)."""
+    if isinstance(paths, str):
+        paths = [paths]
+    paths = list(paths)
+    if (start or end is not None) and len(paths) != 1:
+        raise ValueError("start/end offsets need exactly one export")
+
+    offset = 0
+    for path in paths:
+        rows = 0
+        with ExitStack() as stack:
+            source, header = path, {}
+            if start or end is not None:
+                if start:
+                    header = {'header': None, 'names': list(pd.read_csv(path, nrows=0).columns)}
+                source = stack.enter_context(open(path, 'rb'))
+                source.seek(start)
+                if end is not None:
+                    source = io.BufferedReader(_LimitedReader(source, end - start))
+                if not source.peek(1):
+                    continue
+            reader = stack.enter_context(pd.read_csv(source, usecols=lambda column: column in EXPORT_COLUMNS,
+                                                     chunksize=chunk_size, **header))
+            for chunk in reader:
+                rows += len(chunk)
+                if 'text' not in chunk.columns:
+                    raise ValueError(f"{path}: no 'text' column")
+
+                text = chunk['text']
+                if not pd.api.types.is_string_dtype(text):
+                    text = text.astype('string')
+                mask = text.notna()
+                if markers:
+                    mask &= _marker_mask(text, markers)
+                if not mask.any():
+                    continue
+
+                missing = [None] * int(mask.sum())
+                dates = chunk['date'][mask] if 'date' in chunk.columns else missing
+                ids = chunk['id'][mask].tolist() if 'id' in chunk.columns else missing
+                yield [ChatMessage(offset + index, date, message, message_id)
+                       for index, date, message, message_id in zip(chunk.index[mask], dates, text[mask], ids)]
+        offset += rows
+
+
+def export_signature(path: str, size: int) -> Optional[str]:
+    """Pirmųjų size eksporto baitų parašas iš pradžios ir pabaigos imčių (po SIGNATURE_SAMPLE baitų).
+
+    Neperskaitant viso failo patikrina, ar eksportas tik papildytas; None, jei failas
+    trumpesnis arba size nėra eilutės pabaiga."""
+    sample_start = max(0, size - SIGNATURE_SAMPLE)
+    with open(path, 'rb') as f:
+        head = f.read(min(size, SIGNATURE_SAMPLE))
+        f.seek(sample_start)
+        tail = f.read(size - sample_start)
+    if len(tail) != size - sample_start or not tail.endswith(b'\n'):
+        return None
+    return hashlib.sha256(b'%d\x1e%s\x1e%s' % (size, head, tail)).hexdigest()
+
+
+def count_export_rows(paths: Union[str, Iterable[str]]) -> int:
+    """Eilučių skaičius eksportuose (skaitomas tik pirmas stulpelis, gabalais)"""
+    if isinstance(paths, str):
+        paths = [paths]
+    total = 0
+    for path in paths:
+        with pd.read_csv(path, usecols=[0], chunksize=5 * CHUNK_SIZE) as reader:
+            total += sum(len(chunk) for chunk in reader)
+    return total
+
+
+def iter_chat_messages(paths: Union[str, Iterable[str]], markers: Optional[Sequence[str]] = None,
+                       chunk_size: int = CHUNK_SIZE) -> Iterator[ChatMessage]:
+    """Žinutės su tekstu iš vieno ar kelių eksportų (markers - tik turinčios bent vieną žymę)"""
+    for messages in iter_chat_chunks(paths, markers, chunk_size):
+        yield from messages
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    start = time.perf_counter()
+    paths = sys.argv[1:] or ['telegram_chat_0xBot_AI_Agent___Solana_network.csv']
+    signals = sum(1 for _ in iter_chat_messages(paths, SIGNAL_MARKERS))
+    print(f"📥 {signals} signal messages in {time.perf_counter() - start:.2f}s")
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+🧠 Dashboard Resources
+Procesui bendri resursai Streamlit dashboard'ams, išliekantys tarp skripto rerun'ų.
+
+Streamlit po kiekvieno paspaudimo vykdo visą skriptą iš naujo, bet importuoti
+moduliai lieka atmintyje. Čia laikomas ML modelis ir istoriniai DataFrame'ai
+(raktas - duomenų failų mtime: pasikeitus failui resursas perkraunamas), o taip
+pat BlockchainRuntime - background event loop su ilgaamžiu RealBlockchainAnalyzer.
+"""
+
+import atexit
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+from background_loop import BackgroundLoop
+from signal_store import SIGNAL_DATA_FILE, columnar_path, load_signal_data
+
+INSIGHTS_FILE = 'advanced_ml_report.json'
+
+# pavadinimas -> (failų versija, resursas)
+_resources: Dict[str, Tuple[tuple, Any]] = {}
+_lock = threading.RLock()
+_runtime = None
+
+
+def files_version(paths: Sequence[str]) -> tuple:
+    """Failų mtime (ns) rinkinys; nesamas failas -> None"""
+    version = []
+    for path in paths:
+        try:
+            version.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            version.append(None)
+    return tuple(version)
+
+
+def cached_resource(name: str, paths: Sequence[str], factory: Callable[[], Any]) -> Any:
+    """Resursas iš cache, jei failai nepasikeitė; kitaip factory() (vieną kartą visoms sesijoms).
+
+    Jei factory() meta klaidą, niekas neišsaugoma - kitas kvietimas bandys įkelti iš naujo."""
+    version = files_version(paths)
+    with _lock:
+        entry = _resources.get(name)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+        value = factory()
+        _resources[name] = (version, value)
+        return value
+
+
+def clear_resources(name: Optional[str] = None):
+    """Rankinis perkrovimas: kitas get_* vėl įkels resursą"""
+    with _lock:
+        if name is None:
+            _resources.clear()
+        else:
+            _resources.pop(name, None)
+
+
+def resources_info() -> Dict[str, Any]:
+    with _lock:
+        return {name: version for name, (version, _) in _resources.items()}
+
+
+def get_signal_analyzer(data_file: str = SIGNAL_DATA_FILE, insights_file: str = INSIGHTS_FILE):
+    """RealtimeSignalAnalyzer su įkeltu modeliu ir insights (RuntimeError, jei įkelti nepavyko)"""
+    def load():
+        from realtime_signal_analyzer import RealtimeSignalAnalyzer
+        analyzer = RealtimeSignalAnalyzer()
+        analyzer.data_file = data_file
+        if not analyzer.load_model_and_insights():
+            raise RuntimeError("model and insights could not be loaded")
+        return analyzer
+
+    return cached_resource(f"signal_analyzer:{data_file}", [data_file, insights_file], load)
+
+
+def get_history(path: str = SIGNAL_DATA_FILE):
+    """Istoriniai signalai (tipizuoti per signal_store); grąžinama kopija, kad rerun'ai nekeistų cache"""
+    return cached_resource(f"history:{path}", [path, columnar_path(path)], lambda: load_signal_data(path)).copy()
+
+
+class BlockchainRuntime:
+    """Background event loop + ilgaamžis RealBlockchainAnalyzer (viena HTTP sesija, cache'ai tarp analizių)"""
+
+    def __init__(self, analyzer=None):
+        if analyzer is None:
+            from real_blockchain_analyzer import RealBlockchainAnalyzer
+            analyzer = RealBlockchainAnalyzer()
+        self.loop = BackgroundLoop()
+        self.analyzer = analyzer
+        self.loop.run(self.analyzer.__aenter__())
+
+    def run(self, coro, timeout: Optional[float] = None, on_wait=None) -> Any:
+        """Korutina background loop'e; nutraukus laukimą ji atšaukiama"""
+        return self.loop.run(coro, timeout=timeout, on_wait=on_wait)
+
+    def close(self):
+        if not self.loop.running:
+            return
+        try:
+            self.loop.run(self.analyzer.__aexit__(None, None, None), timeout=10)
+        except Exception:
+            pass
+        self.loop.close()
+
+
+def get_blockchain_runtime() -> BlockchainRuntime:
+    """Vienas BlockchainRuntime procesui (uždaromas išeinant)"""
+    global _runtime
+    with _lock:
+        if _runtime is None or not _runtime.loop.running:
+            _runtime = BlockchainRuntime()
+            atexit.register(_runtime.close)
+        return _runtime
+
+
+if __name__ == "__main__":
+    for attempt in ('cold', 'warm'):
+        start = time.perf_counter()
+        analyzer = get_signal_analyzer()
+        history = get_history()
+        print(f"🧠 {attempt}: model + {len(history)} signals in {(time.perf_counter() - start) * 1000:.1f}ms")
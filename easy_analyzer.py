@@ -8,10 +8,12 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from realtime_signal_analyzer import RealtimeSignalAnalyzer
+from scoring_daemon import DaemonUnavailable, call
 
 def quick_analyze():
     """Greita analizė su iš anksto paruoštais signalais"""
+    from realtime_signal_analyzer import RealtimeSignalAnalyzer
+    
     print("🤖 ML-Powered Signal Analyzer")
     print("Loading model...")
     
@@ -79,9 +81,6 @@ def analyze_custom_signal():
     print("\n🔍 Analizuoju...")
     
     try:
-        analyzer = RealtimeSignalAnalyzer()
-        analyzer.load_model_and_insights()
-        
         # Paprastas token address analizė
         if len(signal_text) == 44 and not '\n' in signal_text:
             signal_text = f"""🔍 Viper Vision spotted
@@ -94,8 +93,15 @@ Fees: 5/5
 Top 10 holders: 30%
 Free/Mint: ✅/✅"""
         
-        analysis = analyzer.analyze_signal(signal_text)
-        analyzer.print_analysis(analysis)
+        # Scoring daemon turi modelį atmintyje; jei jis neveikia - užkrauname čia
+        try:
+            call('analyze', signal=signal_text, show=True)
+        except DaemonUnavailable:
+            from realtime_signal_analyzer import RealtimeSignalAnalyzer
+            analyzer = RealtimeSignalAnalyzer()
+            analyzer.load_model_and_insights()
+            analysis = analyzer.analyze_signal(signal_text)
+            analyzer.print_analysis(analysis)
         
     except Exception as e:
         print(f"❌ Klaida: {e}")
@@ -6,7 +6,6 @@ Integrates wallet analysis, deployer intelligence, and deep learning
 
 import pandas as pd
 import numpy as np
-import requests
 import asyncio
 import aiohttp
 from datetime import datetime, timedelta
@@ -15,7 +14,9 @@ import re
 from typing import Dict, List, Optional, Tuple
 import logging
 from dataclasses import dataclass
-from bs4 import BeautifulSoup
+from http_client import acquire_session, release_session
+from rpc_client import SOLANA_RPC_ENDPOINTS, RPCError, SolanaRPCClient
+from spl_token import parse_compact_accounts, parse_json_accounts, token_accounts_params
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -42,20 +43,28 @@ class DeployerIntelligence:
     reputation_score: float
 
 class EnhancedSignalProcessor:
-    def __init__(self):
-        self.solana_rpc = "https://api.mainnet-beta.solana.com"
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None, compact_accounts: bool = True):
+        self.rpc_endpoints = list(SOLANA_RPC_ENDPOINTS)
         self.jupiter_api = "https://quote-api.jup.ag/v6"
-        self.session = None
+        # Injected session is owned by the caller; otherwise borrow the shared pooled one
+        self.session = session
+        self._owns_session = session is None
+        # RPC calls fail over / hedge across all endpoints instead of a single hardcoded one
+        self.rpc = SolanaRPCClient(self.rpc_endpoints, session=session)
+        # base64 + dataSlice (owner + amount only) instead of the full jsonParsed account tree
+        self.compact_accounts = compact_accounts
         
     async def init_session(self):
         """Initialize async HTTP session"""
         if not self.session:
-            self.session = aiohttp.ClientSession()
+            self.session = await acquire_session()
+        self.rpc.session = self.session
     
     async def close_session(self):
         """Close async HTTP session"""
-        if self.session:
-            await self.session.close()
+        if self._owns_session and self.session:
+            await release_session(self.session)
+            self.session = None
     
     async def fetch_wallet_data(self, token_address: str) -> WalletAnalysis:
         """
@@ -136,50 +145,75 @@ class EnhancedSignalProcessor:
     
     async def _get_token_accounts(self, token_address: str) -> List[Dict]:
         """Get all token accounts for a token"""
+        accounts = await self.get_token_accounts_batch([token_address])
+        return accounts[token_address]
+    
+    async def get_token_accounts_batch(self, token_addresses: List[str]) -> Dict[str, List[Dict]]:
+        """
+        Token accounts for many tokens using JSON-RPC batches (one HTTP POST per batch)
+        """
+        await self.init_session()
+        
+        step = 2 if self.compact_accounts else 1
+        requests = []
+        for token_address in token_addresses:
+            requests.append(("getProgramAccounts", token_accounts_params(token_address, self.compact_accounts)))
+            if self.compact_accounts:
+                # Raw u64 amounts need the mint decimals to match jsonParsed uiAmount
+                requests.append(("getTokenSupply", [token_address]))
+        
         try:
-            payload = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "getProgramAccounts",
-                "params": [
-                    "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA",
-                    {
-                        "encoding": "jsonParsed",
-                        "filters": [
-                            {
-                                "dataSize": 165
-                            },
-                            {
-                                "memcmp": {
-                                    "offset": 0,
-                                    "bytes": token_address
-                                }
-                            }
-                        ]
-                    }
-                ]
-            }
-            
-            async with self.session.post(self.solana_rpc, json=payload) as response:
-                data = await response.json()
-                
-                if 'result' in data:
-                    accounts = []
-                    for account in data['result']:
-                        parsed = account['account']['data']['parsed']['info']
-                        if float(parsed['tokenAmount']['uiAmount'] or 0) > 0:
-                            accounts.append({
-                                'owner': parsed['owner'],
-                                'balance': float(parsed['tokenAmount']['uiAmount']),
-                                'address': account['pubkey']
-                            })
-                    
-                    return sorted(accounts, key=lambda x: x['balance'], reverse=True)
-                
+            results = await self.rpc.call_batch(requests)
         except Exception as e:
             logger.error(f"Error getting token accounts: {e}")
-        
-        return []
+            return {token_address: [] for token_address in token_addresses}
+        
+        accounts = {}
+        unresolved = []
+        for i, token_address in enumerate(token_addresses):
+            try:
+                result = results[i * step]
+                if isinstance(result, RPCError):
+                    raise result
+                if self.compact_accounts:
+                    supply = results[i * step + 1]
+                    decimals = None if isinstance(supply, RPCError) or not supply else supply['value'].get('decimals')
+                    if decimals is None:
+                        # Raw u64 amounts are not balances; jsonParsed carries uiAmount itself
+                        logger.warning(f"Decimals unknown for {token_address}, refetching as jsonParsed")
+                        unresolved.append(token_address)
+                        continue
+                    accounts[token_address] = parse_compact_accounts(result, decimals)
+                else:
+                    accounts[token_address] = parse_json_accounts(result or [])
+            except Exception as e:
+                logger.error(f"Error getting token accounts: {e}")
+                accounts[token_address] = []
+        
+        if unresolved:
+            accounts.update(await self._get_parsed_token_accounts(unresolved))
+        return {token_address: accounts[token_address] for token_address in token_addresses}
+    
+    async def _get_parsed_token_accounts(self, token_addresses: List[str]) -> Dict[str, List[Dict]]:
+        """jsonParsed token accounts (uiAmount from the node) for mints whose decimals are unknown"""
+        requests = [("getProgramAccounts", token_accounts_params(token_address, compact=False))
+                    for token_address in token_addresses]
+        try:
+            results = await self.rpc.call_batch(requests)
+        except Exception as e:
+            logger.error(f"Error getting token accounts: {e}")
+            return {token_address: [] for token_address in token_addresses}
+        
+        accounts = {}
+        for token_address, result in zip(token_addresses, results):
+            try:
+                if isinstance(result, RPCError):
+                    raise result
+                accounts[token_address] = parse_json_accounts(result or [])
+            except Exception as e:
+                logger.error(f"Error getting token accounts: {e}")
+                accounts[token_address] = []
+        return accounts
     
     async def _analyze_holders(self, token_accounts: List[Dict]) -> Dict:
         """Analyze holder distribution"""
@@ -9,12 +9,6 @@ import numpy as np
 import re
 from datetime import datetime
 import json
-import matplotlib.pyplot as plt
-import seaborn as sns
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.model_selection import train_test_split
-from sklearn.metrics import accuracy_score, classification_report
-from sklearn.preprocessing import StandardScaler
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -22,7 +16,7 @@ class EnhancedTelegramAnalyzer:
     def __init__(self):
         self.df = None
         self.ml_model = None
-        self.scaler = StandardScaler()
+        self.scaler = None  # Created when training (sklearn is imported lazily)
         self.feature_columns = []
         
     def load_data(self):
@@ -169,6 +163,10 @@ class EnhancedTelegramAnalyzer:
         if not hasattr(self, 'features_df') or self.features_df is None:
             print("❌ No features extracted")
             return
+        from sklearn.ensemble import RandomForestClassifier
+        from sklearn.metrics import accuracy_score
+        from sklearn.model_selection import train_test_split
+        from sklearn.preprocessing import StandardScaler
         
         print("\n🤖 TRAINING ML MODEL...")
         
@@ -201,6 +199,7 @@ class EnhancedTelegramAnalyzer:
         )
         
         # Scale features
+        self.scaler = StandardScaler()
         X_train_scaled = self.scaler.fit_transform(X_train)
         X_test_scaled = self.scaler.transform(X_test)
         
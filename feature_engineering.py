@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+🧮 Vectorized Feature Engineering
+Bendras signalų feature pipeline ML analizatoriams (be eval() ir eilutinių .apply).
+
+wallet_percentages sąrašai parsinami vieną kartą: string -> explode -> skaičiai,
+o max / mean / count skaičiuojami groupby; market cap sufiksai (K/M/B) -
+vektorizuotomis string operacijomis. Tipizuoti duomenys iš signal_store
+(skaitiniai MC, list tipo wallet_percentages) naudojami be parsinimo.
+
+Vienam signalui (realtime scoring) tie patys feature'ai skaičiuojami grynu
+Python per signal_feature_values() - be DataFrame kūrimo.
+"""
+
+import math
+import re
+
+import numpy as np
+import pandas as pd
+
+MC_MULTIPLIERS = {'K': 1e3, 'M': 1e6, 'B': 1e9}
+
+STRATEGY_CODES = {
+    'Viper Vision': 1,
+    'Cobra Scan': 2,
+    'Eagle Eye': 3,
+    'Phoenix Sight': 4,
+    'Pheonix Sight': 4,  # Same as Phoenix
+    'Hydra Hunt': 5,
+    'Dragon Detector': 6,
+    'Wolf Watch': 7,
+    'Tiger Trace': 8,
+    'Tiger Trace 2': 8,
+    'Scorpion Sweep': 9
+}
+
+# Stulpeliai, kuriuos skaito engineer_signal_features (projekcijai skaitant duomenis)
+FEATURE_SOURCE_COLUMNS = [
+    'date', 'initial_mc', 'call_mc', 'wallet_percentages',
+    'freeze_disabled', 'mint_disabled', 'lp_burned', 'strategy'
+]
+
+
+def parse_mc_values(values: pd.Series) -> pd.Series:
+    """'$71.75K' / '1.2M' / '72000' -> float (neparsinamos reikšmės -> 0)"""
+    if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+        return values.astype('float64').fillna(0.0)
+    text = values.astype('string').str.upper().str.replace(r'[$,\s]', '', regex=True)
+    multiplier = text.str[-1].map(MC_MULTIPLIERS).astype('float64').fillna(1.0)
+    number = pd.to_numeric(text.str.rstrip('KMB'), errors='coerce').astype('float64')
+    return (number * multiplier).fillna(0.0)
+
+
+_MC_STRIP = re.compile(r'[$,\s]')
+
+
+def _to_number(text: str) -> float:
+    """pd.to_numeric(errors='coerce') vienai reikšmei (neparsinama -> NaN)"""
+    if '_' in text:
+        return math.nan
+    try:
+        return float(text)
+    except ValueError:
+        return math.nan
+
+
+def _is_missing(value) -> bool:
+    return value is None or (pd.api.types.is_scalar(value) and not isinstance(value, str) and bool(pd.isna(value)))
+
+
+def parse_mc_value(mc_str) -> float:
+    """Vienos market cap reikšmės variantas (ta pati logika kaip parse_mc_values)"""
+    if _is_missing(mc_str):
+        return 0.0
+    text = _MC_STRIP.sub('', str(mc_str).upper())
+    if not text:
+        return 0.0
+    value = _to_number(text.rstrip('KMB')) * MC_MULTIPLIERS.get(text[-1], 1.0)
+    return 0.0 if math.isnan(value) else value
+
+
+def parse_wallet_percentages(value) -> list:
+    """'[3.5, 2.1]' / list / NumPy masyvas -> [3.5, 2.1] (neparsinami elementai praleidžiami)"""
+    if _is_missing(value):
+        return []
+    if pd.api.types.is_list_like(value):
+        items = [str(item) for item in value]
+    else:
+        items = str(value).strip().strip('[]').split(',')
+    numbers = [_to_number(item.strip()) for item in items]
+    return [number for number in numbers if not math.isnan(number)]
+
+
+def wallet_percentage_stats(values: pd.Series) -> pd.DataFrame:
+    """max / avg / count iš '[3.5, 2.1, ...]' sąrašų (arba list / NumPy masyvų)"""
+    positions = pd.RangeIndex(len(values))
+    if hasattr(values, 'list'):
+        # Arrow list<double> iš signal_store: plokščias buferis be Python objektų
+        lengths = values.list.len().fillna(0).to_numpy(dtype='int64')
+        flat = values.list.flatten().to_numpy(dtype='float64', na_value=np.nan)
+        numbers = pd.Series(flat, index=np.repeat(positions, lengths))
+    else:
+        column = pd.Series(values.to_numpy(), index=positions, dtype=object)
+        is_list = column.map(pd.api.types.is_list_like).astype(bool)
+        text = column[~is_list].astype('string')
+        items = text.str.strip().str.strip('[]').str.split(',').explode().str.strip()
+        if is_list.any():
+            items = pd.concat([items.astype(object), column[is_list].explode()])
+        numbers = pd.to_numeric(items, errors='coerce').astype('float64')
+    grouped = numbers.groupby(level=0)
+
+    stats = pd.DataFrame({
+        'max_wallet_percent': grouped.max(),
+        'avg_wallet_percent': grouped.mean(),
+        'wallet_count': grouped.count(),
+    }).reindex(positions).fillna(0)
+    stats['wallet_count'] = stats['wallet_count'].astype(int)
+    stats.index = values.index
+    return stats
+
+
+def wallet_percentage_values(value) -> tuple:
+    """(max, avg, count) vienam wallet_percentages sąrašui"""
+    numbers = parse_wallet_percentages(value)
+    if not numbers:
+        return 0.0, 0.0, 0
+    return max(numbers), math.fsum(numbers) / len(numbers), len(numbers)
+
+
+def signal_feature_values(record: dict) -> dict:
+    """engineer_signal_features() + fillna(0) vienam signalo dict'ui (date - datetime)"""
+    max_wallet, avg_wallet, wallet_count = wallet_percentage_values(record.get('wallet_percentages'))
+    date = record['date']
+    features = {
+        'initial_mc_value': parse_mc_value(record.get('initial_mc')),
+        'call_mc_value': parse_mc_value(record.get('call_mc')),
+        'max_wallet_percent': max_wallet,
+        'avg_wallet_percent': avg_wallet,
+        'wallet_count': wallet_count,
+        'hour': date.hour,
+        'day_of_week': date.weekday(),
+        'month': date.month,
+        'freeze_disabled_int': int(record['freeze_disabled']),
+        'mint_disabled_int': int(record['mint_disabled']),
+        'lp_burned_int': int(record['lp_burned']),
+        'strategy_encoded': STRATEGY_CODES.get(record.get('strategy'), 0),
+    }
+    # Neapdoroti stulpeliai (top_holders_percent, initial_lp_sol, ...) - kaip yra
+    for column, value in record.items():
+        if column not in features:
+            features[column] = value
+    return features
+
+
+def engineer_signal_features(df: pd.DataFrame) -> pd.DataFrame:
+    """Prideda ML feature stulpelius prie signalų DataFrame (date turi būti datetime)"""
+    df['initial_mc_value'] = parse_mc_values(df['initial_mc'])
+    df['call_mc_value'] = parse_mc_values(df['call_mc'])
+
+    # Wallet concentration metrics
+    wallet_stats = wallet_percentage_stats(df['wallet_percentages'])
+    for column in wallet_stats.columns:
+        df[column] = wallet_stats[column]
+
+    # Time-based features
+    df['hour'] = df['date'].dt.hour
+    df['day_of_week'] = df['date'].dt.dayofweek
+    df['month'] = df['date'].dt.month
+
+    # Binary features
+    df['freeze_disabled_int'] = df['freeze_disabled'].astype(int)
+    df['mint_disabled_int'] = df['mint_disabled'].astype(int)
+    df['lp_burned_int'] = df['lp_burned'].astype(int)
+
+    # Strategy encoding
+    df['strategy_encoded'] = df['strategy'].map(STRATEGY_CODES).fillna(0)
+
+    return df
+
+
+if __name__ == "__main__":
+    import time
+    from signal_store import load_signal_data
+
+    history = load_signal_data(columns=FEATURE_SOURCE_COLUMNS)
+
+    start = time.perf_counter()
+    features = engineer_signal_features(history.copy())
+    print(f"✅ Features for {len(features)} signals in {time.perf_counter() - start:.3f}s")
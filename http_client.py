@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+🌐 Shared HTTP Client
+Vienas aiohttp.ClientSession visam procesui (vienam event loop): keep-alive
+connection pool, per-host jungčių limitas ir DNS cache.
+
+Klasės (RealBlockchainAnalyzer, WalletIntelligenceSystem, EnhancedSignalProcessor)
+gauna sesiją per konstruktorių arba pasiskolina bendrą per acquire_session();
+sesija uždaroma, kai ją atiduoda paskutinis naudotojas (release_session).
+"""
+
+import asyncio
+from typing import Dict, Optional
+
+import aiohttp
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (compatible; 0xBot/1.0)',
+    'Accept': 'application/json'
+}
+DEFAULT_TIMEOUT = 30
+
+CONNECTION_LIMIT = 100          # Visos atviros jungtys
+CONNECTION_LIMIT_PER_HOST = 10  # Vienam API hostui
+KEEPALIVE_TIMEOUT = 60          # Kiek laiko laikyti laisvą jungtį pool'e (s)
+DNS_CACHE_TTL = 300             # DNS atsakymų cache (s)
+
+# event loop -> [session, naudotojų skaičius]
+_shared_sessions: Dict[asyncio.AbstractEventLoop, list] = {}
+
+
+def create_session(timeout: float = DEFAULT_TIMEOUT, headers: Optional[Dict] = None) -> aiohttp.ClientSession:
+    """Nauja sesija su pooled connector (kviečiant savininkas turi ją uždaryti)"""
+    connector = aiohttp.TCPConnector(
+        limit=CONNECTION_LIMIT,
+        limit_per_host=CONNECTION_LIMIT_PER_HOST,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+        ttl_dns_cache=DNS_CACHE_TTL,
+        use_dns_cache=True
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=timeout),
+        headers=headers or DEFAULT_HEADERS
+    )
+
+
+async def acquire_session() -> aiohttp.ClientSession:
+    """Bendra šio event loop sesija (sukuriama pirmo naudotojo)"""
+    loop = asyncio.get_running_loop()
+    entry = _shared_sessions.get(loop)
+    if entry is None or entry[0].closed:
+        entry = _shared_sessions[loop] = [create_session(), 0]
+    entry[1] += 1
+    return entry[0]
+
+
+async def release_session(session: aiohttp.ClientSession):
+    """Atiduoda bendrą sesiją; paskutinis naudotojas ją uždaro"""
+    loop = asyncio.get_running_loop()
+    entry = _shared_sessions.get(loop)
+    if entry is None or entry[0] is not session:
+        return
+    entry[1] -= 1
+    if entry[1] <= 0:
+        del _shared_sessions[loop]
+        await session.close()
+
+
+class SharedSession:
+    """async with SharedSession() as session: ... - bendros sesijos paskolinimas"""
+
+    async def __aenter__(self) -> aiohttp.ClientSession:
+        self.session = await acquire_session()
+        return self.session
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await release_session(self.session)
+
+
+class InflightRequests:
+    """Vienu metu vykdomų vienodų užklausų sujungimas: vienas fetch, daug laukiančių"""
+
+    def __init__(self):
+        self._tasks: Dict[str, asyncio.Future] = {}
+        self.coalesced = 0
+
+    async def run(self, key: str, factory):
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._tasks[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        else:
+            self.coalesced += 1
+        # shield: vieno laukiančiojo atšaukimas (stage deadline) nenutraukia fetch kitiems
+        return await asyncio.shield(task)
+
+    def _finish(self, key: str, task: asyncio.Future):
+        self._tasks.pop(key, None)
+        if not task.cancelled():
+            task.exception()  # Pažymima kaip perskaityta, jei visi laukiantieji atšaukti
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+💾 Model Artifact Store
+Saugo apmokytus ML modelius diske, kad procesai nebeapmokytų jų kiekvieno starto metu.
+
+Artefaktas (modelis, scaler, feature stulpeliai, duomenų ir kodo fingerprint)
+perkraunamas tik tada, kai pasikeičia šaltinio CSV failo turinys, feature kodas
+(feature_engineering / signal_store ir paties analizatoriaus failas), laukiamas
+feature stulpelių sąrašas arba ARTIFACT_VERSION.
+"""
+
+import hashlib
+import os
+import pickle
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+# Padidinti, kai pasikeičia feature engineering ar artefakto struktūra
+ARTIFACT_VERSION = 2
+DEFAULT_MODEL_DIR = 'models'
+
+# Modulių, nuo kurių priklauso feature'ai, failai (jų turinys įeina į code_fingerprint)
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+FEATURE_CODE_FILES = [
+    os.path.join(_MODULE_DIR, 'feature_engineering.py'),
+    os.path.join(_MODULE_DIR, 'signal_store.py'),
+]
+
+
+def file_fingerprint(path: str, chunk_size: int = 1 << 20) -> str:
+    """SHA-256 hash nuo failo turinio"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def code_fingerprint(paths: List[str]) -> str:
+    """SHA-256 nuo kelių šaltinio failų turinio (nesamas failas įeina kaip tuščias)"""
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(os.path.basename(path).encode() + b'\0')
+        try:
+            digest.update(file_fingerprint(path).encode())
+        except OSError:
+            pass
+    return digest.hexdigest()
+
+
+class ModelArtifactStore:
+    """Versijuotas modelio artefaktas diske
+
+    code_files - papildomi failai (pvz. analizatoriaus __file__ su feature stulpelių sąrašu),
+    kurių pakeitimas, kaip ir FEATURE_CODE_FILES, reiškia perapmokymą.
+    """
+
+    def __init__(self, name: str, model_dir: str = DEFAULT_MODEL_DIR, code_files: Optional[List[str]] = None):
+        self.name = name
+        self.model_dir = model_dir
+        self.path = os.path.join(model_dir, f"{name}.v{ARTIFACT_VERSION}.pkl")
+        self.code_files = FEATURE_CODE_FILES + [os.path.abspath(path) for path in code_files or []]
+
+    def load(self, data_path: str, feature_columns: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+        """Grąžina artefaktą, jei jis atitinka dabartinius duomenis (ir feature_columns, jei duoti), kitaip None"""
+        if not os.path.exists(self.path):
+            return None
+
+        try:
+            with open(self.path, 'rb') as f:
+                artifact = pickle.load(f)
+        except Exception as e:
+            print(f"⚠️ Could not read model artifact {self.path}: {e}")
+            return None
+
+        if artifact.get('version') != ARTIFACT_VERSION:
+            return None
+
+        if artifact.get('code_fingerprint') != code_fingerprint(self.code_files):
+            print(f"🔄 Feature code changed since last training - retraining {self.name}")
+            return None
+
+        if feature_columns is not None and artifact.get('feature_columns') != list(feature_columns):
+            print(f"🔄 Feature columns changed since last training - retraining {self.name}")
+            return None
+
+        try:
+            fingerprint = file_fingerprint(data_path)
+        except OSError:
+            return None
+
+        if artifact.get('data_fingerprint') != fingerprint:
+            print(f"🔄 {data_path} changed since last training - retraining {self.name}")
+            return None
+
+        return artifact
+
+    def save(self, data_path: str, model: Any, scaler: Any, feature_columns: List[str], **extra) -> str:
+        """Išsaugo artefaktą atomiškai (tmp failas + rename)"""
+        os.makedirs(self.model_dir, exist_ok=True)
+
+        artifact = {
+            'version': ARTIFACT_VERSION,
+            'name': self.name,
+            'created_at': datetime.now().isoformat(),
+            'data_file': data_path,
+            'data_fingerprint': file_fingerprint(data_path),
+            'code_fingerprint': code_fingerprint(self.code_files),
+            'model': model,
+            'scaler': scaler,
+            'feature_columns': list(feature_columns),
+        }
+        artifact.update(extra)
+
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(artifact, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self.path)
+
+        print(f"💾 Model artifact saved to {self.path}")
+        return self.path
+
+    def clear(self):
+        """Ištrina artefaktą (priverstinis perapmokymas)"""
+        if os.path.exists(self.path):
+            os.remove(self.path)
@@ -8,23 +8,23 @@ import sys
 import json
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-from telegram_analyzer import TelegramCoinAnalyzer
-import pandas as pd
+from scoring_daemon import DaemonUnavailable, call
 
-def quick_analyze_signal(signal_text, coin_name=None):
-    """Greitai analizuoja signalą ir grąžina rezultatus"""
-    
-    analyzer = TelegramCoinAnalyzer()
-    
-    # Užkrauname istorinius duomenis
+HISTORICAL_FEATURES_FILE = '/workspaces/0xbot/coin_features_analysis.csv'
+
+def load_historical_features():
+    """Istoriniai coin'ų feature'ai palyginimui (None, jei failo nėra)"""
+    import pandas as pd
     try:
-        features_df = pd.read_csv('/workspaces/0xbot/coin_features_analysis.csv')
+        features_df = pd.read_csv(HISTORICAL_FEATURES_FILE)
         print(f"✅ Istoriniai duomenys: {len(features_df)} coin'ų")
     except Exception as e:
         print(f"⚠️ Nepavyko užkrauti istorinių duomenų: {e}")
         features_df = None
-    
-    # Analizuojame
+    return features_df
+
+def analyze_with_history(analyzer, features_df, signal_text, coin_name=None):
+    """Signalo analizė su jau paruoštu analizatoriumi ir istoriniais duomenimis"""
     signal_analysis = analyzer.analyze_single_signal(signal_text, coin_name)
     
     if features_df is not None:
@@ -32,6 +32,24 @@ def quick_analyze_signal(signal_text, coin_name=None):
     
     return signal_analysis
 
+def quick_analyze_signal(signal_text, coin_name=None):
+    """Greitai analizuoja signalą ir grąžina rezultatus"""
+    
+    # Veikiantis scoring daemon jau turi analizatorių ir istorinius duomenis atmintyje
+    try:
+        return call('quick', signal=signal_text, coin_name=coin_name)
+    except DaemonUnavailable:
+        pass
+    
+    from telegram_analyzer import TelegramCoinAnalyzer
+    analyzer = TelegramCoinAnalyzer()
+    
+    # Užkrauname istorinius duomenis
+    features_df = load_historical_features()
+    
+    # Analizuojame
+    return analyze_with_history(analyzer, features_df, signal_text, coin_name)
+
 def print_quick_summary(analysis):
     """Spausdina greitą suvestinę"""
     
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+🚦 Async Token Bucket Rate Limiter
+Bendras API užklausų ribotuvas: vienas bucket kiekvienam API hostui vienam event loop.
+
+Bucket talpa (burst) leidžia iš karto paleisti kelias užklausas lygiagrečiai,
+o vėliau žetonai pildomi pastoviu `rate` greičiu (užklausos per sekundę).
+host_limiter(url) grąžina tą patį bucket visiems šio loop objektams
+(RealBlockchainAnalyzer, WalletIntelligenceSystem), todėl kelių vienu metu
+analizuojamų signalų užklausos kartu neviršija API limito.
+"""
+
+import asyncio
+import time
+import weakref
+from typing import Dict, Tuple
+from urllib.parse import urlsplit
+
+# API hostas -> (užklausos/s, burst); kitiems hostams - DEFAULT_HOST_LIMIT
+HOST_LIMITS: Dict[str, Tuple[float, float]] = {
+    'public-api.solscan.io': (5.0, 10),
+    'api.dexscreener.com': (5.0, 10),
+}
+DEFAULT_HOST_LIMIT = (5.0, 10)
+
+# event loop -> {hostas: TokenBucket} (asyncio.Lock pririštas prie loop)
+_host_buckets = weakref.WeakKeyDictionary()
+
+
+class TokenBucket:
+    """Token bucket: `rate` užklausų/s, iki `capacity` užklausų iš karto"""
+
+    def __init__(self, rate: float, capacity: float = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, tokens: float = 1.0):
+        """Laukia, kol atsiras žetonų (FIFO - laukiantieji eina eilės tvarka)"""
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            self._refill()
+            while self.tokens < tokens:
+                await asyncio.sleep((tokens - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= tokens
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+def host_limiter(url: str) -> TokenBucket:
+    """Bendras šio event loop TokenBucket URL hostui (sukuriamas pirmo naudotojo)"""
+    host = urlsplit(url).netloc
+    buckets = _host_buckets.setdefault(asyncio.get_running_loop(), {})
+    bucket = buckets.get(host)
+    if bucket is None:
+        bucket = buckets[host] = TokenBucket(*HOST_LIMITS.get(host, DEFAULT_HOST_LIMIT))
+    return bucket
+
+
+if __name__ == "__main__":
+    async def _demo():
+        bucket = TokenBucket(rate=4, capacity=2)
+        start = time.monotonic()
+
+        async def request(i):
+            await bucket.acquire()
+            print(f"🚦 request {i} at {time.monotonic() - start:.2f}s")
+
+        await asyncio.gather(*(request(i) for i in range(6)))
+
+    asyncio.run(_demo())
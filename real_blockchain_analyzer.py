@@ -6,22 +6,34 @@ Naudoja tikrus API duomenis wallet intelligence ir deployer analizei
 import aiohttp
 import asyncio
 import json
-import re
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 import time
-from wallet_intelligence_system import WalletIntelligenceSystem
+from http_client import InflightRequests, acquire_session, release_session
+from rate_limiter import host_limiter
+from response_cache import ResponseCache, default_response_cache
+from rpc_client import SOLANA_RPC_ENDPOINTS
+from signal_parser import parse_signal
+from wallet_intelligence_system import TOP_HOLDERS_ANALYZED, WalletIntelligenceSystem
 
 class RealBlockchainAnalyzer:
-    def __init__(self):
-        self.session = None
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None,
+                 response_cache: Optional[ResponseCache] = None,
+                 stage_timeout: float = 10.0, fallback_timeout: float = 5.0):
+        # Perduota sesija priklauso kviečiančiajam; kitaip skolinamasi bendra (http_client)
+        self.session = session
+        self._owns_session = session is None
+        self.intel = None
+        self.response_cache = response_cache or default_response_cache()
+        self.inflight = InflightRequests()
+        self.rate_limiter = None  # None -> bendras per hostą (tas pats, kurį naudoja WalletIntelligenceSystem)
+        
+        # Deadline kiekvienam analizės etapui: lėtas API -> fallback, o ne 30-45s client timeout
+        self.stage_timeout = stage_timeout
+        self.fallback_timeout = fallback_timeout
         
         # Solana RPC endpoints (galima pridėti savo API key)
-        self.rpc_endpoints = [
-            "https://api.mainnet-beta.solana.com",
-            "https://solana-api.projectserum.com",
-            "https://rpc.ankr.com/solana"
-        ]
+        self.rpc_endpoints = list(SOLANA_RPC_ENDPOINTS)
         
         # Solscan API (nemokama versija)
         self.solscan_api = "https://public-api.solscan.io"
@@ -30,69 +42,53 @@ class RealBlockchainAnalyzer:
         self.dexscreener_api = "https://api.dexscreener.com/latest"
         
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=30),
-            headers={'User-Agent': 'Mozilla/5.0 (compatible; 0xBot/1.0)'}
-        )
+        if self._owns_session:
+            self.session = await acquire_session()
+        # Vienas intelligence objektas visiems signalams: ta pati sesija, rate limit ir cache
+        self.intel = WalletIntelligenceSystem(session=self.session, response_cache=self.response_cache)
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
+        if self._owns_session and self.session:
+            await release_session(self.session)
+            self.session = None
+
+    async def _get_json(self, url: str, params: Dict = None) -> Optional[Dict]:
+        """GET per persistentinį response cache (None, jei ne 200)"""
+        cached = await self.response_cache.aget(url, params)
+        if cached is not None:
+            return cached
+        return await self.inflight.run(self.response_cache.make_key(url, params),
+                                       lambda: self._fetch_json(url, params))
+
+    async def _fetch_json(self, url: str, params: Dict = None) -> Optional[Dict]:
+        await (self.rate_limiter or host_limiter(url)).acquire()
+        async with self.session.get(url, params=params) as response:
+            if response.status == 200:
+                data = await response.json()
+                await self.response_cache.aput(url, params, data)
+                return data
+        return None
 
     def parse_signal_improved(self, signal_text: str) -> Dict[str, Any]:
         """Pagerintas signal parsing su tiksliais duomenimis"""
         try:
-            # Token name extraction
-            token_name_match = re.search(r'🏖\s*([^|]+?)\s*\|', signal_text)
-            token_name = token_name_match.group(1).strip() if token_name_match else ""
-            
-            # Token address
-            address_match = re.search(r'🛒 Token Address:\s*([A-Za-z0-9]{32,})', signal_text)
-            token_address = address_match.group(1).strip() if address_match else ""
-            
-            # Market cap parsing
-            mc_match = re.search(r'📊 Initial MC:\s*\$([0-9,.]+[KMB]?)', signal_text)
-            initial_mc = mc_match.group(1) if mc_match else "0"
-            
-            # LP SOL amount
-            lp_match = re.search(r'💎 Initial LP:\s*([0-9,.]+)\s*SOL', signal_text)
-            initial_lp_sol = float(lp_match.group(1)) if lp_match else 0
-            
-            # Top 10 holders percentage - TIKSLUS PARSING
-            holders_match = re.search(r'💼 Top 10 holders:.*?([0-9,.]+)%', signal_text)
-            top_holders_percent = float(holders_match.group(1)) if holders_match else 0
-            
-            # Individual holder percentages
-            holder_percentages = re.findall(r'([0-9,.]+)%\s*\(https://solscan\.io/address/([A-Za-z0-9]+)\)', signal_text)
-            
-            # Strategy
-            strategy_match = re.search(r'💡 Strategy:\s*(.+?)(?:\n|$)', signal_text)
-            strategy = strategy_match.group(1).strip() if strategy_match else "Unknown"
-            
-            # Security features
-            freeze_disabled = "❄️ FREEZE: ✅ Disabled" in signal_text
-            mint_disabled = "💼 MINT: ✅ Disabled" in signal_text
-            lp_burned = "🔥 LP STATUS: ✅ Burned" in signal_text
-            
-            # Deployer address
-            deployer_match = re.search(r'🛠️ Deployer \(https://solscan\.io/account/([A-Za-z0-9]+)\)', signal_text)
-            deployer_address = deployer_match.group(1) if deployer_match else ""
+            signal = parse_signal(signal_text)
             
             return {
-                "token_name": token_name,
-                "token_address": token_address,
-                "strategy": strategy,
+                "token_name": signal.token_name,
+                "token_address": signal.token_address,
+                "strategy": signal.strategy or "Unknown",
                 "timestamp": datetime.now().isoformat(),
-                "initial_mc": initial_mc,
-                "initial_lp_sol": initial_lp_sol,
-                "top_holders_percent": top_holders_percent,  # TIKRAS SKAIČIUS!
-                "individual_holders": holder_percentages,
-                "deployer_address": deployer_address,
+                "initial_mc": signal.initial_mc or "0",
+                "initial_lp_sol": signal.initial_lp_sol or 0,
+                "top_holders_percent": signal.top_holders_percent or 0,  # TIKRAS SKAIČIUS!
+                "individual_holders": list(signal.holders),
+                "deployer_address": signal.deployer_address,
                 "security_features": {
-                    "freeze_disabled": freeze_disabled,
-                    "mint_disabled": mint_disabled,
-                    "lp_burned": lp_burned
+                    "freeze_disabled": bool(signal.freeze_disabled),
+                    "mint_disabled": bool(signal.mint_disabled),
+                    "lp_burned": bool(signal.lp_burned)
                 }
             }
             
@@ -111,46 +107,48 @@ class RealBlockchainAnalyzer:
                 'offset': 0
             }
             
-            async with self.session.get(url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    
-                    holders_data = data.get('data', [])
-                    total_holders = len(holders_data)
-                    
-                    # Analyze holder distribution
-                    whale_holders = []
-                    suspicious_patterns = []
-                    
-                    for holder in holders_data[:10]:  # Top 10
-                        percentage = float(holder.get('amount', 0)) / 1e9 * 100  # Convert to percentage
-                        address = holder.get('address', '')
-                        
-                        whale_holders.append({
-                            'address': address,
-                            'percentage': percentage,
-                            'amount': holder.get('amount', 0)
-                        })
-                        
-                        # Check for suspicious patterns
-                        if percentage > 5.0:  # Whale threshold
-                            suspicious_patterns.append(f"Large holder: {percentage:.2f}%")
-                    
-                    # Calculate concentration risk
-                    top_10_concentration = sum(h['percentage'] for h in whale_holders)
+            data = await self._get_json(url, params)
+            if data is not None:
+                holders_data = data.get('data', [])
+                total_holders = len(holders_data)
+                
+                # Analyze holder distribution
+                whale_holders = []
+                suspicious_patterns = []
+                
+                for holder in holders_data[:10]:  # Top 10
+                    percentage = float(holder.get('amount', 0)) / 1e9 * 100  # Convert to percentage
+                    address = holder.get('address', '')
                     
-                    return {
-                        "total_holders": total_holders,
-                        "top_10_concentration": top_10_concentration,
-                        "whale_holders": whale_holders,
-                        "suspicious_patterns": suspicious_patterns,
-                        "distribution_score": self._calculate_distribution_score(whale_holders)
-                    }
+                    whale_holders.append({
+                        'address': address,
+                        'percentage': percentage,
+                        'amount': holder.get('amount', 0)
+                    })
                     
+                    # Check for suspicious patterns
+                    if percentage > 5.0:  # Whale threshold
+                        suspicious_patterns.append(f"Large holder: {percentage:.2f}%")
+                
+                # Calculate concentration risk
+                top_10_concentration = sum(h['percentage'] for h in whale_holders)
+                
+                return {
+                    "total_holders": total_holders,
+                    "top_10_concentration": top_10_concentration,
+                    "whale_holders": whale_holders,
+                    "suspicious_patterns": suspicious_patterns,
+                    "distribution_score": self._calculate_distribution_score(whale_holders)
+                }
+                
         except Exception as e:
             print(f"❌ Holders analysis error: {e}")
             
         # Fallback to parsed data if API fails
+        return self._holders_analysis_fallback()
+
+    def _holders_analysis_fallback(self) -> Dict[str, Any]:
+        """Neutralus holder rezultatas, kai API nepasiekiamas"""
         return {
             "total_holders": "API_UNAVAILABLE",
             "top_10_concentration": 0,
@@ -169,43 +167,45 @@ class RealBlockchainAnalyzer:
                 'limit': 100
             }
             
-            async with self.session.get(url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    
-                    transactions = data.get('data', [])
-                    
-                    # Analyze deployer patterns
-                    deployed_tokens = []
-                    recent_activity = []
-                    
-                    for tx in transactions:
-                        if 'token' in str(tx).lower() or 'create' in str(tx).lower():
-                            deployed_tokens.append(tx)
-                            
-                        # Check recent activity (last 30 days)
-                        tx_time = tx.get('blockTime', 0)
-                        if tx_time > (time.time() - 30 * 24 * 3600):  # 30 days
-                            recent_activity.append(tx)
-                    
-                    # Calculate reputation score
-                    reputation_score = self._calculate_deployer_reputation(
-                        len(deployed_tokens), 
-                        len(recent_activity), 
-                        len(transactions)
-                    )
-                    
-                    return {
-                        "reputation_score": reputation_score,
-                        "total_transactions": len(transactions),
-                        "deployed_tokens_count": len(deployed_tokens),
-                        "recent_activity_30d": len(recent_activity),
-                        "risk_level": "LOW" if reputation_score > 7 else "MEDIUM" if reputation_score > 4 else "HIGH"
-                    }
-                    
+            data = await self._get_json(url, params)
+            if data is not None:
+                transactions = data.get('data', [])
+                
+                # Analyze deployer patterns
+                deployed_tokens = []
+                recent_activity = []
+                
+                for tx in transactions:
+                    if 'token' in str(tx).lower() or 'create' in str(tx).lower():
+                        deployed_tokens.append(tx)
+                        
+                    # Check recent activity (last 30 days)
+                    tx_time = tx.get('blockTime', 0)
+                    if tx_time > (time.time() - 30 * 24 * 3600):  # 30 days
+                        recent_activity.append(tx)
+                
+                # Calculate reputation score
+                reputation_score = self._calculate_deployer_reputation(
+                    len(deployed_tokens), 
+                    len(recent_activity), 
+                    len(transactions)
+                )
+                
+                return {
+                    "reputation_score": reputation_score,
+                    "total_transactions": len(transactions),
+                    "deployed_tokens_count": len(deployed_tokens),
+                    "recent_activity_30d": len(recent_activity),
+                    "risk_level": "LOW" if reputation_score > 7 else "MEDIUM" if reputation_score > 4 else "HIGH"
+                }
+                
         except Exception as e:
             print(f"❌ Deployer analysis error: {e}")
             
+        return self._deployer_reputation_fallback()
+
+    def _deployer_reputation_fallback(self) -> Dict[str, Any]:
+        """Neutralus deployer rezultatas, kai API nepasiekiamas"""
         return {
             "reputation_score": 5,  # Neutral
             "total_transactions": "API_UNAVAILABLE",
@@ -572,6 +572,20 @@ class RealBlockchainAnalyzer:
             "success_probability": success_prob
         }
 
+    async def _run_stage(self, stage: str, primary, fallback, default: Dict[str, Any]) -> Dict[str, Any]:
+        """Etapas su deadline: lėtas / klaidingas API -> fallback (su savo deadline) -> default"""
+        attempts = [(primary, self.stage_timeout), (fallback, self.fallback_timeout)]
+        for attempt, timeout in attempts:
+            if attempt is None:
+                continue
+            try:
+                return await asyncio.wait_for(attempt(), timeout=timeout)
+            except asyncio.TimeoutError:
+                print(f"⏱️ {stage} exceeded {timeout:g}s deadline")
+            except Exception as e:
+                print(f"❌ {stage} error: {e}")
+        return default
+
     async def analyze_signal_complete(self, signal_text: str) -> Dict[str, Any]:
         """Pilna signal analizė su tikrais duomenimis"""
         
@@ -592,39 +606,49 @@ class RealBlockchainAnalyzer:
         print(f"👤 Deployer: {deployer_address}")
         print(f"🐋 Top holders: {len(holder_addresses)}")
         
-        # 2. Get REAL wallet intelligence data
-        wallet_analysis = {}
-        deployer_analysis = {}
+        # 2. Get REAL wallet intelligence data (deployer ir holders lygiagrečiai)
+        intel = self.intel or WalletIntelligenceSystem(session=self.session, response_cache=self.response_cache)
         
-        try:
-            async with WalletIntelligenceSystem() as intel:
-                # Deep deployer analysis
-                if deployer_address:
-                    print("� Running deep deployer analysis...")
-                    deployer_analysis = await intel.analyze_deployer_deep(deployer_address)
-                
-                # Top holders intelligence
-                if holder_addresses:
-                    print("🐋 Running top holders intelligence...")
-                    holders_intel = await intel.analyze_top_holders_intelligence(holder_addresses)
-                    
-                    # Format for compatibility
-                    wallet_analysis = {
-                        "total_holders": holders_intel.get('holders_analyzed', 'API_UNAVAILABLE'),
-                        "top_10_concentration": signal_data.get('top_holders_percent', 0),
-                        "whale_intelligence": holders_intel.get('whale_intelligence', {}),
-                        "holder_analyses": holders_intel.get('individual_analyses', []),
-                        "risk_signals": holders_intel.get('risk_signals', []),
-                        "confidence_score": holders_intel.get('confidence_score', 0.5)
-                    }
-                else:
-                    wallet_analysis = await self.get_token_holders_analysis(token_address)
+        async def deployer_stage():
+            print("🔍 Running deep deployer analysis...")
+            return await intel.analyze_deployer_deep(deployer_address)
         
-        except Exception as e:
-            print(f"❌ Intelligence analysis error: {e}")
-            # Fallback to basic analysis
-            wallet_analysis = await self.get_token_holders_analysis(token_address)
-            deployer_analysis = await self.get_deployer_reputation(deployer_address) if deployer_address else {}
+        async def holders_stage():
+            print("🐋 Running top holders intelligence...")
+            holders_intel = await intel.analyze_top_holders_intelligence(holder_addresses)
+            
+            # Format for compatibility
+            return {
+                "total_holders": holders_intel.get('holders_analyzed', 'API_UNAVAILABLE'),
+                "top_10_concentration": signal_data.get('top_holders_percent', 0),
+                "whale_intelligence": holders_intel.get('whale_intelligence', {}),
+                "holder_analyses": holders_intel.get('individual_analyses', []),
+                "risk_signals": holders_intel.get('risk_signals', []),
+                "confidence_score": holders_intel.get('confidence_score', 0.5)
+            }
+        
+        if deployer_address:
+            deployer_task = self._run_stage(
+                "Deployer intelligence", deployer_stage,
+                lambda: self.get_deployer_reputation(deployer_address),
+                self._deployer_reputation_fallback()
+            )
+        else:
+            deployer_task = asyncio.sleep(0, result={})
+        
+        if holder_addresses:
+            holders_task = self._run_stage(
+                "Holder intelligence", holders_stage,
+                lambda: self.get_token_holders_analysis(token_address),
+                self._holders_analysis_fallback()
+            )
+        else:
+            holders_task = self._run_stage(
+                "Holder analysis", lambda: self.get_token_holders_analysis(token_address),
+                None, self._holders_analysis_fallback()
+            )
+        
+        deployer_analysis, wallet_analysis = await asyncio.gather(deployer_task, holders_task)
         
         # 3. Calculate ENHANCED risk score using real data
         risk_assessment = self.calculate_enhanced_risk_score(signal_data, wallet_analysis, deployer_analysis)
@@ -651,6 +675,57 @@ class RealBlockchainAnalyzer:
         }
 
 
+    def _prefetch_addresses(self, signals: List[Dict[str, Any]]) -> Tuple[List[List[asyncio.Future]], List[asyncio.Future]]:
+        """Unikalūs deployer / holder adresai visame batch'e -> po vieną užduotį kiekvienam.
+        Grąžina (kiekvieno signalo laukiamos užduotys, visos užduotys)."""
+        fetches = {}
+        
+        def fetch(key, factory):
+            if key not in fetches:
+                fetches[key] = asyncio.ensure_future(factory())
+            return fetches[key]
+        
+        per_signal = []
+        for signal in signals:
+            waits = []
+            deployer = signal.get('deployer_address')
+            if deployer and deployer not in self.intel.deployer_cache:
+                waits.append(fetch(('deployer', deployer), lambda d=deployer: self.intel.analyze_deployer_deep(d)))
+            for _, holder in signal.get('individual_holders', [])[:TOP_HOLDERS_ANALYZED]:
+                if holder not in self.intel.wallet_cache:
+                    waits.append(fetch(('holder', holder), lambda h=holder: self.intel.analyze_holder_cached(h)))
+            per_signal.append(waits)
+        return per_signal, list(fetches.values())
+
+    async def analyze_signals_batch(self, signal_texts: List[str],
+                                    max_concurrent_signals: int = 4) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        """Daug signalų iš karto: (indeksas, analyze_signal_complete rezultatas) pagal užbaigimo tvarką.
+        Pirma surenkami visų signalų unikalūs deployer / holder adresai ir kiekvienas
+        analizuojamas vieną kartą; signalo analizė po to skaito deployer/wallet cache."""
+        if self.intel is None:
+            self.intel = WalletIntelligenceSystem(session=self.session, response_cache=self.response_cache)
+        
+        per_signal, fetches = self._prefetch_addresses([self.parse_signal_improved(text) for text in signal_texts])
+        
+        # Riboja, kiek signalų vienu metu laukia rate limiterio, kad neišsektų stage deadline
+        slots = asyncio.Semaphore(max_concurrent_signals)
+        
+        async def analyze(index: int, text: str):
+            async with slots:
+                if per_signal[index]:
+                    # Nespėję adresai neblokuoja: analyze_signal_complete taiko savo deadline ir fallback
+                    await asyncio.wait(per_signal[index], timeout=self.stage_timeout)
+                return index, await self.analyze_signal_complete(text)
+        
+        tasks = [asyncio.ensure_future(analyze(i, text)) for i, text in enumerate(signal_texts)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks + fetches:
+                task.cancel()
+
+
 # Test funkcija
 async def test_real_analyzer():
     signal = """🤖 0xBot AI Agent | Solana Network (https://t.me/ai_agent_solana_0xbot) 
@@ -6,21 +6,30 @@ Processes new Telegram signals and provides ML-based success predictions
 
 import pandas as pd
 import numpy as np
-import re
 import json
 from datetime import datetime
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.preprocessing import StandardScaler
+from model_store import ModelArtifactStore
+from signal_parser import parse_signal
+from feature_engineering import FEATURE_SOURCE_COLUMNS, engineer_signal_features, parse_mc_value, signal_feature_values
+from signal_store import load_signal_data
 import warnings
 warnings.filterwarnings('ignore')
 
+# Model input columns, in order (a persisted artifact with a different list is retrained)
+FEATURE_COLUMNS = ['initial_mc_value', 'top_holders_percent', 'initial_lp_sol',
+                   'hour', 'day_of_week', 'strategy_encoded', 'freeze_disabled_int',
+                   'mint_disabled_int', 'lp_burned_int', 'max_wallet_percent',
+                   'avg_wallet_percent', 'wallet_count', 'month', 'call_mc_value']
+
 class RealtimeSignalAnalyzer:
     def __init__(self):
         self.ml_model = None
-        self.scaler = StandardScaler()
+        self.scaler = None  # sklearn is imported only when (re)training
         self.feature_columns = []
         self.insights = {}
         self.trained = False
+        self.data_file = 'parsed_telegram_data.csv'
+        self.model_store = ModelArtifactStore('realtime_signal_analyzer', code_files=[__file__])
         
     def load_model_and_insights(self):
         """Load pre-trained model and insights"""
@@ -30,9 +39,20 @@ class RealtimeSignalAnalyzer:
                 report = json.load(f)
                 self.insights = report['insights']
             
-            # Retrain the model using saved data
-            df = pd.read_csv('parsed_telegram_data.csv')
-            df['date'] = pd.to_datetime(df['date'])
+            # Reuse persisted model if the training data has not changed
+            artifact = self.model_store.load(self.data_file, FEATURE_COLUMNS)
+            if artifact:
+                self.ml_model = artifact['model']
+                self.scaler = artifact['scaler']
+                self.feature_columns = artifact['feature_columns']
+                self.trained = True
+                print(f"✅ Model and insights loaded from {self.model_store.path}")
+                return True
+            
+            # Retrain the model using saved data (typed columns, only what training reads)
+            df = load_signal_data(self.data_file, columns=FEATURE_SOURCE_COLUMNS + [
+                'top_holders_percent', 'initial_lp_sol', 'max_gain'
+            ])
             
             # Filter complete signals
             complete_signals = df[
@@ -44,19 +64,20 @@ class RealtimeSignalAnalyzer:
             complete_signals = self._engineer_features(complete_signals)
             
             # Prepare features for ML
-            feature_cols = ['initial_mc_value', 'top_holders_percent', 'initial_lp_sol', 
-                          'hour', 'day_of_week', 'strategy_encoded', 'freeze_disabled_int',
-                          'mint_disabled_int', 'lp_burned_int', 'max_wallet_percent',
-                          'avg_wallet_percent', 'wallet_count', 'month', 'call_mc_value']
+            feature_cols = list(FEATURE_COLUMNS)
             
             X = complete_signals[feature_cols].fillna(0)
             y = (complete_signals['max_gain'] >= 5).astype(int)
             
             # Train model
+            from sklearn.ensemble import RandomForestClassifier
+            from sklearn.preprocessing import StandardScaler
             self.ml_model = RandomForestClassifier(n_estimators=100, random_state=42)
+            self.scaler = StandardScaler()
             self.ml_model.fit(X, y)
             self.feature_columns = feature_cols
             self.trained = True
+            self.model_store.save(self.data_file, self.ml_model, self.scaler, self.feature_columns)
             
             print("✅ Model and insights loaded successfully")
             return True
@@ -67,63 +88,11 @@ class RealtimeSignalAnalyzer:
     
     def _engineer_features(self, df):
         """Engineer features for the dataframe"""
-        # Parse market cap values
-        df['initial_mc_value'] = df['initial_mc'].apply(self._parse_mc_value)
-        df['call_mc_value'] = df['call_mc'].apply(self._parse_mc_value)
-        
-        # Calculate wallet concentration metrics
-        df['max_wallet_percent'] = df['wallet_percentages'].apply(
-            lambda x: max(eval(x)) if isinstance(x, str) and x != '[]' else 0
-        )
-        df['avg_wallet_percent'] = df['wallet_percentages'].apply(
-            lambda x: np.mean(eval(x)) if isinstance(x, str) and x != '[]' else 0
-        )
-        df['wallet_count'] = df['wallet_percentages'].apply(
-            lambda x: len(eval(x)) if isinstance(x, str) and x != '[]' else 0
-        )
-        
-        # Time-based features
-        df['hour'] = df['date'].dt.hour
-        df['day_of_week'] = df['date'].dt.dayofweek
-        df['month'] = df['date'].dt.month
-        
-        # Binary features
-        df['freeze_disabled_int'] = df['freeze_disabled'].astype(int)
-        df['mint_disabled_int'] = df['mint_disabled'].astype(int)
-        df['lp_burned_int'] = df['lp_burned'].astype(int)
-        
-        # Strategy encoding
-        df['strategy_encoded'] = df['strategy'].map({
-            'Viper Vision': 1, 'Cobra Scan': 2, 'Eagle Eye': 3,
-            'Phoenix Sight': 4, 'Pheonix Sight': 4, 'Hydra Hunt': 5,
-            'Dragon Detector': 6, 'Wolf Watch': 7, 'Tiger Trace': 8,
-            'Tiger Trace 2': 8, 'Scorpion Sweep': 9
-        }).fillna(0)
-        
-        return df
+        return engineer_signal_features(df)
     
     def _parse_mc_value(self, mc_str):
         """Parse market cap string to numeric value"""
-        if pd.isna(mc_str) or mc_str == '':
-            return 0
-        
-        mc_str = str(mc_str).upper().replace('$', '').replace(',', '')
-        
-        if 'K' in mc_str:
-            try:
-                return float(mc_str.replace('K', '')) * 1000
-            except:
-                return 0
-        elif 'M' in mc_str:
-            try:
-                return float(mc_str.replace('M', '')) * 1000000
-            except:
-                return 0
-        else:
-            try:
-                return float(mc_str)
-            except:
-                return 0
+        return parse_mc_value(mc_str)
     
     def parse_signal_message(self, message):
         """Parse a new signal message and extract features"""
@@ -143,56 +112,43 @@ class RealtimeSignalAnalyzer:
         }
         
         try:
-            # Extract token name
-            token_match = re.search(r'\$([A-Z]+)', message)
-            if token_match:
-                signal_data['token_name'] = token_match.group(1)
-            
-            # Extract token address
-            address_match = re.search(r'([1-9A-HJ-NP-Za-km-z]{32,44})', message)
-            if address_match:
-                signal_data['token_address'] = address_match.group(1)
-            
-            # Extract strategy
-            strategies = ['Viper Vision', 'Cobra Scan', 'Eagle Eye', 'Phoenix Sight', 
-                         'Hydra Hunt', 'Dragon Detector', 'Wolf Watch', 'Tiger Trace', 'Scorpion Sweep']
-            for strategy in strategies:
-                if strategy.lower() in message.lower():
-                    signal_data['strategy'] = strategy
-                    break
+            signal = parse_signal(message)
             
-            # Extract market cap
-            mc_patterns = [
-                r'MC:\s*\$?([0-9.]+[KM]?)',
-                r'Market Cap:\s*\$?([0-9.]+[KM]?)',
-                r'Initial MC:\s*\$?([0-9.]+[KM]?)'
-            ]
-            for pattern in mc_patterns:
-                mc_match = re.search(pattern, message, re.IGNORECASE)
-                if mc_match:
-                    signal_data['initial_mc'] = mc_match.group(1)
-                    break
+            signal_data['token_name'] = signal.token_symbol.lstrip('$')
+            signal_data['token_address'] = signal.token_address
+            signal_data['strategy'] = signal.strategy
+            signal_data['initial_mc'] = signal.mc
+            signal_data['call_mc'] = signal.call_mc
+            signal_data['initial_lp_sol'] = signal.initial_lp_sol or 0
+            signal_data['top_holders_percent'] = signal.top_holders_percent or 0
             
-            # Extract LP
-            lp_match = re.search(r'LP:\s*([0-9.]+)', message)
-            if lp_match:
-                signal_data['initial_lp_sol'] = float(lp_match.group(1))
-            
-            # Extract top holders
-            holders_match = re.search(r'Top ([0-9]+) holders:\s*([0-9.]+)%', message)
-            if holders_match:
-                signal_data['top_holders_percent'] = float(holders_match.group(2))
-            
-            # Extract security features
-            signal_data['freeze_disabled'] = 'freeze disabled' in message.lower()
-            signal_data['mint_disabled'] = 'mint disabled' in message.lower()
-            signal_data['lp_burned'] = 'lp burned' in message.lower() or 'burned' in message.lower()
+            # Security features
+            signal_data['freeze_disabled'] = bool(signal.freeze_disabled)
+            signal_data['mint_disabled'] = bool(signal.mint_disabled)
+            signal_data['lp_burned'] = bool(signal.lp_burned)
             
         except Exception as e:
             print(f"⚠️ Error parsing message: {e}")
         
         return signal_data
     
+    def _feature_matrix(self, signals):
+        """Preallocated C-contiguous float32 feature rows straight from the parsed records.
+        
+        float32 is the forest's own input dtype, so predict_proba validates it without a copy."""
+        X = np.empty((len(signals), len(self.feature_columns)), dtype=np.float32)
+        for row, signal_data in zip(X, signals):
+            features = signal_feature_values(signal_data)
+            row[:] = [features[column] for column in self.feature_columns]
+        X[np.isnan(X)] = 0.0  # fillna(0)
+        return X
+    
+    def _score(self, X):
+        """Success probabilities and predicted classes from a single predict_proba call"""
+        proba = self.ml_model.predict_proba(X)
+        predictions = self.ml_model.classes_.take(np.argmax(proba, axis=1))
+        return proba[:, 1], predictions
+    
     def analyze_signal(self, message):
         """Analyze a new signal and provide ML prediction"""
         if not self.trained:
@@ -202,17 +158,30 @@ class RealtimeSignalAnalyzer:
         # Parse the signal
         signal_data = self.parse_signal_message(message)
         
-        # Convert to DataFrame for processing
-        df = pd.DataFrame([signal_data])
-        df = self._engineer_features(df)
+        # Get ML prediction
+        success_probs, predictions = self._score(self._feature_matrix([signal_data]))
+        
+        return self._build_analysis(signal_data, success_probs[0], predictions[0])
+    
+    def analyze_signals(self, messages):
+        """Analyze a batch of signals with one forest call for all of them"""
+        if not self.trained:
+            print("❌ Model not loaded. Please run load_model_and_insights() first.")
+            return None
         
-        # Prepare features for prediction
-        X = df[self.feature_columns].fillna(0)
+        signals = [self.parse_signal_message(message) for message in messages]
+        if not signals:
+            return []
         
-        # Get ML prediction
-        success_prob = self.ml_model.predict_proba(X)[0][1]
-        success_prediction = self.ml_model.predict(X)[0]
+        success_probs, predictions = self._score(self._feature_matrix(signals))
         
+        return [
+            self._build_analysis(signal_data, success_prob, prediction)
+            for signal_data, success_prob, prediction in zip(signals, success_probs, predictions)
+        ]
+    
+    def _build_analysis(self, signal_data, success_prob, success_prediction):
+        """Assemble the analysis dict for one scored signal"""
         # Get strategy-based insights
         strategy_success_rate = self.insights.get('best_strategies', {}).get(signal_data['strategy'], 0.27)
         
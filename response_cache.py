@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+🗄️ Persistent HTTP Response Cache
+SQLite kešas Solscan / DexScreener JSON atsakymams, išliekantis tarp procesų.
+
+Raktas - URL + surikiuoti params; TTL parenkamas pagal endpoint (holder / deployer
+transakcijos keičiasi lėčiau nei DexScreener pair kainos). Kai viršijamas
+max_bytes, pirmiausia išmetami seniausiai naudoti įrašai (LRU). Bendras dydis laikomas
+cache_meta eilutėje, kurią trigeriai atnaujina toje pačioje rašymo transakcijoje, todėl
+riba galioja ir keliems procesams, o put() nebeskaičiuoja SUM(size) per visą lentelę.
+get() LRU laiką įrašo ne kiekvieno hit metu, o paketais (su kitu put() arba kas TOUCH_BATCH).
+Async kodas naudoja aget() / aput() - SQLite darbas vyksta atskiroje gijoje, ne event loop'e.
+
+DB failas atidaromas tik pirmo naudojimo metu; numatytasis - repo kataloge
+(arba OXBOT_DATA_DIR), nepriklausomai nuo darbinio katalogo.
+"""
+
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
+
+DATA_DIR = os.environ.get('OXBOT_DATA_DIR', os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CACHE_FILE = os.path.join(DATA_DIR, 'http_response_cache.db')
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+TOUCH_BATCH = 64  # Tiek hit'ų LRU laikų kaupiama atmintyje prieš vieną UPDATE transakciją
+
+# URL fragmentas -> TTL sekundėmis (pirmas atitikmuo laimi)
+ENDPOINT_TTLS = {
+    '/account/transactions': 15 * 60,  # Holder / deployer transakcijų istorija
+    '/token/holders': 5 * 60,          # Token holder sąrašas
+    '/dex/tokens/': 60,                # DexScreener pair kainos / likvidumas
+}
+DEFAULT_TTL = 60
+
+_default_cache = None
+_default_lock = threading.Lock()
+
+
+class ResponseCache:
+    """Persistentinis JSON atsakymų kešas su TTL pagal endpoint ir dydžio riba"""
+
+    def __init__(self, db_file: str = DEFAULT_CACHE_FILE, max_bytes: int = DEFAULT_MAX_BYTES,
+                 ttls: Optional[Dict[str, float]] = None):
+        self.db_file = db_file
+        self.max_bytes = max_bytes
+        self.ttls = ENDPOINT_TTLS if ttls is None else ttls
+        self._lock = threading.Lock()
+        # Viena gija visoms async užklausoms: event loop neblokuojamas, jungtis viena
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='response-cache')
+        self._conn = None  # Atidaroma _connection() pirmo naudojimo metu
+        self._touched: Dict[str, float] = {}  # cache_key -> dar neįrašytas accessed_at
+
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.evictions = 0
+        self.bytes_saved = 0
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict] = None) -> str:
+        return f"{url}?{json.dumps(params or {}, sort_keys=True, default=str)}"
+
+    def ttl_for(self, url: str) -> float:
+        for fragment, ttl in self.ttls.items():
+            if fragment in url:
+                return ttl
+        return DEFAULT_TTL
+
+    def _connection(self) -> sqlite3.Connection:
+        """Atidaro DB ir paruošia schemą pirmo kvietimo metu (kviečiama su self._lock)"""
+        if self._conn is not None:
+            return self._conn
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_file)), exist_ok=True)
+        conn = sqlite3.connect(self.db_file, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        # Schema vienoje transakcijoje: kitas procesas nemato lentelės be trigerių / total_bytes
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS responses (
+                    cache_key TEXT PRIMARY KEY,
+                    body TEXT,
+                    size INTEGER,
+                    expires_at REAL,
+                    accessed_at REAL
+                )
+            ''')
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses(accessed_at)")
+            conn.execute("CREATE TABLE IF NOT EXISTS cache_meta (name TEXT PRIMARY KEY, value INTEGER)")
+            # Senesnis failas be cache_meta: suma suskaičiuojama vieną kartą
+            conn.execute("INSERT OR IGNORE INTO cache_meta "
+                         "SELECT 'total_bytes', COALESCE(SUM(size), 0) FROM responses")
+            # executescript() nenaudojamas - jis užbaigtų BEGIN IMMEDIATE transakciją
+            for event, delta in (('INSERT', 'NEW.size'), ('UPDATE OF size', 'NEW.size - OLD.size'),
+                                 ('DELETE', '-OLD.size')):
+                conn.execute(f"""
+                    CREATE TRIGGER IF NOT EXISTS responses_size_{event.split()[0].lower()}
+                    AFTER {event} ON responses BEGIN
+                        UPDATE cache_meta SET value = value + {delta} WHERE name = 'total_bytes';
+                    END
+                """)
+            conn.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            conn.close()
+            raise
+        self._conn = conn
+        return conn
+
+    def get(self, url: str, params: Optional[Dict] = None) -> Optional[Any]:
+        """Išsaugotas JSON atsakymas arba None (nėra / pasibaigė TTL)"""
+        key = self.make_key(url, params)
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT body, size, expires_at FROM responses WHERE cache_key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            body, size, expires_at = row
+            if expires_at <= now:
+                conn.execute("DELETE FROM responses WHERE cache_key = ?", (key,))
+                self._touched.pop(key, None)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            # LRU laikas kaupiamas atmintyje: hit'ai nerašo į DB ir nelaukia writer lock
+            self._touched[key] = now
+            if len(self._touched) >= TOUCH_BATCH:
+                self._write(self._flush_touches)
+            self.hits += 1
+            self.bytes_saved += size
+        return json.loads(body)
+
+    def put(self, url: str, params: Optional[Dict], data: Any):
+        """Išsaugo JSON atsakymą; viršijus max_bytes išmeta LRU įrašus"""
+        ttl = self.ttl_for(url)
+        if ttl <= 0 or self.max_bytes <= 0:
+            return
+        key = self.make_key(url, params)
+        body = json.dumps(data, separators=(',', ':'))
+        size = len(body.encode('utf-8'))
+        if size > self.max_bytes:
+            return
+        now = time.time()
+
+        def insert(conn):
+            # Sukaupti LRU laikai įrašomi prieš išmetimą, kad ką tik naudoti įrašai liktų
+            self._flush_touches(conn)
+            # UPSERT (ne INSERT OR REPLACE), kad total_bytes atnaujintų UPDATE trigeris
+            conn.execute(
+                "INSERT INTO responses VALUES (?, ?, ?, ?, ?) ON CONFLICT(cache_key) DO UPDATE SET "
+                "body = excluded.body, size = excluded.size, "
+                "expires_at = excluded.expires_at, accessed_at = excluded.accessed_at",
+                (key, body, size, now + ttl, now)
+            )
+            total_bytes = self._total_bytes(conn)
+            if total_bytes > self.max_bytes:
+                self._evict(conn, total_bytes)
+
+        with self._lock:
+            self._write(insert)
+
+    def _write(self, fn):
+        """fn(conn) vienoje BEGIN IMMEDIATE transakcijoje (kiti procesai tuo metu nerašo)"""
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            fn(conn)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _flush_touches(self, conn: sqlite3.Connection):
+        """Įrašo sukauptus hit'ų accessed_at (kviečiama transakcijoje)"""
+        if self._touched:
+            conn.executemany("UPDATE responses SET accessed_at = MAX(accessed_at, ?) WHERE cache_key = ?",
+                             [(accessed_at, key) for key, accessed_at in self._touched.items()])
+            self._touched.clear()
+
+    async def aget(self, url: str, params: Optional[Dict] = None) -> Optional[Any]:
+        """get() kešo gijoje - async kodui"""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, self.get, url, params)
+
+    async def aput(self, url: str, params: Optional[Dict], data: Any):
+        """put() kešo gijoje - async kodui"""
+        await asyncio.get_running_loop().run_in_executor(self._executor, self.put, url, params, data)
+
+    @staticmethod
+    def _total_bytes(conn: sqlite3.Connection) -> int:
+        return conn.execute("SELECT value FROM cache_meta WHERE name = 'total_bytes'").fetchone()[0]
+
+    def _evict(self, conn: sqlite3.Connection, total_bytes: int):
+        """Išmeta seniausiai naudotus įrašus, kol telpama į max_bytes (kviečiama transakcijoje)"""
+        # Kursorius per accessed_at indeksą: skaitoma tik tiek eilučių, kiek išmetama
+        evicted = []
+        for key, size in conn.execute("SELECT cache_key, size FROM responses ORDER BY accessed_at"):
+            if total_bytes <= self.max_bytes:
+                break
+            evicted.append((key,))
+            total_bytes -= size
+        conn.executemany("DELETE FROM responses WHERE cache_key = ?", evicted)
+        self.evictions += len(evicted)
+
+    def clear(self):
+        with self._lock:
+            self._touched.clear()
+            self._connection().execute("DELETE FROM responses")
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            if self._conn is None:
+                return
+            if self._touched:
+                self._write(self._flush_touches)
+            self._conn.close()
+            self._conn = None
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        with self._lock:
+            conn = self._connection()
+            entries = conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            total_bytes = self._total_bytes(conn)
+        return {
+            'entries': entries,
+            'total_bytes': total_bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'expirations': self.expirations,
+            'evictions': self.evictions,
+            'bytes_saved': self.bytes_saved
+        }
+
+    def report(self):
+        stats = self.stats()
+        print(f"🗄️ HTTP cache: {stats['hit_rate'] * 100:.1f}% hit rate "
+              f"({stats['hits']} hits / {stats['misses']} misses), "
+              f"{stats['bytes_saved'] / 1024:.1f} KB saved, "
+              f"{stats['entries']} entries / {stats['total_bytes'] / 1024:.1f} KB on disk")
+
+
+def default_response_cache() -> ResponseCache:
+    """Bendras procesui kešas (DEFAULT_CACHE_FILE; failas atidaromas pirmo get/put metu)"""
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = ResponseCache()
+        return _default_cache
+
+
+if __name__ == "__main__":
+    cache = default_response_cache()
+    cache.report()
+    print(f"📁 {cache.db_file}")
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+🛰️ Solana RPC Client - failover + hedged requests
+Keli RPC endpoint'ai vertinami pagal stebėtą latency ir klaidų dažnį.
+
+Užklausa siunčiama greičiausiam sveikam endpoint'ui; jei jis neatsako per
+p95 latency, paleidžiamas dublikatas (hedge) į kitą endpoint'ą ir naudojamas
+pirmas atsakymas. Nepavykus - bandoma kitas endpoint'as su exponential backoff.
+"""
+
+import asyncio
+import itertools
+import json
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import aiohttp
+
+from http_client import acquire_session, release_session
+
+SOLANA_RPC_ENDPOINTS = [
+    "https://api.mainnet-beta.solana.com",
+    "https://solana-api.projectserum.com",
+    "https://rpc.ankr.com/solana"
+]
+
+EWMA_ALPHA = 0.3          # Naujausių matavimų svoris
+ERROR_PENALTY = 4.0       # Kiek kartų klaidos dažnis padidina score
+FAILURE_COOLDOWN = 30.0   # Tiek sekundžių endpoint'as po klaidų eina į eilės galą
+
+
+class RPCError(Exception):
+    """RPC klaida (visi endpoint'ai nepavyko arba JSON-RPC grąžino error)"""
+
+
+@dataclass
+class EndpointHealth:
+    """Vieno RPC endpoint'o stebėti rodikliai"""
+    url: str
+    latency: float = 0.0          # EWMA sekundėmis (0 = dar nematuota)
+    error_rate: float = 0.0       # EWMA 0..1
+    requests: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    last_failure: float = 0.0
+
+    def record_success(self, elapsed: float):
+        self.requests += 1
+        self.consecutive_failures = 0
+        self.latency = elapsed if not self.latency else EWMA_ALPHA * elapsed + (1 - EWMA_ALPHA) * self.latency
+        self.error_rate *= (1 - EWMA_ALPHA)
+
+    def record_failure(self):
+        self.requests += 1
+        self.failures += 1
+        self.consecutive_failures += 1
+        self.last_failure = time.monotonic()
+        self.error_rate = EWMA_ALPHA + (1 - EWMA_ALPHA) * self.error_rate
+
+    @property
+    def cooling_down(self) -> bool:
+        return self.consecutive_failures > 0 and time.monotonic() - self.last_failure < FAILURE_COOLDOWN
+
+    @property
+    def score(self) -> float:
+        """Mažesnis = geresnis; nematuoti endpoint'ai bandomi pirmi"""
+        return self.latency * (1 + ERROR_PENALTY * self.error_rate)
+
+
+@dataclass
+class RPCStats:
+    calls: int = 0
+    batched_calls: int = 0
+    bytes_received: int = 0
+    retries: int = 0
+    hedges: int = 0
+    hedge_wins: int = 0
+    latencies: deque = field(default_factory=lambda: deque(maxlen=200))
+
+
+class SolanaRPCClient:
+    """JSON-RPC klientas su endpoint health scoring, failover ir hedging"""
+
+    def __init__(self, endpoints: Optional[List[str]] = None,
+                 session: Optional[aiohttp.ClientSession] = None,
+                 timeout: float = 10.0, max_attempts: int = 3, backoff: float = 0.2,
+                 hedge: bool = True, min_hedge_delay: float = 0.05, max_batch_size: int = 100):
+        self.endpoints = [EndpointHealth(url) for url in (endpoints or SOLANA_RPC_ENDPOINTS)]
+        self.session = session
+        self._owns_session = session is None
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.hedge = hedge and len(self.endpoints) > 1
+        self.min_hedge_delay = min_hedge_delay
+        self.max_batch_size = max_batch_size
+        self.stats = RPCStats()
+        self._ids = itertools.count(1)
+
+    async def __aenter__(self):
+        if self.session is None:
+            self.session = await acquire_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self._owns_session and self.session:
+            await release_session(self.session)
+            self.session = None
+
+    def ranked_endpoints(self) -> List[EndpointHealth]:
+        """Sveiki endpoint'ai pagal score, cooldown'e esantys - gale"""
+        return sorted(self.endpoints, key=lambda e: (e.cooling_down, e.score))
+
+    def hedge_delay(self) -> float:
+        """p95 stebėtas latency - po tiek laiko siunčiamas dublikatas"""
+        latencies = sorted(self.stats.latencies)
+        if len(latencies) < 5:
+            return max(self.min_hedge_delay, self.timeout.total / 4)
+        return max(self.min_hedge_delay, latencies[int(len(latencies) * 0.95) - 1])
+
+    def _request(self, method: str, params: Optional[list]) -> Dict:
+        return {"jsonrpc": "2.0", "id": next(self._ids), "method": method, "params": params or []}
+
+    async def call(self, method: str, params: Optional[list] = None) -> Any:
+        """JSON-RPC kvietimas; grąžina 'result' arba kelia RPCError"""
+        self.stats.calls += 1
+        payload = self._request(method, params)
+        data = await self._send(payload)
+        if 'error' in data:
+            raise RPCError(f"{method}: {data['error']}")
+        return data.get('result')
+
+    async def call_batch(self, requests: List[Tuple[str, list]]) -> List[Union[Any, RPCError]]:
+        """JSON-RPC batch: keli kvietimai viename HTTP POST (po max_batch_size).
+        Rezultatai grąžinami ta pačia tvarka; nepavykę elementai - RPCError objektai."""
+        results = []
+        for start in range(0, len(requests), self.max_batch_size):
+            batch = [self._request(method, params) for method, params in requests[start:start + self.max_batch_size]]
+            self.stats.calls += 1
+            self.stats.batched_calls += len(batch)
+            data = await self._send(batch)
+            if not isinstance(data, list):
+                raise RPCError(f"batch rejected: {data.get('error', data)}")
+
+            responses = {item.get('id'): item for item in data}
+            for payload in batch:
+                item = responses.get(payload['id'])
+                if item is None:
+                    results.append(RPCError(f"{payload['method']}: missing from batch response"))
+                elif 'error' in item:
+                    results.append(RPCError(f"{payload['method']}: {item['error']}"))
+                else:
+                    results.append(item.get('result'))
+        return results
+
+    async def _send(self, payload: Union[Dict, List[Dict]]) -> Any:
+        """POST su failover: nepavykus bandomas kitas endpoint'as su exponential backoff"""
+        last_error = None
+        for attempt in range(self.max_attempts):
+            # Nepavykę endpoint'ai nukrenta į eilės galą, todėl retry eina į kitą
+            ranked = self.ranked_endpoints()
+            primary = ranked[0]
+            backup = ranked[1] if self.hedge else None
+            try:
+                return await self._hedged(payload, primary, backup)
+            except Exception as e:
+                last_error = e
+                if attempt + 1 < self.max_attempts:
+                    self.stats.retries += 1
+                    await asyncio.sleep(self.backoff * (2 ** attempt))
+
+        method = payload['method'] if isinstance(payload, dict) else f"batch of {len(payload)}"
+        raise RPCError(f"{method} failed on all endpoints: {last_error}")
+
+    async def _hedged(self, payload, primary: EndpointHealth, backup: Optional[EndpointHealth]) -> Any:
+        """Primary užklausa; jei ji vėluoja ilgiau nei p95 - dublikatas į backup"""
+        tasks = {asyncio.ensure_future(self._post(primary, payload)): primary}
+        try:
+            if backup is None:
+                return await next(iter(tasks))
+
+            done, _ = await asyncio.wait(tasks, timeout=self.hedge_delay())
+            if not done:
+                self.stats.hedges += 1
+                tasks[asyncio.ensure_future(self._post(backup, payload))] = backup
+
+            last_error = None
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if tasks[task] is not primary:
+                            self.stats.hedge_wins += 1
+                        return task.result()
+                    last_error = task.exception()
+            raise last_error
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    task.exception()  # Pažymima kaip perskaityta
+
+    async def _post(self, endpoint: EndpointHealth, payload) -> Any:
+        """Vienas HTTP POST; grąžina iškoduotą JSON (vienas atsakymas arba batch sąrašas)"""
+        start = time.perf_counter()
+        try:
+            async with self.session.post(endpoint.url, json=payload, timeout=self.timeout) as response:
+                response.raise_for_status()
+                body = await response.read()
+            data = json.loads(body)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            endpoint.record_failure()
+            raise
+        elapsed = time.perf_counter() - start
+        endpoint.record_success(elapsed)
+        self.stats.latencies.append(elapsed)
+        self.stats.bytes_received += len(body)
+        return data
+
+    def health_report(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                'url': e.url,
+                'latency_ms': round(e.latency * 1000, 1),
+                'error_rate': round(e.error_rate, 3),
+                'requests': e.requests,
+                'failures': e.failures,
+                'cooling_down': e.cooling_down
+            }
+            for e in self.ranked_endpoints()
+        ]
+
+
+if __name__ == "__main__":
+    async def _demo():
+        async with SolanaRPCClient() as rpc:
+            try:
+                slot = await rpc.call("getSlot")
+                print(f"🛰️ Current slot: {slot}")
+            except RPCError as e:
+                print(f"❌ {e}")
+            for row in rpc.health_report():
+                print(f"   {row}")
+
+    asyncio.run(_demo())
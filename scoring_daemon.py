@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+🛰️ Scoring Daemon
+Ilgai veikiantis procesas, laikantis apmokytą modelį, insights, istorinius
+duomenis ir wallet DB "šiltus". CLI įrankiai siunčia užklausas per Unix socket:
+viena JSON eilutė į vieną pusę, viena JSON eilutė atgal.
+
+Paleidimas: python scoring_daemon.py [--socket PATH]   (--status, --reload, --stop)
+
+Socket'as kuriamas $XDG_RUNTIME_DIR/0xbot/ arba asmeniniame 0700 kataloge temp'e,
+su umask 0177 jau bind metu; klientas jungiasi tik prie savo naudotojo socket'o.
+Pasikeitus modelio artefaktui ar jo duomenims (mtime / dydis), būsena perkraunama
+prieš kitą užklausą; --reload perkrauna rankiniu būdu.
+
+Klientai (easy_analyzer, simple_signal_interface, analyze_user_signal,
+quick_analyzer) naudoja call(); jei daemon neveikia, keliama DaemonUnavailable
+ir analizė atliekama procese, kaip anksčiau.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+import tempfile
+import time
+from typing import Any, Dict
+
+def _uid() -> int:
+    return getattr(os, 'getuid', lambda: 0)()
+
+
+def private_socket_dir() -> str:
+    """$XDG_RUNTIME_DIR/0xbot, o be jo - naudotojo katalogas temp'e (abu kuriami 0700)"""
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime_dir:
+        return os.path.join(runtime_dir, '0xbot')
+    return os.path.join(tempfile.gettempdir(), f"0xbot-{_uid()}")
+
+
+DEFAULT_SOCKET_PATH = os.environ.get('OXBOT_SCORING_SOCKET', os.path.join(private_socket_dir(), 'scoring.sock'))
+WALLET_DB_FILE = 'wallet_intelligence.db'
+CONNECT_TIMEOUT = 0.5     # Daemon nepasiekiamas -> greitas fallback į procesą
+REQUEST_TIMEOUT = 60.0
+MAX_REQUEST_BYTES = 16 * 1024 * 1024
+
+
+class DaemonUnavailable(Exception):
+    """Daemon neveikia (nėra socket'o arba niekas jo neklauso)"""
+
+
+class DaemonError(Exception):
+    """Daemon gavo užklausą, bet jos įvykdyti nepavyko"""
+
+
+def _json_default(obj):
+    """NumPy skaliarai -> Python tipai, visa kita -> str"""
+    if hasattr(obj, 'item'):
+        return obj.item()
+    return str(obj)
+
+
+# ---------------------------------------------------------------- klientas
+
+def call(action: str, socket_path: str = None, timeout: float = REQUEST_TIMEOUT, **params) -> Any:
+    """Viena užklausa daemon'ui; jo stdout (print'ai) perspausdinami čia"""
+    if not hasattr(socket, 'AF_UNIX'):
+        raise DaemonUnavailable("Unix sockets are not supported on this platform")
+
+    socket_path = socket_path or DEFAULT_SOCKET_PATH
+    try:
+        owner = os.stat(socket_path).st_uid
+    except OSError as e:
+        raise DaemonUnavailable(str(e))
+    # Svetimas procesas negali apsimesti daemon'u (pvz. iš anksto užimtu keliu bendrame kataloge)
+    if owner != _uid():
+        raise DaemonUnavailable(f"{socket_path} belongs to uid {owner}, not to this user")
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(CONNECT_TIMEOUT)
+        try:
+            sock.connect(socket_path)
+        except OSError as e:
+            raise DaemonUnavailable(str(e))
+
+        sock.settimeout(timeout)
+        sock.sendall(json.dumps({'action': action, **params}, default=_json_default).encode() + b'\n')
+        with sock.makefile('rb') as stream:
+            line = stream.readline()
+    finally:
+        sock.close()
+
+    if not line:
+        raise DaemonUnavailable("daemon closed the connection")
+    response = json.loads(line)
+    if response.get('output'):
+        print(response['output'], end='')
+    if not response.get('ok'):
+        raise DaemonError(response.get('error', 'unknown error'))
+    return response.get('result')
+
+
+def daemon_available(socket_path: str = None) -> bool:
+    try:
+        call('ping', socket_path=socket_path, timeout=CONNECT_TIMEOUT)
+        return True
+    except (DaemonUnavailable, DaemonError, OSError):
+        return False
+
+
+# ------------------------------------------------------------------ daemon
+
+class ScoringDaemon:
+    """Šilta analizatorių būsena + Unix socket serveris (užklausos vykdomos po vieną)"""
+
+    def __init__(self, socket_path: str = None):
+        self.socket_path = socket_path or DEFAULT_SOCKET_PATH
+        self.analyzer = None
+        self.coin_analyzer = None
+        self.features_df = None
+        self.wallet_lookup = None
+        self.loaded_state = None
+        self.started = time.time()
+        self.requests = 0
+        self.running = False
+        self.actions = {
+            'ping': self.ping,
+            'analyze': self.analyze,
+            'analyze_batch': self.analyze_batch,
+            'quick': self.quick,
+            'wallet_boost': self.wallet_boost,
+            'reload': self.reload,
+            'shutdown': self.shutdown,
+        }
+
+    def load(self):
+        """Modelis, insights, istoriniai coin'ai ir wallet DB - vieną kartą daemon'o gyvavimui"""
+        from realtime_signal_analyzer import RealtimeSignalAnalyzer
+        from telegram_analyzer import TelegramCoinAnalyzer
+        from quick_analyzer import load_historical_features
+
+        start = time.perf_counter()
+        self.analyzer = RealtimeSignalAnalyzer()
+        if not self.analyzer.load_model_and_insights():
+            print("⚠️ ML model not available - 'analyze' requests will fail")
+        self.coin_analyzer = TelegramCoinAnalyzer()
+        self.features_df = load_historical_features()
+
+        if self.wallet_lookup:
+            self.wallet_lookup.close()
+            self.wallet_lookup = None
+        if os.path.exists(WALLET_DB_FILE):
+            from wallet_database_builder import WalletIntelligenceLookup
+            self.wallet_lookup = WalletIntelligenceLookup(WALLET_DB_FILE)
+        # Po užkrovimo: perapmokytas modelis jau įrašytas į artefaktą
+        self.loaded_state = self.state_key()
+        print(f"🔥 Warm state loaded in {time.perf_counter() - start:.2f}s")
+
+    def watched_files(self):
+        """Failai, iš kurių užkrauta šilta būsena (modelio artefaktas, jo duomenys, insights, istorija)"""
+        from quick_analyzer import HISTORICAL_FEATURES_FILE
+        from signal_store import columnar_path
+
+        files = ['advanced_ml_report.json', HISTORICAL_FEATURES_FILE]
+        if self.analyzer is not None:
+            data_file = self.analyzer.data_file
+            files += [self.analyzer.model_store.path, data_file, columnar_path(data_file)]
+        return files
+
+    def state_key(self):
+        """(mtime, dydis) kiekvienam stebimam failui + ar yra wallet DB (jo pakeitimą seka WalletIntelligenceLookup)"""
+        key = []
+        for path in self.watched_files():
+            try:
+                stat = os.stat(path)
+                key.append((path, stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                key.append((path, None))
+        return key + [os.path.exists(WALLET_DB_FILE)]
+
+    def reload_if_changed(self):
+        """Perkrauna būseną, jei modelis ar duomenys pasikeitė nuo paskutinio load()"""
+        if self.state_key() != self.loaded_state:
+            print("🔄 Model or data files changed - reloading")
+            self.load()
+
+    # Veiksmai: params -> JSON serializuojamas rezultatas
+
+    def ping(self):
+        return {
+            'pid': os.getpid(),
+            'uptime': round(time.time() - self.started, 1),
+            'requests': self.requests,
+            'model_loaded': bool(self.analyzer and self.analyzer.trained),
+            'wallet_db': self.wallet_lookup is not None
+        }
+
+    def analyze(self, signal: str, show: bool = False):
+        analysis = self.analyzer.analyze_signal(signal)
+        if analysis is None:
+            raise DaemonError("ML model not loaded")
+        if show:
+            self.analyzer.print_analysis(analysis)
+        return analysis
+
+    def analyze_batch(self, signals: list):
+        analyses = self.analyzer.analyze_signals(signals)
+        if analyses is None:
+            raise DaemonError("ML model not loaded")
+        return analyses
+
+    def quick(self, signal: str, coin_name: str = None):
+        from quick_analyzer import analyze_with_history
+        return analyze_with_history(self.coin_analyzer, self.features_df, signal, coin_name)
+
+    def wallet_boost(self, deployer: str, holders: list):
+        if self.wallet_lookup is None:
+            raise DaemonError(f"{WALLET_DB_FILE} not found")
+        return self.wallet_lookup.calculate_signal_boost(deployer, holders)
+
+    def reload(self):
+        self.load()
+        return self.ping()
+
+    def shutdown(self):
+        self.running = False
+        return {'stopping': True}
+
+    def handle(self, request: Dict) -> Dict:
+        """Vykdo vieną užklausą; jos stdout grąžinamas klientui kaip 'output'"""
+        self.requests += 1
+        output = io.StringIO()
+        try:
+            params = dict(request)
+            name = params.pop('action', None)
+            action = self.actions.get(name)
+            if action is None:
+                raise DaemonError(f"unknown action: {request.get('action')}")
+            with contextlib.redirect_stdout(output):
+                if name not in ('ping', 'reload', 'shutdown'):
+                    self.reload_if_changed()
+                result = action(**params)
+            return {'ok': True, 'result': result, 'output': output.getvalue()}
+        except Exception as e:
+            return {'ok': False, 'error': f"{type(e).__name__}: {e}", 'output': output.getvalue()}
+
+    def _claim_socket(self):
+        """Paruošia socket katalogą ir pašalina likusį socket failą, jei jo niekas neklauso"""
+        directory = os.path.dirname(os.path.abspath(self.socket_path))
+        if directory == os.path.abspath(private_socket_dir()):
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+            stat = os.stat(directory)
+            if stat.st_uid != _uid() or stat.st_mode & 0o077:
+                raise RuntimeError(f"{directory} must be owned by this user with mode 0700")
+        else:
+            os.makedirs(directory, exist_ok=True)
+        if not os.path.exists(self.socket_path):
+            return
+        if daemon_available(self.socket_path):
+            raise RuntimeError(f"scoring daemon already running on {self.socket_path}")
+        os.unlink(self.socket_path)
+
+    def serve(self):
+        self._claim_socket()
+        self.load()
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            timeout = REQUEST_TIMEOUT
+
+            def handle(self):
+                line = self.rfile.readline(MAX_REQUEST_BYTES)
+                if not line:
+                    return
+                try:
+                    response = daemon.handle(json.loads(line))
+                except ValueError as e:
+                    response = {'ok': False, 'error': f"invalid JSON: {e}"}
+                self.wfile.write(json.dumps(response, default=_json_default).encode() + b'\n')
+
+        # SIGTERM -> SystemExit, kad socket failas būtų pašalintas
+        signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+        # Socket failas sukuriamas jau 0600: nėra tarpo tarp bind ir chmod
+        previous_umask = os.umask(0o177)
+        try:
+            server = socketserver.UnixStreamServer(self.socket_path, Handler)
+        finally:
+            os.umask(previous_umask)
+        print(f"🛰️ Scoring daemon listening on {self.socket_path} (pid {os.getpid()})")
+        self.running = True
+        try:
+            while self.running:
+                server.handle_request()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+            print(f"👋 Scoring daemon stopped after {self.requests} requests")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='0xBot scoring daemon (Unix socket, JSON)')
+    parser.add_argument('--socket', default=DEFAULT_SOCKET_PATH, help='Unix socket path')
+    parser.add_argument('--status', action='store_true', help='show status of a running daemon')
+    parser.add_argument('--reload', action='store_true', help='reload model and data of a running daemon')
+    parser.add_argument('--stop', action='store_true', help='stop a running daemon')
+    args = parser.parse_args()
+
+    if args.status or args.reload or args.stop:
+        action = 'shutdown' if args.stop else 'reload' if args.reload else 'ping'
+        try:
+            result = call(action, socket_path=args.socket)
+            print(f"🛰️ {json.dumps(result)}")
+        except DaemonUnavailable:
+            print(f"❌ No scoring daemon on {args.socket}")
+            sys.exit(1)
+        return
+
+    try:
+        ScoringDaemon(args.socket).serve()
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -12,10 +12,25 @@ import os
 import asyncio
 import json
 from datetime import datetime
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.preprocessing import StandardScaler
 from real_blockchain_analyzer import RealBlockchainAnalyzer
+from model_store import ModelArtifactStore
+from signal_parser import parse_signal
+from signal_store import load_signal_data
 import warnings
 warnings.filterwarnings('ignore')
 
+# Model inputs, in order; the strategy one-hots are the strategies _parse_signal_text detects
+STRATEGY_FEATURES = ['0xBot', 'Cobra Scan', 'Viper Vision']
+FEATURE_COLUMNS = ['market_cap_parsed', 'hour', 'day_of_week', 'freeze_disabled',
+                   'mint_disabled', 'lp_burned', 'whale_concentration'] + [
+                   f'strategy_{strategy}' for strategy in STRATEGY_FEATURES]
+TRAINING_COLUMNS = ['date', 'initial_mc', 'call_mc', 'freeze_disabled', 'mint_disabled',
+                    'lp_burned', 'top_holders_percent', 'strategy', 'max_gain']
+
 class TelegramSignalAnalyzer:
     """
     Main Signal Analyzer Class
@@ -29,6 +44,8 @@ class TelegramSignalAnalyzer:
         self.insights = {}
         self.trained = False
         self.loaded = False
+        self.data_file = 'parsed_telegram_data.csv'
+        self.model_store = ModelArtifactStore('telegram_signal_analyzer', code_files=[__file__])
         
     def load_model(self):
         """Load pre-trained ML model and historical insights"""
@@ -43,14 +60,27 @@ class TelegramSignalAnalyzer:
                 report = json.load(f)
                 self.insights = report['insights']
             
-            # Load historical data to train model
-            df = pd.read_csv('parsed_telegram_data.csv')
+            # Reuse persisted model if the training data has not changed
+            artifact = self.model_store.load(self.data_file, FEATURE_COLUMNS)
+            if artifact:
+                self.ml_model = artifact['model']
+                self.scaler = artifact['scaler']
+                self.feature_columns = artifact['feature_columns']
+                self.trained = True
+                self.loaded = True
+                print(f"✅ Model loaded from {self.model_store.path}")
+                return True
+            
+            # Load historical data to train model (typed parsed columns, only what training reads)
+            df = load_signal_data(self.data_file, columns=TRAINING_COLUMNS)
             
             # Prepare features for model training
             df = self._prepare_features(df)
             
             # Train model
             self._train_model(df)
+            if self.trained:
+                self.model_store.save(self.data_file, self.ml_model, self.scaler, self.feature_columns)
             self.loaded = True
             print("✅ Model loaded successfully!")
             return True
@@ -60,50 +90,42 @@ class TelegramSignalAnalyzer:
             return False
     
     def _prepare_features(self, df):
-        """Prepare features for ML model"""
-        features_df = df.copy()
+        """Prepare features for ML model from parsed_telegram_data columns"""
+        features_df = pd.DataFrame(index=df.index)
         
-        # Parse market cap
-        features_df['market_cap_parsed'] = features_df['market_cap'].apply(self._parse_market_cap)
+        # Market cap (signal_store already parsed '71.75K' -> 71750.0), as _parse_signal_text's signal.mc
+        features_df['market_cap_parsed'] = df['initial_mc'].fillna(df['call_mc']).fillna(0)
         
-        # Parse gains
-        features_df['gains_numeric'] = features_df['gains'].apply(self._parse_gains)
-        features_df['gains_5x_plus'] = (features_df['gains_numeric'] >= 5.0).astype(int)
+        # Outcome: 5x or more; signals without a known max gain are dropped in _train_model
+        features_df['gains_5x_plus'] = (df['max_gain'] >= 5.0).astype(int).where(df['max_gain'].notna())
         
         # Time-based features
-        features_df['hour'] = pd.to_datetime(features_df['timestamp']).dt.hour
-        features_df['day_of_week'] = pd.to_datetime(features_df['timestamp']).dt.dayofweek
+        features_df['hour'] = df['date'].dt.hour
+        features_df['day_of_week'] = df['date'].dt.dayofweek
         
         # Security features
-        features_df['freeze_disabled'] = features_df['security_features'].str.contains('freeze.*disabled', case=False, na=False).astype(int)
-        features_df['mint_disabled'] = features_df['security_features'].str.contains('mint.*disabled', case=False, na=False).astype(int)
-        features_df['lp_burned'] = features_df['security_features'].str.contains('lp.*burned', case=False, na=False).astype(int)
+        for column in ('freeze_disabled', 'mint_disabled', 'lp_burned'):
+            features_df[column] = df[column].fillna(False).astype(int)
         
         # Wallet concentration
-        features_df['whale_concentration'] = features_df['wallet_concentration'].apply(self._parse_whale_concentration)
+        features_df['whale_concentration'] = df['top_holders_percent'].fillna(0)
         
         # Strategy encoding
-        strategy_dummies = pd.get_dummies(features_df['strategy'], prefix='strategy')
-        features_df = pd.concat([features_df, strategy_dummies], axis=1)
+        for strategy in STRATEGY_FEATURES:
+            features_df[f'strategy_{strategy}'] = (df['strategy'] == strategy).astype(int)
         
         return features_df
     
     def _train_model(self, df):
         """Train the ML model"""
-        # Feature columns
-        feature_cols = ['market_cap_parsed', 'hour', 'day_of_week', 'freeze_disabled', 
-                       'mint_disabled', 'lp_burned', 'whale_concentration']
-        
-        # Add strategy columns
-        strategy_cols = [col for col in df.columns if col.startswith('strategy_')]
-        feature_cols.extend(strategy_cols)
+        feature_cols = list(FEATURE_COLUMNS)
         
         # Filter valid data
         valid_data = df.dropna(subset=feature_cols + ['gains_5x_plus'])
         
         if len(valid_data) > 100:
-            X = valid_data[feature_cols]
-            y = valid_data['gains_5x_plus']
+            X = valid_data[feature_cols].to_numpy(dtype=float)
+            y = valid_data['gains_5x_plus'].astype(int)
             
             # Scale features
             X_scaled = self.scaler.fit_transform(X)
@@ -143,6 +165,49 @@ class TelegramSignalAnalyzer:
         # ML Prediction
         ml_prediction = self._get_ml_prediction(features)
         
+        return self._build_analysis(parsed, ml_prediction)
+    
+    async def analyze_signals_batch(self, signal_texts, token_names=None, blockchain=True):
+        """
+        Analyze many signals at once (e.g. a day's backlog)
+        
+        Parses every message once, scores the whole feature matrix with a single
+        predict_proba call and, with blockchain=True, adds RealBlockchainAnalyzer
+        intelligence where each unique token/deployer/holder address is fetched once.
+        
+        Yields:
+            (index, analysis) tuples as soon as each signal is ready
+        """
+        if token_names is None:
+            token_names = [None] * len(signal_texts)
+        elif len(token_names) != len(signal_texts):
+            raise ValueError(f"token_names has {len(token_names)} entries for {len(signal_texts)} signals")
+        
+        if not self.loaded:
+            self.load_model()
+        
+        parsed_signals = []
+        for text, token_name in zip(signal_texts, token_names):
+            parsed = self._parse_signal_text(text)
+            if token_name:
+                parsed['token_name'] = token_name
+            parsed_signals.append(parsed)
+        
+        ml_predictions = self._get_ml_predictions([self._extract_features(p) for p in parsed_signals])
+        analyses = [self._build_analysis(p, ml) for p, ml in zip(parsed_signals, ml_predictions)]
+        
+        if not blockchain:
+            for index, analysis in enumerate(analyses):
+                yield index, analysis
+            return
+        
+        async with RealBlockchainAnalyzer() as chain:
+            async for index, chain_analysis in chain.analyze_signals_batch(signal_texts):
+                analyses[index]['blockchain_analysis'] = chain_analysis
+                yield index, analyses[index]
+    
+    def _build_analysis(self, parsed, ml_prediction):
+        """Combine ML prediction with risk, history and recommendation"""
         # Risk Assessment
         risk_assessment = self._assess_risk(parsed)
         
@@ -164,41 +229,39 @@ class TelegramSignalAnalyzer:
     def _parse_signal_text(self, text):
         """Parse Telegram signal text to extract information"""
         result = {}
+        signal = parse_signal(text)
         
         # Token name
-        name_match = re.search(r'🏖\s*([^|]+)', text)
-        if name_match:
-            result['token_name'] = name_match.group(1).strip()
+        if signal.token_name:
+            result['token_name'] = signal.token_name
         
         # Token address
-        address_match = re.search(r'([A-Za-z0-9]{32,})', text)
-        if address_match:
-            result['token_address'] = address_match.group(1)
+        if signal.token_address:
+            result['token_address'] = signal.token_address
         
         # Market cap
-        mc_match = re.search(r'MC:\s*\$?([\d,\.]+[KMB]?)', text, re.IGNORECASE)
-        if mc_match:
-            result['market_cap'] = mc_match.group(1)
+        if signal.mc:
+            result['market_cap'] = signal.mc
         
         # Liquidity
-        liq_match = re.search(r'Liquidity:\s*\$?([\d,\.]+)', text, re.IGNORECASE)
-        if liq_match:
-            result['liquidity'] = liq_match.group(1)
+        if signal.liquidity:
+            result['liquidity'] = signal.liquidity
+        elif signal.call_liquidity_sol is not None:
+            result['liquidity'] = f"{signal.call_liquidity_sol:g}"
         
         # Security features
         security_features = []
-        if re.search(r'freeze.*disabled', text, re.IGNORECASE):
+        if signal.freeze_disabled:
             security_features.append('freeze disabled')
-        if re.search(r'mint.*disabled', text, re.IGNORECASE):
+        if signal.mint_disabled:
             security_features.append('mint disabled')
-        if re.search(r'lp.*burned', text, re.IGNORECASE):
+        if signal.lp_burned:
             security_features.append('lp burned')
         result['security_features'] = ', '.join(security_features)
         
         # Wallet concentration
-        whale_match = re.search(r'Top 10.*?(\d+(?:\.\d+)?)%', text, re.IGNORECASE)
-        if whale_match:
-            result['whale_concentration'] = float(whale_match.group(1))
+        if signal.top_holders_percent is not None:
+            result['whale_concentration'] = signal.top_holders_percent
         
         # Strategy detection
         if '0xBot' in text:
@@ -247,45 +310,45 @@ class TelegramSignalAnalyzer:
     
     def _get_ml_prediction(self, features):
         """Get ML model prediction"""
+        return self._get_ml_predictions([features])[0]
+    
+    def _get_ml_predictions(self, features_list):
+        """ML predictions for many signals with one predict_proba call"""
         if not self.trained:
-            return {
+            return [{
                 'success_probability': 0.25,  # Default baseline
                 'confidence': 'low',
                 'model_available': False
-            }
+            } for _ in features_list]
         
         try:
-            # Prepare feature vector
-            feature_vector = []
-            for col in self.feature_columns:
-                feature_vector.append(features.get(col, 0))
-            
-            # Make prediction
-            X = np.array(feature_vector).reshape(1, -1)
+            # Feature matrix: one row per signal
+            X = np.array([[features.get(col, 0) for col in self.feature_columns] for features in features_list])
             X_scaled = self.scaler.transform(X)
             
-            probability = self.ml_model.predict_proba(X_scaled)[0][1]
-            prediction = self.ml_model.predict(X_scaled)[0]
+            # One forest pass; the class is derived from the probabilities (same as predict)
+            probabilities = self.ml_model.predict_proba(X_scaled)
+            predictions = self.ml_model.classes_.take(probabilities.argmax(axis=1))
             
             # Feature importance
             importance = dict(zip(self.feature_columns, self.ml_model.feature_importances_))
             
-            return {
+            return [{
                 'success_probability': float(probability),
                 'prediction': bool(prediction),
                 'confidence': 'high' if abs(probability - 0.5) > 0.2 else 'medium',
                 'model_available': True,
-                'feature_importance': importance
-            }
+                'feature_importance': dict(importance)
+            } for probability, prediction in zip(probabilities[:, 1], predictions)]
             
         except Exception as e:
             print(f"⚠️ ML prediction error: {e}")
-            return {
+            return [{
                 'success_probability': 0.25,
                 'confidence': 'low',
                 'model_available': False,
                 'error': str(e)
-            }
+            } for _ in features_list]
     
     def _assess_risk(self, parsed_data):
         """Assess risk factors"""
@@ -499,30 +562,6 @@ class TelegramSignalAnalyzer:
             return float(mc_str) * multiplier
         except:
             return 0
-    
-    def _parse_gains(self, gains_str):
-        """Parse gains string to numeric value"""
-        if not gains_str:
-            return 0
-        
-        # Extract numeric part
-        match = re.search(r'([\d\.]+)', str(gains_str))
-        if match:
-            return float(match.group(1))
-        return 0
-    
-    def _parse_whale_concentration(self, whale_str):
-        """Parse whale concentration"""
-        if isinstance(whale_str, (int, float)):
-            return whale_str
-        
-        if not whale_str:
-            return 0
-            
-        match = re.search(r'(\d+(?:\.\d+)?)', str(whale_str))
-        if match:
-            return float(match.group(1))
-        return 0
 
 # Quick analysis function for command line use
 def analyze_signal_quick(signal_text, token_name=None):
@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+🧩 Signal Parser Engine
+Vienas bendras 0xBot Telegram pranešimų parseris visiems analizatoriams.
+
+Pranešimas perskaitomas vieną kartą eilutė po eilutės: etiketė nustatoma pagal
+emoji prefiksą (🛒 Token Address, 📊 Initial MC, 💎 Initial LP, 🛠️ Deployer ...),
+o kitos eilutės (💼 Top 10 holders / 💼 MINT, trumpas formatas) - vienu precompiled regex.
+Palaikomas ir trumpas "🔍 Viper Vision spotted / CA: / MC: / LP:" formatas.
+"""
+
+import re
+from dataclasses import dataclass, asdict
+from functools import lru_cache
+from typing import Dict, Optional, Tuple, List
+
+# Žinomos 0xBot strategijos (ilgesni pavadinimai pirmi, kad 'Tiger Trace 2' laimėtų prieš 'Tiger Trace')
+STRATEGIES = [
+    'Viper Vision', 'Cobra Scan', 'Eagle Eye', 'Phoenix Sight', 'Pheonix Sight',
+    'Hydra Hunt', 'Dragon Detector', 'Wolf Watch', 'Tiger Trace 2', 'Tiger Trace',
+    'Scorpion Sweep', 'Alpha Hunter'
+]
+
+TITLE_PREFIX = '🏖'
+HEADER_PREFIX = '🤖'
+
+# Eilučių etiketės; ilgesnės alternatyvos pirmos, nes regex alternation ima pirmą tinkamą
+_LABELS = [
+    'Token Address', 'Address', 'Contract', 'CA',
+    'Supply',
+    'Initial MC', 'Call MC', 'Current MC', 'Market Cap', 'MC',
+    'Initial LP', 'Call Liquidity', 'LP STATUS', 'LP Tokens', 'Liquidity', 'LP',
+    r'Top \d+(?: holders)?',
+    'Deployer',
+    'FREEZE', 'MINT', 'Free/Mint', 'Fees',
+    'SOCIALS', 'Strategy',
+]
+
+_LABEL_RE = re.compile(
+    r'^[^\w]*(?P<label>' + '|'.join(_LABELS) + r')\s*(?::|(?=\())\s*(?P<rest>.*)$'
+)
+
+# Vienareikšmiai 0xBot emoji prefiksai (💼 naudojamas ir Top holders, ir MINT - tam regex)
+_EMOJI_LABELS = {
+    '🛒': 'Token Address',
+    '📚': 'Supply',
+    '📊': 'Initial MC',
+    '💲': 'Call MC',
+    '💎': 'Initial LP',
+    '💧': 'Call Liquidity',
+    '⚙': 'LP Tokens',
+    '🛠': 'Deployer',
+    '❄': 'FREEZE',
+    '🔥': 'LP STATUS',
+    '📬': 'SOCIALS',
+    '💡': 'Strategy',
+}
+_TITLE_RE = re.compile(r'^(?P<name>.+?)\s+\|\s+(?P<symbol>.+?)(?:\s+\|\s*(?P<platform>.*))?$')
+_ADDRESS_RE = re.compile(r'`?([1-9A-HJ-NP-Za-km-z]{32,44})`?')
+_BARE_ADDRESS_RE = re.compile(r'(?<![\w/])([1-9A-HJ-NP-Za-km-z]{32,44})(?![\w])')
+_ACCOUNT_RE = re.compile(r'solscan\.io/account/([A-Za-z0-9]{32,})')
+_HOLDER_LINK = '(https://solscan.io/address/'
+_NUMBER_RE = re.compile(r'\d+(?:\.\d+)?')
+_MONEY_RE = re.compile(r'\$?\s*(\d[\d,]*(?:\.\d+)?\s*[KMB]?)')
+_SUPPLY_RE = re.compile(r'(\d[\d,]*(?:\.\d+)?[KMB]?)')
+_SOL_RE = re.compile(r'(\d[\d,]*(?:\.\d+)?)\s*SOL')
+_PCT_RE = re.compile(r'(\d+(?:\.\d+)?)\s*%')
+_GAINS_TOKEN_RE = re.compile(r'([\w$]+)\s+gains\s+🚀')  # \w - Unicode (früg, RAT², Nu_Pepe)
+_GAIN_X_RE = re.compile(r'(\d+(?:\.\d+)?)x\s*🚀')
+_CASHTAG_RE = re.compile(r'\$([A-Z][A-Z0-9]*)\b')
+_STRATEGY_RE = re.compile('|'.join(re.escape(s.lower()) for s in STRATEGIES))
+_STRATEGY_CANONICAL = {s.lower(): s for s in STRATEGIES}
+
+
+@dataclass(frozen=True)
+class ParsedSignal:
+    """Vieno Telegram pranešimo parsinimo rezultatas"""
+    title: str = ""
+    token_name: str = ""
+    token_symbol: str = ""
+    platform: str = ""
+    token_address: str = ""
+    strategy: str = ""
+    supply: str = ""
+    initial_mc: str = ""
+    call_mc: str = ""
+    current_mc: str = ""
+    market_cap: str = ""
+    liquidity: str = ""
+    initial_lp_sol: Optional[float] = None
+    call_liquidity_sol: Optional[float] = None
+    lp_tokens_percent: Optional[float] = None
+    top_holders_percent: Optional[float] = None
+    holders: Tuple[Tuple[str, str], ...] = ()  # (procentai be '%', adresas)
+    deployer_address: str = ""
+    freeze_disabled: Optional[bool] = None
+    mint_disabled: Optional[bool] = None
+    lp_burned: Optional[bool] = None
+    has_website: bool = False
+    has_twitter: bool = False
+    has_telegram: bool = False
+    gains_token: str = ""
+    gain_multiplier: Optional[float] = None
+
+    @property
+    def holder_addresses(self) -> List[str]:
+        return [address for _, address in self.holders]
+
+    @property
+    def wallet_percentages(self) -> List[float]:
+        return [float(percent) for percent, _ in self.holders]
+
+    @property
+    def mc(self) -> str:
+        """Pirmoji žinoma market cap reikšmė"""
+        return self.initial_mc or self.market_cap or self.call_mc
+
+    @property
+    def is_gains_update(self) -> bool:
+        return bool(self.gains_token) and self.gain_multiplier is not None
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+EMPTY_SIGNAL = ParsedSignal()
+
+
+def parse_signal(text) -> ParsedSignal:
+    """Parsina pranešimą (rezultatai kešuojami pagal tekstą)"""
+    if not isinstance(text, str) or not text:
+        return EMPTY_SIGNAL
+    return _parse_cached(text)
+
+
+@lru_cache(maxsize=4096)
+def _parse_cached(text: str) -> ParsedSignal:
+    return parse_signal_uncached(text)
+
+
+def parse_signal_uncached(text: str) -> ParsedSignal:
+    """Vienas praėjimas per pranešimo eilutes"""
+    fields = {}
+    expect_address = False
+
+    for raw_line in text.splitlines():
+        line = raw_line.strip()
+        if not line:
+            continue
+
+        # Adresas dažnai būna atskiroje eilutėje po "🛒 Token Address:"
+        if expect_address:
+            expect_address = False
+            match = _ADDRESS_RE.fullmatch(line)
+            if match:
+                fields['token_address'] = match.group(1)
+                continue
+
+        prefix = line[0]
+        if prefix == TITLE_PREFIX:
+            _parse_title(line[1:].strip(), fields)
+            continue
+
+        label = _EMOJI_LABELS.get(prefix)
+        if label is not None:
+            index = line.find(label)
+            if index >= 0:
+                rest = line[index + len(label):].lstrip(' \t:')
+                expect_address = _parse_labeled_line(label, rest, fields)
+                continue
+
+        match = _LABEL_RE.match(line)
+        if match:
+            expect_address = _parse_labeled_line(match.group('label'), match.group('rest'), fields)
+        else:
+            _parse_unlabeled_line(line, fields)
+
+    if _HOLDER_LINK in text:
+        holders = _parse_holders(text)
+        if holders:
+            fields['holders'] = holders
+
+    if '🚀' in text:
+        _parse_gains(text, fields)
+
+    if 'strategy' not in fields:
+        match = _STRATEGY_RE.search(text.lower())
+        if match:
+            fields['strategy'] = _STRATEGY_CANONICAL[match.group(0)]
+
+    return ParsedSignal(**fields)
+
+
+def _parse_holders(text: str) -> Tuple[Tuple[str, str], ...]:
+    """'3.5% (https://solscan.io/address/ADDR)' ir '[3.5%](https://...)' nuorodos"""
+    holders = []
+    parts = text.split(_HOLDER_LINK)
+    for before, after in zip(parts, parts[1:]):
+        percent = before[-32:].rstrip().rstrip(']').rsplit(None, 1)[-1].lstrip('[')
+        address = after.split(')', 1)[0]
+        if (percent.endswith('%') and _NUMBER_RE.fullmatch(percent, 0, len(percent) - 1)
+                and len(address) >= 32 and address.isalnum()):
+            holders.append((percent[:-1], address))
+    return tuple(holders)
+
+
+def _parse_title(rest: str, fields: Dict):
+    """'Name | SYMBOL | (Pump.Fun💊)' eilutė"""
+    fields.setdefault('title', rest)
+    match = _TITLE_RE.match(rest)
+    if match:
+        fields.setdefault('token_name', match.group('name').strip())
+        fields.setdefault('token_symbol', match.group('symbol').strip())
+        if match.group('platform'):
+            fields.setdefault('platform', match.group('platform').strip().strip('()'))
+    elif rest:
+        fields.setdefault('token_name', rest)
+
+
+def _parse_gains(text: str, fields: Dict):
+    """'TOKEN gains 🚀 5.2x 🚀' eilutė"""
+    if 'gains_token' not in fields:
+        match = _GAINS_TOKEN_RE.search(text)
+        if match:
+            fields['gains_token'] = match.group(1)
+    if 'gain_multiplier' not in fields:
+        match = _GAIN_X_RE.search(text)
+        if match:
+            fields['gain_multiplier'] = float(match.group(1))
+
+
+def _split_segments(rest: str):
+    """Atskiria kelias etiketes vienoje eilutėje ('MC: $52K | 💧 Liquidity: $1.2K')"""
+    if ' | ' not in rest or ':' not in rest:
+        return rest, None
+
+    segments = rest.split(' | ')
+    for i in range(1, len(segments)):
+        if _LABEL_RE.match(segments[i]):
+            return ' | '.join(segments[:i]), ' | '.join(segments[i:])
+    return rest, None
+
+
+def _parse_labeled_line(label: str, rest: str, fields: Dict) -> bool:
+    """Apdoroja etiketės eilutę; grąžina True, jei adreso reikia ieškoti kitoje eilutėje"""
+    if label == 'SOCIALS':
+        _parse_socials(rest, fields)
+        return False
+
+    rest, remainder = _split_segments(rest)
+    expect_address = False
+
+    if label in ('Token Address', 'Address', 'Contract', 'CA'):
+        match = _ADDRESS_RE.search(rest)
+        if match:
+            fields.setdefault('token_address', match.group(1))
+        elif 'token_address' not in fields:
+            expect_address = True
+
+    elif label == 'Supply':
+        match = _SUPPLY_RE.search(rest)
+        if match:
+            fields.setdefault('supply', match.group(1))
+
+    elif label in ('Initial MC', 'Call MC', 'Current MC', 'Market Cap', 'MC'):
+        match = _MONEY_RE.search(rest)
+        if match:
+            key = {'Initial MC': 'initial_mc', 'Call MC': 'call_mc',
+                   'Current MC': 'current_mc'}.get(label, 'market_cap')
+            fields.setdefault(key, match.group(1).replace(' ', ''))
+
+    elif label == 'Initial LP':
+        match = _SOL_RE.search(rest)
+        if match:
+            fields.setdefault('initial_lp_sol', float(match.group(1).replace(',', '')))
+
+    elif label == 'Call Liquidity':
+        match = _SOL_RE.search(rest)
+        if match:
+            fields.setdefault('call_liquidity_sol', float(match.group(1).replace(',', '')))
+
+    elif label == 'LP':
+        # Trumpas formatas: "LP: 12.3 SOL (Not Burned)"
+        match = _SOL_RE.search(rest)
+        if match:
+            fields.setdefault('initial_lp_sol', float(match.group(1).replace(',', '')))
+        if 'Burned' in rest:
+            fields.setdefault('lp_burned', 'Not Burned' not in rest)
+
+    elif label == 'Liquidity':
+        match = _MONEY_RE.search(rest)
+        if match:
+            fields.setdefault('liquidity', match.group(1).replace(' ', ''))
+
+    elif label == 'LP Tokens':
+        match = _PCT_RE.search(rest)
+        if match:
+            fields.setdefault('lp_tokens_percent', float(match.group(1)))
+
+    elif label.startswith('Top'):
+        head = rest.split('solscan.io/address/', 1)[0]
+        match = _PCT_RE.search(head)
+        if match:
+            fields.setdefault('top_holders_percent', float(match.group(1)))
+
+    elif label == 'Deployer':
+        match = _ACCOUNT_RE.search(rest)
+        if match:
+            fields.setdefault('deployer_address', match.group(1))
+
+    elif label == 'FREEZE':
+        fields.setdefault('freeze_disabled', 'Disabled' in rest)
+
+    elif label == 'MINT':
+        fields.setdefault('mint_disabled', 'Disabled' in rest)
+
+    elif label == 'LP STATUS':
+        fields.setdefault('lp_burned', 'Burned' in rest and 'Not Burned' not in rest)
+
+    elif label == 'Free/Mint':
+        freeze, _, mint = rest.partition('/')
+        fields.setdefault('freeze_disabled', '✅' in freeze)
+        fields.setdefault('mint_disabled', '✅' in mint)
+
+    elif label == 'Strategy':
+        if rest:
+            fields.setdefault('strategy', rest.strip())
+
+    if remainder:
+        match = _LABEL_RE.match(remainder)
+        expect_address = _parse_labeled_line(match.group('label'), match.group('rest'), fields) or expect_address
+
+    return expect_address
+
+
+def _parse_socials(rest: str, fields: Dict):
+    """'WEB (url) | X (url) | TG (url)'"""
+    for segment in rest.split('|'):
+        name = segment.strip().lstrip('[').split(' ', 1)[0].split(']', 1)[0].upper()
+        if name == 'WEB':
+            fields['has_website'] = True
+        elif name == 'X':
+            fields['has_twitter'] = True
+        elif name == 'TG':
+            fields['has_telegram'] = True
+
+
+def _parse_unlabeled_line(line: str, fields: Dict):
+    """Eilutės be etiketės: trumpo formato pavadinimas, laisvo teksto saugumas, adresas"""
+    if line.startswith(HEADER_PREFIX) or 'http' in line:
+        return
+
+    if ' | ' in line and '%' not in line and 'title' not in fields:
+        _parse_title(line, fields)
+        return
+
+    lowered = line.lower()
+    if 'disabled' in lowered or 'burned' in lowered:
+        if 'freeze disabled' in lowered:
+            fields.setdefault('freeze_disabled', True)
+        if 'mint disabled' in lowered:
+            fields.setdefault('mint_disabled', True)
+        if 'lp burned' in lowered:
+            fields.setdefault('lp_burned', True)
+
+    if 'token_symbol' not in fields and '$' in line:
+        match = _CASHTAG_RE.search(line)
+        if match:
+            fields['token_symbol'] = match.group(1)
+
+    if 'token_address' not in fields:
+        match = _BARE_ADDRESS_RE.search(line)
+        if match:
+            fields['token_address'] = match.group(1)
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+🗄️ Signal Store
+parsed_telegram_data saugojimas: CSV (suderinamumui ir peržiūrai) + tipizuotas
+Parquet failas šalia jo (skaitiniai MC, bool flag'ai, wallet_percentages kaip
+list<double>, UTC laikas).
+
+Skaitytojai kviečia load_signal_data(columns=[...]) ir gauna tik reikalingus
+stulpelius iš Parquet. Jei Parquet nėra, jis senesnis už CSV arba neįdiegtas
+pyarrow - skaitomas CSV ir tipizuojamas tuo pačiu būdu, todėl rezultatas vienodas.
+
+Esamą CSV konvertuoti: python signal_store.py
+"""
+
+import os
+import time
+from typing import List, Optional, Sequence
+
+import pandas as pd
+
+from feature_engineering import parse_mc_values, parse_wallet_percentages
+
+SIGNAL_DATA_FILE = 'parsed_telegram_data.csv'
+
+MC_COLUMNS = ('initial_mc', 'call_mc')
+FLAG_COLUMNS = ('freeze_disabled', 'mint_disabled', 'lp_burned',
+                'has_website', 'has_twitter', 'has_telegram')
+SMALL_INT_COLUMNS = ('hour_of_day', 'day_of_week')
+
+
+def columnar_path(csv_path: str = SIGNAL_DATA_FILE) -> str:
+    """parsed_telegram_data.csv -> parsed_telegram_data.parquet"""
+    return os.path.splitext(csv_path)[0] + '.parquet'
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+        return pyarrow
+    except ImportError:
+        return None
+
+
+def _list_types_mapper(arrow_type):
+    if hasattr(pd, 'ArrowDtype') and str(arrow_type).startswith('list<'):
+        return pd.ArrowDtype(arrow_type)
+    return None
+
+
+def typed_signal_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """CSV tekstas -> tipai (keičia ir grąžina df; trūkstami stulpeliai praleidžiami)"""
+    if 'date' in df.columns:
+        df['date'] = pd.to_datetime(df['date'], utc=True, errors='coerce')
+    for column in MC_COLUMNS:
+        if column in df.columns:
+            # Tuščia reikšmė lieka NaN (filtrams initial_mc.notna()), neparsinama -> 0
+            df[column] = parse_mc_values(df[column]).where(df[column].notna())
+    for column in FLAG_COLUMNS:
+        if column in df.columns and not pd.api.types.is_bool_dtype(df[column]):
+            df[column] = df[column].astype('boolean')
+    for column in SMALL_INT_COLUMNS:
+        if column in df.columns and pd.api.types.is_integer_dtype(df[column]):
+            df[column] = df[column].astype('int8')
+    if 'wallet_percentages' in df.columns:
+        df['wallet_percentages'] = [parse_wallet_percentages(value) for value in df['wallet_percentages']]
+    return df
+
+
+def save_signal_data(df: pd.DataFrame, csv_path: str = SIGNAL_DATA_FILE) -> Optional[str]:
+    """CSV kaip anksčiau + tipizuotas Parquet šalia (grąžina jo kelią, None be pyarrow)"""
+    df.to_csv(csv_path, index=False)
+    return write_columnar_copy(df, csv_path)
+
+
+def write_columnar_copy(df: pd.DataFrame, csv_path: str = SIGNAL_DATA_FILE) -> Optional[str]:
+    """Tipizuotas Parquet failas šalia CSV (CSV neperrašomas)"""
+    pa = _pyarrow()
+    if pa is None:
+        print("⚠️ pyarrow not installed - skipping columnar copy")
+        return None
+
+    table = pa.Table.from_pandas(typed_signal_frame(df.copy()), preserve_index=False)
+    if 'wallet_percentages' in table.column_names:
+        # Vien tušti sąrašai būtų list<null>
+        index = table.column_names.index('wallet_percentages')
+        table = table.set_column(index, 'wallet_percentages',
+                                 table.column(index).cast(pa.list_(pa.float64())))
+    path = columnar_path(csv_path)
+    pa.parquet.write_table(table, path)
+    return path
+
+
+def _fresh_columnar_path(csv_path: str) -> Optional[str]:
+    """Parquet kelias, jei jis ne senesnis už CSV (CSV galėjo būti perrašytas be jo)"""
+    path = columnar_path(csv_path)
+    try:
+        columnar_mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+    try:
+        if os.stat(csv_path).st_mtime_ns > columnar_mtime:
+            return None
+    except OSError:
+        pass
+    return path
+
+
+def load_signal_data(csv_path: str = SIGNAL_DATA_FILE, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+    """Tipizuoti signalai; columns - tik šie stulpeliai (nesantys praleidžiami)"""
+    wanted: Optional[List[str]] = list(columns) if columns is not None else None
+
+    path = _fresh_columnar_path(csv_path)
+    pa = _pyarrow() if path else None
+    if pa is not None:
+        if wanted is not None:
+            available = set(pa.parquet.read_schema(path).names)
+            wanted = [column for column in wanted if column in available]
+        # Sąrašai lieka Arrow buferiuose (ne po NumPy masyvą kiekvienai eilutei)
+        return pa.parquet.read_table(path, columns=wanted).to_pandas(types_mapper=_list_types_mapper)
+
+    usecols = None if wanted is None else (lambda column: column in wanted)
+    return typed_signal_frame(pd.read_csv(csv_path, usecols=usecols))
+
+
+if __name__ == "__main__":
+    import sys
+
+    csv_path = sys.argv[1] if len(sys.argv) > 1 else SIGNAL_DATA_FILE
+    path = write_columnar_copy(pd.read_csv(csv_path), csv_path)
+    if path:
+        print(f"✅ {csv_path} ({os.path.getsize(csv_path) / 1e6:.2f} MB) -> "
+              f"{path} ({os.path.getsize(path) / 1e6:.2f} MB)")
+
+        for label, load in (('CSV', lambda: pd.read_csv(csv_path)), ('Parquet', lambda: load_signal_data(csv_path))):
+            start = time.perf_counter()
+            df = load()
+            print(f"📊 {label}: {(time.perf_counter() - start) * 1000:.1f}ms, "
+                  f"{df.memory_usage(deep=True).sum() / 1e6:.2f} MB in memory")
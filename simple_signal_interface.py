@@ -8,17 +8,36 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from realtime_signal_analyzer import RealtimeSignalAnalyzer
+from scoring_daemon import DaemonUnavailable, call, daemon_available
 import json
 from datetime import datetime
 
 class SimpleSignalInterface:
     def __init__(self):
+        self.analyzer = None
+        if daemon_available():
+            print("🛰️ Using warm model from the scoring daemon")
+        else:
+            self._load_local_analyzer()
+        print("✅ Ready to analyze signals!")
+        print()
+    
+    def _load_local_analyzer(self):
+        """In-process fallback when the scoring daemon is not running"""
+        from realtime_signal_analyzer import RealtimeSignalAnalyzer
         print("🤖 Loading ML model and insights...")
         self.analyzer = RealtimeSignalAnalyzer()
         self.analyzer.load_model_and_insights()
-        print("✅ Ready to analyze signals!")
-        print()
+    
+    def _analyze_and_print(self, signal_text):
+        if self.analyzer is None:
+            try:
+                return call('analyze', signal=signal_text, show=True)
+            except DaemonUnavailable:
+                self._load_local_analyzer()  # Daemon stopped mid-session
+        analysis = self.analyzer.analyze_signal(signal_text)
+        self.analyzer.print_analysis(analysis)
+        return analysis
     
     def analyze_signal_from_text(self, signal_text, token_name=None):
         """Analyze a signal from raw text input"""
@@ -26,8 +45,7 @@ class SimpleSignalInterface:
         print("=" * 60)
         
         try:
-            analysis = self.analyzer.analyze_signal(signal_text)
-            self.analyzer.print_analysis(analysis)
+            analysis = self._analyze_and_print(signal_text)
             
             # Return key metrics for easy comparison
             return {
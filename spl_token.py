@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+🪙 SPL Token Account Decoding
+getProgramAccounts užklausų parametrai ir atsakymų dekodavimas token holderiams.
+
+SPL token account (165 B): mint [0:32] | owner [32:64] | amount u64 LE [64:72] | ...
+Kompaktiškas režimas su base64 + dataSlice parsiunčia tik owner + amount (40 B)
+ir dekoduoja juos vienu NumPy buferiu, vietoj jsonParsed JSON medžio.
+"""
+
+import base64
+from typing import Dict, List
+
+import numpy as np
+
+TOKEN_PROGRAM_ID = "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA"
+TOKEN_ACCOUNT_SIZE = 165
+OWNER_AMOUNT_SLICE = {"offset": 32, "length": 40}
+OWNER_AMOUNT_DTYPE = np.dtype([('owner', 'V32'), ('amount', '<u8')])
+
+BASE58_ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
+_BASE58_CODES = np.frombuffer(BASE58_ALPHABET.encode(), dtype=np.uint8)
+_BASE58_CHUNK = 58 ** 5      # < 2^30, todėl (liekana << 32 | limb) telpa į uint64
+_BASE58_ROUNDS = 9           # 58^45 > 2^256
+
+
+def base58_encode(raw: bytes) -> str:
+    """32 baitų public key -> base58 adresas"""
+    number = int.from_bytes(raw, 'big')
+    encoded = []
+    while number:
+        number, remainder = divmod(number, 58)
+        encoded.append(BASE58_ALPHABET[remainder])
+    leading_zeros = len(raw) - len(raw.lstrip(b'\0'))
+    return '1' * leading_zeros + ''.join(reversed(encoded))
+
+
+def base58_encode_many(keys: np.ndarray) -> List[str]:
+    """(N, 32) uint8 public keys -> base58 adresai (vektorizuota dalyba visiems iš karto)"""
+    count = len(keys)
+    if count == 0:
+        return []
+    limbs = np.ascontiguousarray(keys).view('>u4').reshape(count, 8).astype(np.uint64)
+    digits = np.zeros((count, _BASE58_ROUNDS * 5), dtype=np.uint8)
+
+    # Ilgoji dalyba iš 58^5: kiekvienas raundas duoda 5 base58 skaitmenis (mažiausi pirmi)
+    for round_index in range(_BASE58_ROUNDS):
+        remainder = np.zeros(count, dtype=np.uint64)
+        for j in range(8):
+            current = (remainder << np.uint64(32)) | limbs[:, j]
+            limbs[:, j] = current // np.uint64(_BASE58_CHUNK)
+            remainder = current % np.uint64(_BASE58_CHUNK)
+        for k in range(5):
+            digits[:, -(round_index * 5 + k + 1)] = remainder % np.uint64(58)
+            remainder //= np.uint64(58)
+
+    encoded = _BASE58_CODES[digits].view(f'S{digits.shape[1]}').ravel()
+    leading_zeros = (np.cumprod(keys == 0, axis=1) != 0).sum(axis=1)
+    return ['1' * int(zeros) + text.lstrip(b'1').decode() for text, zeros in zip(encoded, leading_zeros)]
+
+
+def token_accounts_params(mint_address: str, compact: bool = True) -> list:
+    """getProgramAccounts parametrai visiems mint token account'ams"""
+    config = {
+        "encoding": "base64" if compact else "jsonParsed",
+        "filters": [
+            {"dataSize": TOKEN_ACCOUNT_SIZE},
+            {"memcmp": {"offset": 0, "bytes": mint_address}}
+        ]
+    }
+    if compact:
+        config["dataSlice"] = OWNER_AMOUNT_SLICE
+    return [TOKEN_PROGRAM_ID, config]
+
+
+def parse_json_accounts(result: List[Dict]) -> List[Dict]:
+    """jsonParsed atsakymas -> holderiai su balansu > 0 (didžiausi pirmi)"""
+    accounts = []
+    for account in result:
+        parsed = account['account']['data']['parsed']['info']
+        if float(parsed['tokenAmount']['uiAmount'] or 0) > 0:
+            accounts.append({
+                'owner': parsed['owner'],
+                'balance': float(parsed['tokenAmount']['uiAmount']),
+                'address': account['pubkey']
+            })
+    return sorted(accounts, key=lambda x: x['balance'], reverse=True)
+
+
+def parse_compact_accounts(result: List[Dict], decimals: int) -> List[Dict]:
+    """base64 + dataSlice atsakymas -> tie patys holderiai kaip parse_json_accounts.
+    Be mint decimals raw u64 kiekiai nėra balansai, todėl decimals privalomas."""
+    if decimals is None:
+        raise ValueError("mint decimals unknown - raw amounts cannot be converted to balances")
+    if not result:
+        return []
+    raw = b''.join(base64.b64decode(account['account']['data'][0]) for account in result)
+    records = np.frombuffer(raw, dtype=OWNER_AMOUNT_DTYPE)
+
+    # Stabilus rikiavimas mažėjančiai, kaip sorted(..., reverse=True)
+    order = np.argsort(-records['amount'].astype(np.float64), kind='stable')
+    order = order[records['amount'][order] > 0]
+    balances = records['amount'][order] / 10.0 ** decimals
+
+    owners = base58_encode_many(
+        np.frombuffer(records['owner'][order].tobytes(), dtype=np.uint8).reshape(len(order), 32)
+    )
+    return [
+        {
+            'owner': owner,
+            'balance': float(balance),
+            'address': result[i]['pubkey']
+        }
+        for i, owner, balance in zip(order.tolist(), owners, balances.tolist())
+    ]
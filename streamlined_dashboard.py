@@ -15,7 +15,10 @@ import requests
 from datetime import datetime, timedelta
 import asyncio
 import aiohttp
+import contextlib
 from real_blockchain_analyzer import RealBlockchainAnalyzer
+from signal_parser import parse_signal
+from dashboard_resources import clear_resources, get_blockchain_runtime, get_history, get_signal_analyzer
 import re
 import time
 from typing import Dict, List, Optional
@@ -44,12 +47,11 @@ class StreamlinedSignalDashboard:
         self.setup_session_state()
     
     def load_analyzers(self):
-        """Load analysis engines"""
+        """Load analysis engines (model is cached across reruns, keyed by data file mtime)"""
         try:
             if RealtimeSignalAnalyzer is not None and EnhancedSignalProcessor is not None:
-                self.signal_analyzer = RealtimeSignalAnalyzer()
+                self.signal_analyzer = get_signal_analyzer()
                 self.enhanced_processor = EnhancedSignalProcessor()
-                self.signal_analyzer.load_model_and_insights()
                 st.sidebar.success("✅ AI Models loaded")
             else:
                 st.sidebar.warning("⚠️ AI modules not available - using demo mode")
@@ -75,45 +77,41 @@ class StreamlinedSignalDashboard:
             'parsed_data': {}
         }
         
+        signal = parse_signal(message)
+        parsed_data = signal_data['parsed_data']
+        
         # Extract strategy
-        strategy_match = re.search(r'(Viper Vision|Cobra Scan|Alpha Hunter|Eagle Eye)', message)
-        if strategy_match:
-            signal_data['parsed_data']['strategy'] = strategy_match.group(1)
+        if signal.strategy:
+            parsed_data['strategy'] = signal.strategy
         
         # Extract token name
-        lines = message.split('\n')
-        for line in lines[1:]:
-            if line.strip() and not line.startswith(('CA:', 'MC:', 'LP:', 'Fees:', 'Top', 'Free')):
-                signal_data['parsed_data']['token_name'] = line.strip()
-                break
+        if signal.title:
+            parsed_data['token_name'] = signal.title
         
         # Extract contract address
-        ca_match = re.search(r'CA:\s*([A-Za-z0-9]{32,})', message)
-        if ca_match:
-            signal_data['parsed_data']['contract_address'] = ca_match.group(1)
+        if signal.token_address:
+            parsed_data['contract_address'] = signal.token_address
         
         # Extract market cap
-        mc_match = re.search(r'MC:\s*\$?(\d+\.?\d*)\s*(K|M)?', message)
+        mc_match = re.match(r'(\d+\.?\d*)\s*(K|M)?', signal.mc.replace(',', ''))
         if mc_match:
             mc_value = float(mc_match.group(1))
             if mc_match.group(2) == 'K':
                 mc_value *= 1000
             elif mc_match.group(2) == 'M':
                 mc_value *= 1000000
-            signal_data['parsed_data']['market_cap'] = mc_value
+            parsed_data['market_cap'] = mc_value
         
         # Extract LP
-        lp_match = re.search(r'LP:\s*(\d+\.?\d*)\s*SOL', message)
-        if lp_match:
-            signal_data['parsed_data']['liquidity_sol'] = float(lp_match.group(1))
+        if signal.initial_lp_sol is not None:
+            parsed_data['liquidity_sol'] = signal.initial_lp_sol
         
         # Extract top holders
-        holders_match = re.search(r'Top\s*\d+\s*holders?:\s*(\d+)%', message)
-        if holders_match:
-            signal_data['parsed_data']['top_holders_percent'] = int(holders_match.group(1))
+        if signal.top_holders_percent is not None:
+            parsed_data['top_holders_percent'] = int(signal.top_holders_percent)
         
         # Extract LP burned status
-        signal_data['parsed_data']['lp_burned'] = 'Burned' in message or 'burned' in message
+        parsed_data['lp_burned'] = bool(signal.lp_burned)
         
         return signal_data
     
@@ -464,11 +462,17 @@ class StreamlinedSignalDashboard:
             else:
                 st.info("No significant risk factors identified")
     
-    async def analyze_signal_real(self, signal_text: str, analysis_mode: str = "quick") -> Dict:
-        """Tikra signal analizė naudojant RealBlockchainAnalyzer"""
+    async def analyze_signal_real(self, signal_text: str, analysis_mode: str = "quick",
+                                  analyzer: Optional[RealBlockchainAnalyzer] = None) -> Dict:
+        """Tikra signal analizė naudojant RealBlockchainAnalyzer
+        
+        analyzer - ilgaamžis BlockchainRuntime analizatorius (sesija ir cache'ai
+        išlieka tarp analizių); be jo sukuriamas vienkartinis."""
         try:
             # Use real blockchain analyzer
-            async with RealBlockchainAnalyzer() as analyzer:
+            async with contextlib.AsyncExitStack() as stack:
+                if analyzer is None:
+                    analyzer = await stack.enter_async_context(RealBlockchainAnalyzer())
                 result = await analyzer.analyze_signal_complete(signal_text)
                 
                 if 'error' in result:
@@ -491,9 +495,11 @@ class StreamlinedSignalDashboard:
                 return formatted_result
                 
         except Exception as e:
-            st.error(f"Real analysis error: {str(e)}")
+            # Vykdoma background loop gijoje: klaidą parodo skripto gija (st.* čia neveikia)
             # Fallback to simulated analysis
-            return await self.analyze_signal_fallback(signal_text, analysis_mode)
+            analysis = await self.analyze_signal_fallback(signal_text, analysis_mode)
+            analysis['real_analysis_error'] = str(e)
+            return analysis
     
     async def analyze_signal_fallback(self, signal_text: str, analysis_mode: str = "quick") -> Dict:
         """Fallback analizė jei real API neveikia"""
@@ -722,6 +728,11 @@ class StreamlinedSignalDashboard:
                 help="Quick: Basic AI prediction | Deep: Full wallet + deployer analysis | Training: Add to ML dataset"
             )
             
+            # Model cache (kept across reruns until the data file changes)
+            if st.button("🔄 Reload model", help="Reload the ML model and historical data from disk"):
+                clear_resources()
+                st.rerun()
+            
             # Settings
             st.subheader("⚙️ Settings")
             auto_analyze = st.checkbox("Auto-analyze on upload", value=True)
@@ -756,15 +767,18 @@ class StreamlinedSignalDashboard:
                             try:
                                 # Use async real blockchain analyzer
                                 if analysis_mode == "Deep Analysis":
-                                    # Run async analysis
-                                    loop = asyncio.new_event_loop()
-                                    asyncio.set_event_loop(loop)
-                                    try:
-                                        analysis = loop.run_until_complete(
-                                            self.analyze_signal_real(signal_text, analysis_mode)
-                                        )
-                                    finally:
-                                        loop.close()
+                                    # Run async analysis on the process-wide background loop;
+                                    # navigating away (rerun) interrupts the wait and cancels it
+                                    runtime = get_blockchain_runtime()
+                                    progress = st.empty()
+                                    analysis = runtime.run(
+                                        self.analyze_signal_real(signal_text, analysis_mode, runtime.analyzer),
+                                        on_wait=lambda elapsed: progress.caption(f"⏳ Waiting for blockchain data... {elapsed:.0f}s")
+                                    )
+                                    progress.empty()
+                                    
+                                    if analysis.get('real_analysis_error'):
+                                        st.error(f"Real analysis error: {analysis['real_analysis_error']}")
                                     
                                     if 'error' in analysis:
                                         st.error(f"Analysis failed: {analysis['error']}")
@@ -778,14 +792,9 @@ class StreamlinedSignalDashboard:
                                         
                                 elif analysis_mode == "Quick Analysis":
                                     # Quick analysis using fallback
-                                    loop = asyncio.new_event_loop()
-                                    asyncio.set_event_loop(loop)
-                                    try:
-                                        analysis = loop.run_until_complete(
-                                            self.analyze_signal_fallback(signal_text, analysis_mode)
-                                        )
-                                    finally:
-                                        loop.close()
+                                    analysis = get_blockchain_runtime().run(
+                                        self.analyze_signal_fallback(signal_text, analysis_mode)
+                                    )
                                         
                                     if 'error' in analysis:
                                         st.error(f"Analysis failed: {analysis['error']}")
@@ -954,7 +963,7 @@ class StreamlinedSignalDashboard:
             
             # Load historical data
             try:
-                historical_df = pd.read_csv('parsed_telegram_data.csv')
+                historical_df = get_history('parsed_telegram_data.csv')
                 
                 if not historical_df.empty:
                     # Performance over time
@@ -11,16 +11,100 @@ import os
 from datetime import datetime, timedelta
 from collections import defaultdict, Counter
 import warnings
-import matplotlib.pyplot as plt
-import seaborn as sns
 import numpy as np
-from matplotlib.dates import DateFormatter
-import matplotlib.dates as mdates
+from signal_parser import parse_signal
+from chat_export_reader import CHUNK_SIZE, iter_chat_messages
 warnings.filterwarnings('ignore')
 
-# Set style for plots
-plt.style.use('seaborn-v0_8')
-sns.set_palette("husl")
+_plot_style_applied = False
+
+
+def _plotting():
+    """matplotlib / seaborn importuojami tik braižant - CLI paleidimas jų nelaukia"""
+    global _plot_style_applied
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    if not _plot_style_applied:
+        # Set style for plots
+        plt.style.use('seaborn-v0_8')
+        sns.set_palette("husl")
+        _plot_style_applied = True
+    return plt, sns
+
+class CoinMatcher:
+    """Multi-pattern coin pavadinimų paieška (trie), papildoma naujais coin'ais eigoje
+    
+    Grąžina pirmą (pagal įterpimo tvarką) coin'ą, kurio pavadinimas yra žinutės
+    substring'as - tą patį, ką senasis `for coin in coin_data: if coin.lower() in text.lower()`.
+    Coin pavadinimai sudaryti tik iš Unicode žodžio simbolių ir $ (kaip gains regex'e),
+    todėl atitikmuo visada telpa viename teksto žodyje; žodžių rezultatai kešuojami tarp žinučių.
+    """
+    
+    WORD_PATTERN = re.compile(r'[\w$]+')
+    MAX_CACHED_WORDS = 200000
+    
+    def __init__(self):
+        self.coin_names = []
+        self.coins = []  # mažosiomis raidėmis
+        self.trie = {}
+        self.word_cache = {}  # žodis -> (coin indeksas arba None, coins skaičius tikrinant)
+    
+    def add(self, coin_name):
+        """Prideda coin'ą (indeksas = įterpimo tvarka)"""
+        name = coin_name.lower()
+        index = len(self.coins)
+        self.coin_names.append(coin_name)
+        self.coins.append(name)
+        
+        node = self.trie
+        for ch in name:
+            node = node.setdefault(ch, {})
+        node.setdefault(None, index)  # pasikartojantis pavadinimas - laimi ankstesnis
+    
+    def _match_word(self, word):
+        """Mažiausias coin indeksas, kurio pavadinimas yra word substring'as"""
+        best = None
+        trie = self.trie
+        for start in range(len(word)):
+            node = trie
+            for ch in word[start:]:
+                node = node.get(ch)
+                if node is None:
+                    break
+                index = node.get(None)
+                if index is not None and (best is None or index < best):
+                    best = index
+                    if best == 0:
+                        return best
+        return best
+    
+    def first_match(self, text_lower):
+        """Pirmas coin'as, paminėtas jau mažosiomis raidėmis paverstame tekste, arba None"""
+        if not self.coins:
+            return None
+        
+        coin_count = len(self.coins)
+        cache = self.word_cache
+        if len(cache) > self.MAX_CACHED_WORDS:
+            cache.clear()
+        
+        best = None
+        for word in set(self.WORD_PATTERN.findall(text_lower)):
+            cached = cache.get(word)
+            if cached is None:
+                index = self._match_word(word)
+            else:
+                index, checked = cached
+                if index is None and checked < coin_count:
+                    # Nauji coin'ai turi didesnius indeksus - tikriname tik juos
+                    index = next((i for i in range(checked, coin_count) if self.coins[i] in word), None)
+            cache[word] = (index, coin_count)
+            
+            if index is not None and (best is None or index < best):
+                best = index
+        
+        return None if best is None else self.coin_names[best]
+
 
 class TelegramCoinAnalyzer:
     def __init__(self):
@@ -53,11 +137,12 @@ class TelegramCoinAnalyzer:
         }
     
     def load_csv(self, file_path):
-        """Užkrauna CSV failą"""
+        """Patikrina CSV failą ir grąžina jo žinučių generatorių (skaitoma gabalais)"""
         try:
-            df = pd.read_csv(file_path)
-            print(f"✅ Užkrautas CSV failas: {len(df)} eilučių")
-            return df
+            if 'text' not in pd.read_csv(file_path, nrows=0).columns:
+                raise ValueError("nėra 'text' stulpelio")
+            print(f"✅ CSV failas skaitomas gabalais po {CHUNK_SIZE} eilučių: {file_path}")
+            return iter_chat_messages(file_path)
         except Exception as e:
             print(f"❌ Klaida užkraunant failą: {e}")
             return None
@@ -67,11 +152,9 @@ class TelegramCoinAnalyzer:
         if pd.isna(text):
             return None, None
         
-        match = re.search(self.patterns['coin_gains'], text)
-        if match:
-            coin_name = match.group(1)
-            gain_x = float(match.group(2))
-            return coin_name, gain_x
+        signal = parse_signal(text)
+        if signal.is_gains_update:
+            return signal.gains_token.lstrip('$'), signal.gain_multiplier
         return None, None
     
     def extract_token_address(self, text):
@@ -79,16 +162,9 @@ class TelegramCoinAnalyzer:
         if pd.isna(text):
             return None
         
-        # Pirmas pattern - su backticks
-        match1 = re.search(self.patterns['token_address'], text)
-        if match1:
-            return match1.group(1)
-        
-        # Antras pattern - tiesiog token address eilutėje po "Token Address:"
-        match2 = re.search(r'Token Address:\s*([A-Za-z0-9]{40,50})', text)
-        if match2:
-            return match2.group(1)
-        
+        address = parse_signal(text).token_address
+        if 40 <= len(address) <= 50:
+            return address
         return None
     
     def extract_wallets_and_percentages(self, text):
@@ -97,28 +173,13 @@ class TelegramCoinAnalyzer:
             return []
         
         wallets = []
-        
-        # Pirmas pattern - su nuorodomis [ ]
-        wallet_pattern1 = r'\[([0-9]+\.?[0-9]*%)\]\(https://solscan\.io/address/([A-Za-z0-9]{40,50})\)'
-        matches1 = re.findall(wallet_pattern1, text)
-        
-        for percentage, wallet in matches1:
-            wallets.append({
-                'wallet': wallet,
-                'percentage': percentage,
-                'percentage_float': float(percentage.replace('%', ''))
-            })
-        
-        # Antras pattern - tiesiog procentai su wallet adresais (jūsų signalo formatas)
-        wallet_pattern2 = r'([0-9]+\.?[0-9]*%)\s+\(https://solscan\.io/address/([A-Za-z0-9]{40,50})\)'
-        matches2 = re.findall(wallet_pattern2, text)
-        
-        for percentage, wallet in matches2:
-            wallets.append({
-                'wallet': wallet,
-                'percentage': percentage,
-                'percentage_float': float(percentage.replace('%', ''))
-            })
+        for percentage, wallet in parse_signal(text).holders:
+            if 40 <= len(wallet) <= 50:
+                wallets.append({
+                    'wallet': wallet,
+                    'percentage': f"{percentage}%",
+                    'percentage_float': float(percentage)
+                })
         
         return wallets
     
@@ -127,32 +188,30 @@ class TelegramCoinAnalyzer:
         if pd.isna(text):
             return {}
         
+        signal = parse_signal(text)
         data = {}
         
         # Market Cap
-        mc_match = re.search(r'(?:Initial MC|Call MC):\s*\$([0-9,]+\.?[0-9]*[KMB]?)', text)
-        if mc_match:
-            data['market_cap'] = mc_match.group(1)
+        market_cap = signal.initial_mc or signal.call_mc
+        if market_cap:
+            data['market_cap'] = market_cap
         
         # Supply
-        supply_match = re.search(r'Supply:\s*([0-9,]+\.?[0-9]*[KMB]?)\s*Tokens', text)
-        if supply_match:
-            data['supply'] = supply_match.group(1)
+        if signal.supply:
+            data['supply'] = signal.supply
         
         # LP Amount
-        lp_match = re.search(r'(?:Initial LP|Call Liquidity):\s*([0-9]+\.?[0-9]*)\s*SOL', text)
-        if lp_match:
-            data['lp_sol'] = float(lp_match.group(1))
+        lp_sol = signal.initial_lp_sol if signal.initial_lp_sol is not None else signal.call_liquidity_sol
+        if lp_sol is not None:
+            data['lp_sol'] = lp_sol
         
         # LP Tokens percentage
-        lp_tokens_match = re.search(r'LP Tokens:\s*([0-9]+\.?[0-9]*)%', text)
-        if lp_tokens_match:
-            data['lp_tokens_percent'] = float(lp_tokens_match.group(1))
+        if signal.lp_tokens_percent is not None:
+            data['lp_tokens_percent'] = signal.lp_tokens_percent
         
         # Top holders percentage
-        holders_match = re.search(r'Top 10 holders.*?([0-9]+\.?[0-9]*)%', text)
-        if holders_match:
-            data['top_holders_percent'] = float(holders_match.group(1))
+        if signal.top_holders_percent is not None:
+            data['top_holders_percent'] = signal.top_holders_percent
         
         return data
     
@@ -161,19 +220,15 @@ class TelegramCoinAnalyzer:
         if pd.isna(text):
             return {}
         
+        signal = parse_signal(text)
         features = {}
         
-        # Freeze status
-        if 'FREEZE:' in text:
-            features['freeze_disabled'] = '✅ Disabled' in text
-        
-        # Mint status
-        if 'MINT:' in text:
-            features['mint_disabled'] = '✅ Disabled' in text
-        
-        # LP Burned
-        if 'LP STATUS:' in text:
-            features['lp_burned'] = '✅ Burned' in text or 'Not Burned' not in text
+        if signal.freeze_disabled is not None:
+            features['freeze_disabled'] = signal.freeze_disabled
+        if signal.mint_disabled is not None:
+            features['mint_disabled'] = signal.mint_disabled
+        if signal.lp_burned is not None:
+            features['lp_burned'] = signal.lp_burned
         
         return features
     
@@ -220,8 +275,8 @@ class TelegramCoinAnalyzer:
     
     def analyze_csv(self, file_path):
         """Pagrindinė analizės funkcija"""
-        df = self.load_csv(file_path)
-        if df is None:
+        messages = self.load_csv(file_path)
+        if messages is None:
             return None, None
         
         print("🔍 Pradedama analizė...")
@@ -242,19 +297,19 @@ class TelegramCoinAnalyzer:
         })
         
         all_wallets = []
+        coin_matcher = CoinMatcher()
         
-        # Analizuojame kiekvieną eilutę
-        for idx, row in df.iterrows():
-            text = row.get('text', '')
-            date = row.get('date', '')
-            
-            if pd.isna(text):
-                continue
+        # Analizuojame kiekvieną žinutę su tekstu
+        for message in messages:
+            text, date = message.text, message.date
             
             # Ištraukiame coin gains
             coin_name, gain_x = self.extract_coin_gains(text)
             
             if coin_name and gain_x:
+                if coin_name not in coin_data:
+                    coin_matcher.add(coin_name)
+                
                 # Coin'as su gain'u
                 coin_data[coin_name]['gains'].append(gain_x)
                 coin_data[coin_name]['max_gain'] = max(coin_data[coin_name]['max_gain'], gain_x)
@@ -267,14 +322,16 @@ class TelegramCoinAnalyzer:
                 
                 print(f"🚀 {coin_name}: {gain_x}x gain")
             
+            # Vienas praėjimas: pirmas paminėtas coin'as šiai žinutei
+            coin = coin_matcher.first_match(text.lower())
+            
             # Ieškome token adresų ir kitos informacijos visose žinutėse
             token_addr = self.extract_token_address(text)
-            if token_addr:
-                # Bandome susieti su coin'u pagal artumo principą
-                for coin in coin_data.keys():
-                    if coin.lower() in text.lower() or any(coin.lower() in msg.lower() for msg in coin_data[coin]['messages'][-5:]):
-                        coin_data[coin]['token_addresses'].add(token_addr)
-                        break
+            if token_addr and coin_data:
+                # Artumo principas: kiekvieno coin'o paskutinės žinutės visada mini patį coin'ą,
+                # todėl adresas priskiriamas pirmam žinomam coin'ui
+                first_coin = next(iter(coin_data))
+                coin_data[first_coin]['token_addresses'].add(token_addr)
             
             # Wallet'ai ir procentai
             wallets = self.extract_wallets_and_percentages(text)
@@ -283,46 +340,35 @@ class TelegramCoinAnalyzer:
                 wallet_info['date'] = date
                 
                 # Bandome susieti su coin'u
-                for coin in coin_data.keys():
-                    if coin.lower() in text.lower():
-                        wallet_info['coin'] = coin
-                        coin_data[coin]['wallets'].append(wallet_info)
-                        break
+                if coin:
+                    wallet_info['coin'] = coin
+                    coin_data[coin]['wallets'].append(wallet_info)
                 
                 all_wallets.append(wallet_info)
             
+            if not coin:
+                continue
+            
             # Finansiniai duomenys
             financial_data = self.extract_financial_data(text)
             if financial_data:
-                for coin in coin_data.keys():
-                    if coin.lower() in text.lower():
-                        coin_data[coin]['financial_data'].update(financial_data)
-                        break
+                coin_data[coin]['financial_data'].update(financial_data)
             
             # Saugumo funkcijos
             security_features = self.extract_security_features(text)
             if security_features:
-                for coin in coin_data.keys():
-                    if coin.lower() in text.lower():
-                        coin_data[coin]['security_features'].update(security_features)
-                        break
+                coin_data[coin]['security_features'].update(security_features)
             
             # Nuorodos
             links = self.extract_links(text)
             if any(links.values()):
-                for coin in coin_data.keys():
-                    if coin.lower() in text.lower():
-                        for key, value in links.items():
-                            coin_data[coin]['links'][key] = coin_data[coin]['links'].get(key, 0) + value
-                        break
+                for key, value in links.items():
+                    coin_data[coin]['links'][key] = coin_data[coin]['links'].get(key, 0) + value
             
             # Signal keywords
             signals = self.count_signal_keywords(text)
             if signals:
-                for coin in coin_data.keys():
-                    if coin.lower() in text.lower():
-                        coin_data[coin]['signal_keywords'].update(signals)
-                        break
+                coin_data[coin]['signal_keywords'].update(signals)
         
         print(f"✅ Analizė baigta! Rasta {len(coin_data)} coin'ų")
         
@@ -487,6 +533,7 @@ class TelegramCoinAnalyzer:
 
     def plot_gain_distribution(self, features_df):
         """Pavaizduoja gain'ų pasiskirstymą"""
+        plt, sns = _plotting()
         plt.figure(figsize=(10, 6))
         sns.histplot(features_df['max_gain'], bins=30, kde=True)
         plt.title('Coin\'ų Gain Pasiskirstymas')
@@ -497,6 +544,7 @@ class TelegramCoinAnalyzer:
     
     def plot_top_coins(self, features_df, n=10):
         """Pavaizduoja top n coin'ų max gain"""
+        plt, sns = _plotting()
         top_coins = features_df.nlargest(n, 'max_gain')
         
         plt.figure(figsize=(12, 8))
@@ -509,6 +557,9 @@ class TelegramCoinAnalyzer:
     
     def plot_signal_keyword_trends(self, features_df, keyword):
         """Pavaizduoja signalų žodžių tendencijas laikui bėgant"""
+        plt, sns = _plotting()
+        from matplotlib.dates import DateFormatter
+        import matplotlib.dates as mdates
         keyword = keyword.upper()
         filtered_df = features_df[features_df['signal_keywords'].str.contains(keyword, na=False)]
         
@@ -533,6 +584,7 @@ class TelegramCoinAnalyzer:
     
     def plot_wallet_concentration(self, features_df):
         """Pavaizduoja wallet'ų koncentraciją pagal coin'us"""
+        plt, sns = _plotting()
         plt.figure(figsize=(10, 6))
         sns.boxplot(x='max_wallet_percent', data=features_df)
         plt.title('Wallet\'ų Koncentracija Pagal Coin\'us')
@@ -542,6 +594,7 @@ class TelegramCoinAnalyzer:
     
     def plot_security_feature_correlation(self, features_df):
         """Pavaizduoja koreliaciją tarp saugumo funkcijų ir sėkmės rodiklių"""
+        plt, sns = _plotting()
         security_features = ['freeze_disabled', 'mint_disabled', 'lp_burned']
         correlation_data = features_df[['success_score'] + security_features]
         
@@ -555,6 +608,7 @@ class TelegramCoinAnalyzer:
     
     def analyze_time_based_trends(self, df):
         """Atlieka laiko analizę ir pavaizduoja rezultatus"""
+        plt, sns = _plotting()
         df['date'] = pd.to_datetime(df['date'], errors='coerce')
         df = df.sort_values('date')
         
@@ -585,6 +639,7 @@ class TelegramCoinAnalyzer:
     
     def plot_top_wallets_time_series(self, all_wallets, top_n=10):
         """Pavaizduoja top wallet'ų laiką serijose"""
+        plt, sns = _plotting()
         wallets_df = pd.DataFrame(all_wallets)
         top_wallets = wallets_df.groupby('wallet').agg({'percentage_float': 'sum'}).nlargest(top_n, 'percentage_float').index
         
@@ -602,6 +657,7 @@ class TelegramCoinAnalyzer:
     
     def create_visualizations(self, features_df, wallets_df, coin_data):
         """Sukuria duomenų vizualizacijas"""
+        plt, sns = _plotting()
         print("\n📊 Kuriame vizualizacijas...")
         
         # Create output directory for plots
@@ -767,6 +823,7 @@ class TelegramCoinAnalyzer:
 
     def analyze_time_patterns(self, features_df, coin_data):
         """Analizuoja laiko šablonus"""
+        plt, sns = _plotting()
         print("\n⏰ Analizuojame laiko šablonus...")
         
         time_analysis = {
@@ -1041,6 +1098,7 @@ class TelegramCoinAnalyzer:
 
     def create_summary_dashboard(self, features_df, coin_data, insights):
         """Sukuria summary dashboard vizualizaciją"""
+        plt, sns = _plotting()
         print("\n🎛️ Kuriame summary dashboard...")
         
         fig = plt.figure(figsize=(20, 16))
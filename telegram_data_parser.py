@@ -5,36 +5,350 @@ Parses raw telegram messages and extracts structured data
 """
 
 import pandas as pd
+import argparse
+import os
 import re
 import json
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 import numpy as np
+from signal_parser import parse_signal
+from signal_store import save_signal_data
+from chat_export_reader import (CHUNK_SIZE, GAINS_MARKERS, SIGNAL_MARKERS, count_export_rows, export_signature,
+                                iter_chat_chunks)
+
+RAW_CHAT_FILE = 'telegram_chat_0xBot_AI_Agent___Solana_network.csv'
+PARSED_DATA_FILE = 'parsed_telegram_data.csv'
+CHECKPOINT_VERSION = 2
+SHARDS_PER_WORKER = 4    # Several shards per process keep workers busy when shards parse unevenly
+MIN_SHARD_ROWS = 500     # Below this, pickling a shard costs more than parsing it
+
+
+def parsed_json_path(filename):
+    """parsed_telegram_data.csv -> parsed_telegram_data.json (parsed signals as saved dicts)"""
+    return filename.replace('.csv', '.json')
+
+
+def shard_rows(total_rows, workers):
+    """Export rows per parallel shard: about SHARDS_PER_WORKER shards per worker, at most one reader chunk"""
+    target = -(-total_rows // (workers * SHARDS_PER_WORKER))
+    return max(MIN_SHARD_ROWS, min(CHUNK_SIZE, target))
+
+
+def checkpoint_path(filename):
+    """parsed_telegram_data.csv -> parsed_telegram_data.checkpoint.json"""
+    return os.path.splitext(filename)[0] + '.checkpoint.json'
+
+class GainsIndex:
+    """Inverted index: substring of token_identifier -> gains identifiers containing it
+    
+    Matches the original str.contains(symbol) | str.contains(name) semantics:
+    a gains row belongs to a signal when its identifier contains the signal's
+    token symbol or token name.
+    """
+    
+    def __init__(self, per_identifier):
+        self.stats = {
+            identifier: (row.max_gain, int(row.gains_count))
+            for identifier, row in zip(per_identifier.index, per_identifier.itertuples())
+        }
+        self.substrings = {}
+        for identifier in self.stats:
+            seen = set()
+            for start in range(len(identifier)):
+                for end in range(start + 1, len(identifier) + 1):
+                    seen.add(identifier[start:end])
+            for substring in seen:
+                self.substrings.setdefault(substring, []).append(identifier)
+    
+    def matching_identifiers(self, pattern):
+        """Identifiers containing pattern (empty pattern matches everything)"""
+        if pattern == '':
+            return self.stats.keys()
+        return self.substrings.get(pattern, ())
+    
+    def lookup(self, token_symbol, token_name=''):
+        """Return (max_gain, gains_count) for a signal, (0, 0) when nothing matches"""
+        identifiers = set(self.matching_identifiers(token_symbol))
+        identifiers.update(self.matching_identifiers(token_name))
+        if not identifiers:
+            return 0, 0
+        
+        gains = [self.stats[identifier] for identifier in identifiers]
+        gains_count = sum(count for _, count in gains)
+        known = [max_gain for max_gain, _ in gains if not pd.isna(max_gain)]
+        max_gain = max(known) if known else np.nan
+        return max_gain, gains_count
+
+
+class GainsAggregator:
+    """Running max_gain / gains_count per token identifier while gains updates stream in
+    
+    Gives the same result as grouping a DataFrame of all updates by token_identifier
+    (max of gain_multiplier, number of updates) without keeping the updates.
+    """
+    
+    def __init__(self):
+        self.stats = {}
+        self.updates = 0
+        self.has_identifier = False
+        self.has_multiplier = False
+    
+    def add(self, gains_data):
+        self.updates += 1
+        self.has_identifier |= 'token_identifier' in gains_data
+        self.has_multiplier |= 'gain_multiplier' in gains_data
+        
+        identifier = gains_data.get('token_identifier')
+        if identifier is None or pd.isna(identifier):
+            return
+        entry = self.stats.setdefault(identifier, [np.nan, 0])
+        entry[1] += 1
+        multiplier = gains_data.get('gain_multiplier', np.nan)
+        if not pd.isna(multiplier) and not multiplier <= entry[0]:
+            entry[0] = multiplier
+    
+    def to_dict(self):
+        """JSON-friendly state for the parse checkpoint"""
+        return {
+            'updates': self.updates,
+            'has_identifier': self.has_identifier,
+            'has_multiplier': self.has_multiplier,
+            'stats': {identifier: [None if pd.isna(max_gain) else float(max_gain), count]
+                      for identifier, (max_gain, count) in self.stats.items()}
+        }
+    
+    @classmethod
+    def from_dict(cls, state):
+        aggregator = cls()
+        aggregator.updates = state['updates']
+        aggregator.has_identifier = state['has_identifier']
+        aggregator.has_multiplier = state['has_multiplier']
+        aggregator.stats = {identifier: [np.nan if max_gain is None else max_gain, count]
+                            for identifier, (max_gain, count) in state['stats'].items()}
+        return aggregator
+    
+    def merge(self, other):
+        """Fold in another shard's aggregate"""
+        self.updates += other.updates
+        self.has_identifier |= other.has_identifier
+        self.has_multiplier |= other.has_multiplier
+        for identifier, (max_gain, count) in other.stats.items():
+            entry = self.stats.setdefault(identifier, [np.nan, 0])
+            entry[1] += count
+            if not pd.isna(max_gain) and not max_gain <= entry[0]:
+                entry[0] = max_gain
+    
+    def index(self):
+        """GainsIndex over the aggregated identifiers"""
+        columns = ['max_gain', 'gains_count']
+        if not (self.has_identifier and self.has_multiplier):
+            return GainsIndex(pd.DataFrame(columns=columns))
+        return GainsIndex(pd.DataFrame.from_dict(self.stats, orient='index', columns=columns))
+
+
+class ExportProgress:
+    """Checkpoint view of the candidate messages parsed so far: count and last id/date"""
+    
+    def __init__(self, messages=0, last_id=None, last_date=None):
+        self.messages = messages
+        self.last_id = last_id
+        self.last_date = last_date
+    
+    def add(self, messages):
+        """Record one chunk of messages (dates are converted once per chunk, not per message)"""
+        self.messages += len(messages)
+        
+        ids = [message.id for message in messages if message.id is not None and not pd.isna(message.id)]
+        if ids:
+            self.last_id = max(ids) if self.last_id is None else max(self.last_id, max(ids))
+        dates = pd.to_datetime(pd.Series([message.date for message in messages], dtype=object),
+                               utc=True, errors='coerce', format='mixed').dropna()
+        if len(dates) and (self.last_date is None or dates.max() > self.last_date):
+            self.last_date = dates.max()
+    
+    def track(self, chunks):
+        """Pass messages of every chunk through, recording each chunk"""
+        for messages in chunks:
+            self.add(messages)
+            yield from messages
+
 
 class TelegramDataParser:
     def __init__(self):
-        self.df = None
+        self.raw_file = None
+        self.raw_size = None  # Export bytes covered by the last parse (reading stops there; the checkpoint resumes after them)
         self.parsed_signals = []
+        self.progress = None  # ExportProgress + GainsAggregator of the last parse, for the checkpoint
+        self.gains = None
         
-    def load_raw_data(self):
-        """Load raw telegram data"""
+    def load_raw_data(self, file_path=RAW_CHAT_FILE):
+        """Check the raw telegram export; parse_signals streams it in chunks"""
         try:
-            self.df = pd.read_csv('telegram_chat_0xBot_AI_Agent___Solana_network.csv')
-            print(f"✅ Loaded {len(self.df)} raw messages")
+            columns = pd.read_csv(file_path, nrows=0).columns
+            if 'text' not in columns:
+                raise ValueError(f"no 'text' column in {file_path}")
+            self.raw_file = file_path
+            print(f"✅ Streaming raw messages from {file_path}")
             return True
         except Exception as e:
             print(f"❌ Error loading data: {e}")
             return False
     
-    def parse_signals(self):
-        """Parse signals from raw text"""
+    def parse_signals(self, workers=1):
+        """Parse signals from raw text (workers > 1: shards parsed in separate processes)"""
         print("\n🔧 PARSING SIGNALS FROM RAW DATA...")
         
+        self.progress = ExportProgress()
+        self.raw_size = os.path.getsize(self.raw_file)
+        if workers > 1:
+            signals, gains = self.parse_parallel(workers)
+        else:
+            # Only messages with a signal or gains marker reach the parser
+            chunks = iter_chat_chunks(self.raw_file, SIGNAL_MARKERS + GAINS_MARKERS, end=self.raw_size)
+            signals, gains = self.parse_messages(self.progress.track(chunks))
+        
+        print(f"✅ Parsed {len(signals)} signals and {gains.updates} gains updates")
+        
+        # Merge signals with their gains
+        merged_signals = self.merge_signals_with_gains(signals, gains)
+        
+        self.gains = gains
+        self.parsed_signals = merged_signals
+        return merged_signals
+    
+    def parse_incremental(self, filename=PARSED_DATA_FILE, workers=1):
+        """Parse only rows appended to the export since the checkpoint of filename (full parse when it does not apply)
+        
+        The checkpoint records the export path, its size and a sampled signature of those bytes;
+        when they still match, reading starts at the old end of file, so the parsed part is not
+        read again. Earlier signals come from the saved JSON; gains updates from the checkpoint
+        are merged with the new ones, so max_gain/gains_count of old signals pick up later gains.
+        """
+        previous = self.load_checkpoint(filename)
+        if previous is None:
+            return self.parse_signals(workers)
+        checkpoint, old_signals = previous
+        
+        mismatch = self.checkpoint_mismatch(checkpoint)
+        if mismatch:
+            print(f"⚠️ {mismatch} - full re-parse")
+            return self.parse_signals(workers)
+        
+        print(f"\n🔧 PARSING MESSAGES SINCE LAST RUN ({checkpoint['updated']})...")
+        last_date = checkpoint['last_date']
+        progress = ExportProgress(checkpoint['messages'], checkpoint['last_id'],
+                                  pd.to_datetime(last_date, utc=True) if last_date else None)
+        # Rows appended while this parse runs stay beyond raw_size for the next run
+        self.raw_size = os.path.getsize(self.raw_file)
+        chunks = iter_chat_chunks(self.raw_file, SIGNAL_MARKERS + GAINS_MARKERS,
+                                  start=checkpoint['raw_size'], end=self.raw_size)
+        new_signals, new_gains = self.parse_messages(progress.track(chunks))
+        print(f"✅ {progress.messages - checkpoint['messages']} new messages: "
+              f"{len(new_signals)} signals and {new_gains.updates} gains updates")
+        
+        gains = GainsAggregator.from_dict(checkpoint['gains'])
+        gains.merge(new_gains)
+        
+        # Appended rows follow the parsed ones, as in a full parse (file order)
+        merged_signals = self.merge_signals_with_gains(old_signals + new_signals, gains)
+        
+        self.progress = progress
+        self.gains = gains
+        self.parsed_signals = merged_signals
+        return merged_signals
+    
+    def checkpoint_mismatch(self, checkpoint):
+        """Why the checkpoint cannot be continued on self.raw_file (None when it can)"""
+        if checkpoint['raw_file'] != os.path.abspath(self.raw_file):
+            return f"Checkpoint was made for {checkpoint['raw_file']}, not {self.raw_file}"
+        if os.path.getsize(self.raw_file) < checkpoint['raw_size']:
+            return "Export is smaller than at the checkpoint"
+        signature = export_signature(self.raw_file, checkpoint['raw_size'])
+        if signature is None or signature != checkpoint['raw_signature']:
+            return "Export changed before the checkpoint"
+        return None
+    
+    def load_checkpoint(self, filename=PARSED_DATA_FILE):
+        """(checkpoint, previously parsed signals) if both exist and belong together, else None"""
+        path = checkpoint_path(filename)
+        try:
+            with open(path) as f:
+                checkpoint = json.load(f)
+            with open(parsed_json_path(filename)) as f:
+                signals = json.load(f)
+        except FileNotFoundError:
+            print("ℹ️ No parse checkpoint - full parse")
+            return None
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Could not read parse checkpoint: {e} - full parse")
+            return None
+        
+        if checkpoint.get('version') != CHECKPOINT_VERSION or len(signals) != checkpoint.get('signals'):
+            print(f"⚠️ {path} does not match {parsed_json_path(filename)} - full parse")
+            return None
+        return checkpoint, signals
+    
+    def save_checkpoint(self, filename=PARSED_DATA_FILE):
+        """Checkpoint for the next incremental run (after save_parsed_data)"""
+        if self.progress is None or self.gains is None:
+            return
+        
+        last_id = self.progress.last_id
+        checkpoint = {
+            'version': CHECKPOINT_VERSION,
+            'updated': datetime.now().isoformat(timespec='seconds'),
+            'raw_file': os.path.abspath(self.raw_file),
+            'raw_size': self.raw_size,
+            'raw_signature': export_signature(self.raw_file, self.raw_size),
+            'messages': self.progress.messages,
+            'last_id': last_id.item() if hasattr(last_id, 'item') else last_id,
+            'last_date': self.progress.last_date.isoformat() if self.progress.last_date is not None else None,
+            'signals': len(self.parsed_signals),
+            'gains': self.gains.to_dict()
+        }
+        path = checkpoint_path(filename)
+        with open(f"{path}.tmp", 'w') as f:
+            json.dump(checkpoint, f)
+        os.replace(f"{path}.tmp", path)
+    
+    def parse_parallel(self, workers):
+        """Row-range shards sized from the export's row count -> ProcessPoolExecutor;
+        results merged in file order (same as serial)"""
+        signals = []
+        gains = GainsAggregator()
+        pending = deque()
+        
+        def collect(future):
+            shard_signals, shard_gains = future.result()
+            signals.extend(shard_signals)
+            gains.merge(shard_gains)
+        
+        rows = count_export_rows(self.raw_file)
+        chunk_size = shard_rows(rows, workers)
+        print(f"🧵 {rows:,} rows in shards of {chunk_size:,} rows across {workers} workers")
+        
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for shard in iter_chat_chunks(self.raw_file, SIGNAL_MARKERS + GAINS_MARKERS, chunk_size,
+                                          end=self.raw_size):
+                self.progress.add(shard)
+                pending.append(pool.submit(_parse_shard, shard))
+                # Bounded in-flight window keeps memory flat while the reader runs ahead
+                if len(pending) >= 2 * workers:
+                    collect(pending.popleft())
+            while pending:
+                collect(pending.popleft())
+        
+        return signals, gains
+    
+    def parse_messages(self, messages):
+        """Classify and parse (index, date, text) messages -> (signals, GainsAggregator)"""
         signals = []
-        gains_updates = []
+        gains = GainsAggregator()
         
-        for idx, row in self.df.iterrows():
-            text = str(row['text'])
-            date = row['date']
+        for message in messages:
+            text, date = message.text, message.date
             
             # Check if it's a signal announcement
             if self.is_signal_announcement(text):
@@ -46,30 +360,13 @@ class TelegramDataParser:
             elif self.is_gains_update(text):
                 gains_data = self.extract_gains_data(text, date)
                 if gains_data:
-                    gains_updates.append(gains_data)
-        
-        print(f"✅ Parsed {len(signals)} signals and {len(gains_updates)} gains updates")
-        
-        # Merge signals with their gains
-        merged_signals = self.merge_signals_with_gains(signals, gains_updates)
+                    gains.add(gains_data)
         
-        self.parsed_signals = merged_signals
-        return merged_signals
+        return signals, gains
     
     def is_signal_announcement(self, text):
         """Check if text is a signal announcement"""
-        signal_indicators = [
-            'Token Address:',
-            'Supply:',
-            'Initial MC:',
-            'LP Tokens:',
-            'Top 10 holders:',
-            'FREEZE:',
-            'MINT:',
-            'LP STATUS:'
-        ]
-        
-        return any(indicator in text for indicator in signal_indicators)
+        return any(indicator in text for indicator in SIGNAL_MARKERS)
     
     def is_gains_update(self, text):
         """Check if text is a gains update"""
@@ -82,66 +379,52 @@ class TelegramDataParser:
                 'date': date,
                 'type': 'signal'
             }
+            parsed = parse_signal(text)
             
             # Extract token name and symbol
-            title_match = re.search(r'🏖 (.+?) \| (.+?) \|', text)
-            if title_match:
-                signal['token_name'] = title_match.group(1).strip()
-                signal['token_symbol'] = title_match.group(2).strip()
+            if parsed.token_name and parsed.token_symbol:
+                signal['token_name'] = parsed.token_name
+                signal['token_symbol'] = parsed.token_symbol
             
             # Extract token address
-            address_match = re.search(r'Token Address:\s*([A-Za-z0-9]+)', text)
-            if address_match:
-                signal['token_address'] = address_match.group(1)
+            if parsed.token_address:
+                signal['token_address'] = parsed.token_address
             
             # Extract financial data
-            supply_match = re.search(r'Supply: ([\d.]+[BMK]?) Tokens', text)
-            if supply_match:
-                signal['supply'] = supply_match.group(1)
-            
-            initial_mc_match = re.search(r'Initial MC: \$([0-9,.K]+)', text)
-            if initial_mc_match:
-                signal['initial_mc'] = initial_mc_match.group(1)
-            
-            call_mc_match = re.search(r'Call MC: \$([0-9,.K]+)', text)
-            if call_mc_match:
-                signal['call_mc'] = call_mc_match.group(1)
+            if parsed.supply:
+                signal['supply'] = parsed.supply
+            if parsed.initial_mc:
+                signal['initial_mc'] = parsed.initial_mc
+            if parsed.call_mc:
+                signal['call_mc'] = parsed.call_mc
             
             # Extract LP data
-            lp_sol_match = re.search(r'Initial LP: ([\d.]+) SOL', text)
-            if lp_sol_match:
-                signal['initial_lp_sol'] = float(lp_sol_match.group(1))
-            
-            lp_tokens_match = re.search(r'LP Tokens: (\d+)%', text)
-            if lp_tokens_match:
-                signal['lp_tokens_percent'] = int(lp_tokens_match.group(1))
+            if parsed.initial_lp_sol is not None:
+                signal['initial_lp_sol'] = parsed.initial_lp_sol
+            if parsed.lp_tokens_percent is not None:
+                signal['lp_tokens_percent'] = int(parsed.lp_tokens_percent)
             
             # Extract holder data
-            holders_match = re.search(r'Top 10 holders:.*?(\d+\.?\d*)%', text)
-            if holders_match:
-                signal['top_holders_percent'] = float(holders_match.group(1))
-            
-            # Extract wallet percentages
-            wallet_percentages = re.findall(r'(\d+\.?\d*)% \(https://solscan\.io/address/', text)
-            signal['wallet_percentages'] = [float(p) for p in wallet_percentages]
+            if parsed.top_holders_percent is not None:
+                signal['top_holders_percent'] = parsed.top_holders_percent
+            signal['wallet_percentages'] = parsed.wallet_percentages
             
             # Extract security features
-            signal['freeze_disabled'] = '✅ Disabled' in text and 'FREEZE:' in text
-            signal['mint_disabled'] = '✅ Disabled' in text and 'MINT:' in text
-            signal['lp_burned'] = '✅' in text and 'LP STATUS:' in text and 'Burned' in text
+            signal['freeze_disabled'] = bool(parsed.freeze_disabled)
+            signal['mint_disabled'] = bool(parsed.mint_disabled)
+            signal['lp_burned'] = bool(parsed.lp_burned)
             
             # Extract socials
-            signal['has_website'] = 'WEB (' in text
-            signal['has_twitter'] = 'X (' in text
-            signal['has_telegram'] = 'TG (' in text
+            signal['has_website'] = parsed.has_website
+            signal['has_twitter'] = parsed.has_twitter
+            signal['has_telegram'] = parsed.has_telegram
             
             # Extract strategy
-            strategy_match = re.search(r'Strategy: (.+)', text)
-            if strategy_match:
-                signal['strategy'] = strategy_match.group(1).strip()
+            if parsed.strategy:
+                signal['strategy'] = parsed.strategy
             
             # Extract time features
-            dt = pd.to_datetime(date)
+            dt = pd.Timestamp(date)
             signal['hour_of_day'] = dt.hour
             signal['day_of_week'] = dt.weekday()
             
@@ -158,66 +441,49 @@ class TelegramDataParser:
                 'date': date,
                 'type': 'gains_update'
             }
+            parsed = parse_signal(text)
             
-            # Extract token name
-            token_match = re.search(r'([A-Za-z0-9$]+) gains 🚀', text)
-            if token_match:
-                gains_data['token_identifier'] = token_match.group(1)
-            
-            # Extract gain multiplier
-            gain_match = re.search(r'(\d+\.?\d*)x 🚀', text)
-            if gain_match:
-                gains_data['gain_multiplier'] = float(gain_match.group(1))
+            if parsed.gains_token:
+                gains_data['token_identifier'] = parsed.gains_token
+            if parsed.gain_multiplier is not None:
+                gains_data['gain_multiplier'] = parsed.gain_multiplier
             
             # Extract MCs
-            call_mc_match = re.search(r'Call MC: \$([0-9,.K]+)', text)
-            if call_mc_match:
-                gains_data['call_mc'] = call_mc_match.group(1)
-            
-            current_mc_match = re.search(r'Current MC: \$([0-9,.KM]+)', text)
-            if current_mc_match:
-                gains_data['current_mc'] = current_mc_match.group(1)
+            if parsed.call_mc:
+                gains_data['call_mc'] = parsed.call_mc
+            if parsed.current_mc:
+                gains_data['current_mc'] = parsed.current_mc
             
             return gains_data
             
         except Exception as e:
             return None
     
-    def merge_signals_with_gains(self, signals, gains_updates):
-        """Merge signals with their gains updates"""
+    def merge_signals_with_gains(self, signals, gains):
+        """Merge signals with their gains (GainsAggregator or a list of gains updates)"""
         print("\n🔗 MERGING SIGNALS WITH GAINS...")
         
-        # Convert to DataFrames for easier manipulation
-        signals_df = pd.DataFrame(signals)
-        gains_df = pd.DataFrame(gains_updates)
+        if not isinstance(gains, GainsAggregator):
+            aggregator = GainsAggregator()
+            for gains_data in gains:
+                aggregator.add(gains_data)
+            gains = aggregator
         
-        if len(gains_df) == 0:
+        if gains.updates == 0:
             print("⚠️ No gains data found")
             return signals
         
+        # Gains per identifier + substring index -> O(1) lookup per signal
+        gains_index = gains.index()
+        
         # For each signal, find the maximum gain achieved
         for idx, signal in enumerate(signals):
             if 'token_symbol' not in signal:
                 continue
-                
-            token_symbol = signal['token_symbol']
             
-            # Find matching gains updates (escape special regex characters)
-            token_symbol_escaped = re.escape(token_symbol)
-            token_name_escaped = re.escape(signal.get('token_name', ''))
-            
-            matching_gains = gains_df[
-                gains_df['token_identifier'].str.contains(token_symbol_escaped, na=False, regex=True) |
-                gains_df['token_identifier'].str.contains(token_name_escaped, na=False, regex=True)
-            ]
-            
-            if len(matching_gains) > 0:
-                max_gain = matching_gains['gain_multiplier'].max()
-                signals[idx]['max_gain'] = max_gain
-                signals[idx]['gains_count'] = len(matching_gains)
-            else:
-                signals[idx]['max_gain'] = 0
-                signals[idx]['gains_count'] = 0
+            max_gain, gains_count = gains_index.lookup(signal['token_symbol'], signal.get('token_name', ''))
+            signals[idx]['max_gain'] = max_gain
+            signals[idx]['gains_count'] = gains_count
         
         return signals
     
@@ -264,34 +530,52 @@ class TelegramDataParser:
         
         return df
     
-    def save_parsed_data(self, filename='parsed_telegram_data.csv'):
-        """Save parsed data to CSV"""
+    def save_parsed_data(self, filename=PARSED_DATA_FILE):
+        """Save parsed data to CSV and a typed Parquet copy"""
         if not self.parsed_signals:
             print("❌ No data to save")
             return
         
         df = pd.DataFrame(self.parsed_signals)
-        df.to_csv(filename, index=False)
-        print(f"✅ Saved parsed data to {filename}")
+        columnar_file = save_signal_data(df, filename)
+        print(f"✅ Saved parsed data to {filename}" + (f" and {columnar_file}" if columnar_file else ""))
         
-        # Also save as JSON for easier inspection
-        with open(filename.replace('.csv', '.json'), 'w') as f:
+        # Also save as JSON (inspection + signals reused by parse_incremental)
+        with open(parsed_json_path(filename), 'w') as f:
             json.dump(self.parsed_signals, f, indent=2, default=str)
         
         return df
 
+def _parse_shard(messages):
+    """Worker process entry point: one shard of prefiltered messages"""
+    return TelegramDataParser().parse_messages(messages)
+
+
 def main():
     """Main parsing function"""
+    arg_parser = argparse.ArgumentParser(description='Parse raw 0xBot Telegram export')
+    arg_parser.add_argument('--input', default=RAW_CHAT_FILE, help='raw chat export CSV')
+    arg_parser.add_argument('--workers', type=int, default=1,
+                            help='parser processes (1 = serial, 0 = one per CPU)')
+    arg_parser.add_argument('--full', action='store_true',
+                            help='ignore the checkpoint and re-parse the whole export')
+    args = arg_parser.parse_args()
+    workers = args.workers or os.cpu_count() or 1
+    
     print("🚀 TELEGRAM DATA PARSER STARTING...")
     
     parser = TelegramDataParser()
     
-    if not parser.load_raw_data():
+    if not parser.load_raw_data(args.input):
         return
     
-    parsed_signals = parser.parse_signals()
+    if args.full:
+        parsed_signals = parser.parse_signals(workers=workers)
+    else:
+        parsed_signals = parser.parse_incremental(PARSED_DATA_FILE, workers=workers)
     df = parser.analyze_parsed_data()
     parser.save_parsed_data()
+    parser.save_checkpoint()
     
     print("\n🎉 PARSING COMPLETE!")
     
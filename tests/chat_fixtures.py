@@ -0,0 +1,66 @@
+"""Maži Telegram eksportai testams (0xBot signalų ir gains žinučių šablonai)"""
+
+import csv
+import hashlib
+from datetime import datetime, timedelta, timezone
+
+BASE58_ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
+
+SIGNAL_TEMPLATE = """🤖 0xBot AI Agent | Solana Network (https://t.me/ai_agent_solana_0xbot)
+🏖 {name} | {symbol} | (Pump.Fun💊)
+
+🛒 Token Address:
+{token_address}
+
+📚 Supply: 1000M Tokens
+📊 Initial MC: ${mc}
+💲 Call MC: ${mc}
+💎 Initial LP: 85.0 SOL | $14.52K
+💧 Call Liquidity: 85.0 SOL | $14.51K
+⚙️ LP Tokens: 20%
+
+💼 Top 10 holders: (https://solscan.io/token/{token_address}#holders) 21.5%
+{holders}
+
+🛠️ Deployer (https://solscan.io/account/{deployer}) 0.0 SOL | 0.0 Tokens
+
+❄️ FREEZE: ✅ Disabled
+💼 MINT: ✅ Disabled
+🔥 LP STATUS: ❌ Not Burned
+
+💡 Strategy: {strategy}"""
+
+GAINS_TEMPLATE = """{symbol} gains 🚀 {gain}x 🚀
+Call MC: $70K
+Current MC: ${current}K"""
+
+
+def address(label: str) -> str:
+    """Deterministinis 44 simbolių base58 adresas"""
+    digest = hashlib.sha256(label.encode()).digest()
+    return ''.join(BASE58_ALPHABET[byte % 58] for byte in digest + digest[:12])
+
+
+def signal_message(name: str, symbol: str, deployer: str, holders, mc: str = '70K',
+                   strategy: str = 'Cobra Scan') -> str:
+    links = [f"{3.1 - i * 0.1:.1f}% (https://solscan.io/address/{holder})" for i, holder in enumerate(holders)]
+    return SIGNAL_TEMPLATE.format(
+        name=name, symbol=symbol, token_address=address(f"token-{name}"), mc=mc,
+        holders=' | '.join(links), deployer=deployer, strategy=strategy,
+    )
+
+
+def gains_message(symbol: str, gain: float) -> str:
+    return GAINS_TEMPLATE.format(symbol=symbol, gain=gain, current=f"{gain * 70:.1f}")
+
+
+def write_export(path, texts, start_id: int = 0, with_id: bool = True):
+    """Eksporto CSV: id (nebūtinas), date (kas minutę nuo start_id), from, text"""
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow((['id'] if with_id else []) + ['date', 'from', 'text'])
+        for offset, text in enumerate(texts):
+            message_id = start_id + offset
+            date = (start + timedelta(minutes=message_id)).isoformat(sep=' ')
+            writer.writerow(([message_id] if with_id else []) + [date, '0xBot', text])
@@ -0,0 +1,8 @@
+"""Bendri pytest fixture'ai: repo moduliai importuojami tiesiai (plokščia struktūra)"""
+
+import os
+import sys
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_DIR not in sys.path:
+    sys.path.insert(0, REPO_DIR)
@@ -0,0 +1,50 @@
+"""Lokalus JSON-RPC stub testams: atsakymai pagal metodą, batch palaikymas, įrašomi POST'ai"""
+
+import asyncio
+
+from aiohttp import web
+
+
+class StubRPC:
+    """aiohttp serveris 127.0.0.1 atsitiktiniame porte.
+
+    answer(method, params) grąžina 'result' arba kelia KeyError -> JSON-RPC error.
+    posts - kiekvieno POST kūnas (dict arba batch sąrašas) gavimo tvarka."""
+
+    def __init__(self, answer=None, delay: float = 0.0, status: int = 200):
+        self.answer = answer or (lambda method, params: {'slot': 1})
+        self.delay = delay
+        self.status = status
+        self.posts = []
+        self.url = None
+        self._runner = None
+
+    def _reply(self, request):
+        try:
+            return {'jsonrpc': '2.0', 'id': request['id'],
+                    'result': self.answer(request['method'], request.get('params'))}
+        except KeyError as e:
+            return {'jsonrpc': '2.0', 'id': request['id'],
+                    'error': {'code': -32602, 'message': f"unknown {e}"}}
+
+    async def _handler(self, request):
+        body = await request.json()
+        self.posts.append(body)
+        await asyncio.sleep(self.delay)
+        if self.status != 200:
+            return web.Response(status=self.status)
+        reply = [self._reply(item) for item in body] if isinstance(body, list) else self._reply(body)
+        return web.json_response(reply)
+
+    async def __aenter__(self):
+        app = web.Application(client_max_size=1 << 24)
+        app.router.add_post('/', self._handler)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, '127.0.0.1', 0)
+        await site.start()
+        self.url = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}/"
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self._runner.cleanup()
@@ -0,0 +1,105 @@
+import asyncio
+from collections import Counter
+
+import aiohttp
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.preprocessing import StandardScaler
+
+from chat_fixtures import address, signal_message
+from real_blockchain_analyzer import RealBlockchainAnalyzer
+from response_cache import ResponseCache
+from signal_analyzer import FEATURE_COLUMNS, TelegramSignalAnalyzer
+from wallet_intelligence_system import TOP_HOLDERS_ANALYZED, WalletIntelligenceSystem
+
+
+@pytest.fixture
+def fetches(monkeypatch):
+    """Deployer / holder analizės be tinklo; skaičiuoja, kiek kartų kiekvienas adresas analizuotas"""
+    calls = Counter()
+
+    async def deployer_transactions(self, deployer_address):
+        calls[deployer_address] += 1
+        await asyncio.sleep(0.01)
+        return []
+
+    async def single_holder(self, holder_address):
+        calls[holder_address] += 1
+        await asyncio.sleep(0.01)
+        return {'holder_address': holder_address, 'diamond_hands_score': 8, 'success_rate': 0.7}
+
+    monkeypatch.setattr(WalletIntelligenceSystem, '_get_deployer_transactions', deployer_transactions)
+    monkeypatch.setattr(WalletIntelligenceSystem, '_analyze_single_holder', single_holder)
+    return calls
+
+
+def _signals(count):
+    deployers = [address(f"deployer-{i}") for i in range(2)]
+    pool = [address(f"holder-{i}") for i in range(7)]
+    return [
+        signal_message(f"Token{i}", f"TK{i}", deployers[i % 2], [pool[(i + j) % 7] for j in range(6)])
+        for i in range(count)
+    ]
+
+
+def test_batch_analyzes_each_address_once(tmp_path, fetches):
+    messages = _signals(12)
+    cache = ResponseCache(str(tmp_path / 'http.db'), max_bytes=0)
+
+    async def main():
+        async with aiohttp.ClientSession() as session:
+            async with RealBlockchainAnalyzer(session=session, response_cache=cache) as analyzer:
+                return [r async for r in analyzer.analyze_signals_batch(messages)]
+
+    try:
+        results = asyncio.run(main())
+    finally:
+        cache.close()
+
+    assert sorted(index for index, _ in results) == list(range(12))
+    assert all(result['deployer_analysis'].get('track_record') for _, result in results)
+    assert all(result['wallet_intelligence']['total_holders'] == TOP_HOLDERS_ANALYZED for _, result in results)
+    # 2 deployeriai + 7 holderiai, kiekvienas analizuotas lygiai kartą
+    assert len(fetches) == 9
+    assert set(fetches.values()) == {1}
+
+
+def test_token_names_must_match_signals():
+    analyzer = TelegramSignalAnalyzer()
+
+    async def first():
+        return await analyzer.analyze_signals_batch(_signals(3), token_names=['A', 'B']).__anext__()
+
+    with pytest.raises(ValueError, match='token_names'):
+        asyncio.run(first())
+
+
+def test_batch_scoring_matches_per_signal_with_trained_model():
+    # Apmokytas modelis įdedamas tiesiogiai - batch kelias turi naudoti predict_proba, ne 0.25 fallback
+    rng = np.random.default_rng(8)
+    X = rng.uniform(0, 1, (300, len(FEATURE_COLUMNS)))
+    X[:, 0] *= 200_000
+    y = (X[:, 0] > 90_000).astype(int)
+    analyzer = TelegramSignalAnalyzer()
+    analyzer.scaler = StandardScaler().fit(X)
+    analyzer.ml_model = RandomForestClassifier(n_estimators=20, random_state=0).fit(analyzer.scaler.transform(X), y)
+    analyzer.feature_columns = FEATURE_COLUMNS
+    analyzer.trained = analyzer.loaded = True
+
+    messages = [signal_message(f"Token{i}", f"TK{i}", address(f"deployer-{i}"),
+                               [address(f"holder-{i}")], mc=f"{20 + i * 15}K") for i in range(12)]
+
+    async def batch():
+        return [r async for r in analyzer.analyze_signals_batch(messages, blockchain=False)]
+
+    results = dict(asyncio.run(batch()))
+    single = [analyzer.analyze_signal(message)['ml_prediction'] for message in messages]
+    batched = [results[i]['ml_prediction'] for i in range(len(messages))]
+    assert batched == single
+    assert all(prediction['model_available'] for prediction in batched)
+    features = [analyzer._extract_features(analyzer._parse_signal_text(message)) for message in messages]
+    rows = np.array([[f.get(column, 0) for column in FEATURE_COLUMNS] for f in features])
+    expected = analyzer.ml_model.predict_proba(analyzer.scaler.transform(rows))[:, 1]
+    np.testing.assert_allclose([prediction['success_probability'] for prediction in batched], expected)
+    assert len(set(expected)) > 1
@@ -0,0 +1,46 @@
+import pytest
+
+import dashboard_resources
+from realtime_signal_analyzer import RealtimeSignalAnalyzer
+
+
+@pytest.fixture
+def loads(tmp_path, monkeypatch):
+    """load_model_and_insights() be modelio: grąžina iš eilės nurodytus rezultatus"""
+    results = []
+    calls = []
+
+    def load(self):
+        calls.append(self.data_file)
+        return results.pop(0)
+
+    monkeypatch.setattr(RealtimeSignalAnalyzer, 'load_model_and_insights', load)
+    dashboard_resources.clear_resources()
+    yield results, calls, str(tmp_path / 'parsed.csv'), str(tmp_path / 'report.json')
+    dashboard_resources.clear_resources()
+
+
+def test_failed_analyzer_load_is_not_cached(loads):
+    results, calls, data_file, insights_file = loads
+    results.extend([False, True])
+
+    with pytest.raises(RuntimeError, match='could not be loaded'):
+        dashboard_resources.get_signal_analyzer(data_file, insights_file)
+    assert dashboard_resources.resources_info() == {}
+
+    # Be rankinio clear_resources(): kitas rerun bando įkelti iš naujo
+    analyzer = dashboard_resources.get_signal_analyzer(data_file, insights_file)
+    assert analyzer.data_file == data_file
+    assert dashboard_resources.get_signal_analyzer(data_file, insights_file) is analyzer
+    assert calls == [data_file, data_file]
+
+
+def test_analyzer_reloads_when_data_file_changes(loads, tmp_path):
+    results, calls, data_file, insights_file = loads
+    results.extend([True, True])
+
+    first = dashboard_resources.get_signal_analyzer(data_file, insights_file)
+    (tmp_path / 'parsed.csv').write_text('token_name\n')
+    second = dashboard_resources.get_signal_analyzer(data_file, insights_file)
+    assert second is not first
+    assert len(calls) == 2
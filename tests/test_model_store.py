@@ -0,0 +1,61 @@
+import os
+
+from model_store import ARTIFACT_VERSION, FEATURE_CODE_FILES, ModelArtifactStore
+
+
+def _store(tmp_path, source):
+    return ModelArtifactStore('analyzer', str(tmp_path / 'models'), code_files=[str(source)])
+
+
+def test_artifact_reused_while_data_and_code_unchanged(tmp_path):
+    data = tmp_path / 'signals.csv'
+    data.write_text('a,b\n1,2\n')
+    source = tmp_path / 'analyzer.py'
+    source.write_text('FEATURES = ["a"]\n')
+
+    path = _store(tmp_path, source).save(str(data), 'model', 'scaler', ['a'])
+    assert path.endswith(f'.v{ARTIFACT_VERSION}.pkl')
+
+    artifact = _store(tmp_path, source).load(str(data))
+    assert artifact['model'] == 'model'
+    assert artifact['feature_columns'] == ['a']
+
+
+def test_data_change_invalidates_artifact(tmp_path):
+    data = tmp_path / 'signals.csv'
+    data.write_text('a,b\n1,2\n')
+    source = tmp_path / 'analyzer.py'
+    source.write_text('FEATURES = ["a"]\n')
+    _store(tmp_path, source).save(str(data), 'model', 'scaler', ['a'])
+
+    data.write_text('a,b\n1,3\n')
+    assert _store(tmp_path, source).load(str(data)) is None
+
+
+def test_feature_code_change_invalidates_artifact(tmp_path):
+    data = tmp_path / 'signals.csv'
+    data.write_text('a,b\n1,2\n')
+    source = tmp_path / 'analyzer.py'
+    source.write_text('FEATURES = ["a"]\n')
+    _store(tmp_path, source).save(str(data), 'model', 'scaler', ['a'])
+
+    source.write_text('FEATURES = ["a", "b"]\n')
+    assert _store(tmp_path, source).load(str(data)) is None
+
+
+def test_feature_engineering_modules_are_fingerprinted():
+    names = {os.path.basename(path) for path in FEATURE_CODE_FILES}
+    assert {'feature_engineering.py', 'signal_store.py'} <= names
+    assert all(os.path.exists(path) for path in FEATURE_CODE_FILES)
+
+
+def test_feature_column_change_invalidates_artifact(tmp_path):
+    data = tmp_path / 'signals.csv'
+    data.write_text('a,b\n1,2\n')
+    source = tmp_path / 'analyzer.py'
+    source.write_text('FEATURES = ["a"]\n')
+    _store(tmp_path, source).save(str(data), 'model', 'scaler', ['a', 'b'])
+
+    assert _store(tmp_path, source).load(str(data), ['a', 'b'])['model'] == 'model'
+    assert _store(tmp_path, source).load(str(data), ['b', 'a']) is None
+    assert _store(tmp_path, source).load(str(data), ['a']) is None
@@ -0,0 +1,64 @@
+import asyncio
+
+import aiohttp
+from aiohttp import web
+
+import rate_limiter
+from real_blockchain_analyzer import RealBlockchainAnalyzer
+from rate_limiter import host_limiter
+from response_cache import ResponseCache
+from wallet_intelligence_system import WalletIntelligenceSystem
+
+
+def test_host_limiter_is_shared_per_host_and_loop():
+    async def buckets():
+        return (host_limiter('https://public-api.solscan.io/account/transactions'),
+                host_limiter('https://public-api.solscan.io/token/holders'),
+                host_limiter('https://api.dexscreener.com/latest/dex/tokens/x'))
+
+    first = asyncio.run(buckets())
+    assert first[0] is first[1]
+    assert first[0] is not first[2]
+    assert (first[0].rate, first[0].capacity) == rate_limiter.HOST_LIMITS['public-api.solscan.io']
+    # Kitas event loop - savi bucket'ai (asyncio.Lock pririštas prie loop)
+    assert asyncio.run(buckets())[0] is not first[0]
+
+
+def test_concurrent_signals_share_one_api_limit(tmp_path, monkeypatch):
+    # 10 užklausų/s, burst 1: 5 užklausos iš trijų objektų trunka >= 0.4s tik su bendru bucket'u
+    monkeypatch.setattr(rate_limiter, 'DEFAULT_HOST_LIMIT', (10.0, 1))
+    cache = ResponseCache(str(tmp_path / 'http.db'), max_bytes=0)
+
+    async def handler(request):
+        return web.json_response({'path': request.path})
+
+    async def main():
+        app = web.Application()
+        app.router.add_get('/{tail:.*}', handler)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        base_url = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+        try:
+            async with aiohttp.ClientSession() as session:
+                # Kaip kvietėjai, kurie kiekvienam signalui kuria naują objektą
+                intels = [WalletIntelligenceSystem(session=session, response_cache=cache) for _ in range(2)]
+                analyzer = RealBlockchainAnalyzer(session=session, response_cache=cache)
+                loop = asyncio.get_running_loop()
+                start = loop.time()
+                results = await asyncio.gather(
+                    intels[0]._fetch_json(f"{base_url}/a"), intels[0]._fetch_json(f"{base_url}/b"),
+                    intels[1]._fetch_json(f"{base_url}/c"), intels[1]._fetch_json(f"{base_url}/d"),
+                    analyzer._fetch_json(f"{base_url}/dex/e"),
+                )
+                return results, loop.time() - start
+        finally:
+            await runner.cleanup()
+
+    try:
+        results, elapsed = asyncio.run(main())
+    finally:
+        cache.close()
+    assert [r['path'] for r in results] == ['/a', '/b', '/c', '/d', '/dex/e']
+    assert elapsed >= 0.38
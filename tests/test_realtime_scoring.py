@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+
+from chat_fixtures import address, signal_message
+from realtime_signal_analyzer import FEATURE_COLUMNS, RealtimeSignalAnalyzer
+
+# Modelis apmokomas su DataFrame (kaip load_model_and_insights), vertinamas NumPy matrica
+pytestmark = pytest.mark.filterwarnings('ignore:X does not have valid feature names')
+
+
+@pytest.fixture
+def analyzer():
+    """Analizatorius su mažu miško modeliu, apmokytu sintetiniais feature'ais"""
+    rng = np.random.default_rng(3)
+    X = pd.DataFrame(rng.uniform(0, 200_000, (400, len(FEATURE_COLUMNS))), columns=FEATURE_COLUMNS)
+    y = (X['initial_mc_value'] + rng.normal(0, 40_000, 400) > 100_000).astype(int)
+    analyzer = RealtimeSignalAnalyzer()
+    analyzer.ml_model = RandomForestClassifier(n_estimators=25, random_state=0).fit(X, y)
+    analyzer.feature_columns = FEATURE_COLUMNS
+    analyzer.trained = True
+    return analyzer
+
+
+def _messages(count):
+    return [signal_message(f"Token{i}", f"TK{i}", address(f"deployer-{i}"),
+                           [address(f"holder-{i + j}") for j in range(5)], mc=f"{40 + i * 9}K")
+            for i in range(count)]
+
+
+def test_feature_matrix_is_preallocated_float32(analyzer):
+    signals = [analyzer.parse_signal_message(message) for message in _messages(3)]
+    signals[0]['initial_lp_sol'] = float('nan')
+    X = analyzer._feature_matrix(signals)
+    assert X.dtype == np.float32 and X.flags['C_CONTIGUOUS']
+    assert X.shape == (3, len(FEATURE_COLUMNS))
+    assert X[0, FEATURE_COLUMNS.index('initial_lp_sol')] == 0.0
+
+
+def test_scores_match_dataframe_predict_proba(analyzer):
+    messages = _messages(20)
+    signals = [analyzer.parse_signal_message(message) for message in messages]
+    # Ankstesnis kelias: DataFrame pipeline + fillna(0) + predict_proba
+    df = analyzer._engineer_features(pd.DataFrame(signals))
+    expected = analyzer.ml_model.predict_proba(df[FEATURE_COLUMNS].fillna(0))[:, 1]
+
+    success_probs, predictions = analyzer._score(analyzer._feature_matrix(signals))
+    np.testing.assert_allclose(success_probs, expected)
+    assert list(predictions) == list((expected > 0.5).astype(int))
+
+    batch = analyzer.analyze_signals(messages)
+    single = [analyzer.analyze_signal(message) for message in messages]
+    for analysis, result, prob in zip(batch, single, expected):
+        assert analysis['ml_prediction'] == result['ml_prediction']
+        assert analysis['ml_prediction']['success_probability'] == round(prob * 100, 1)
@@ -0,0 +1,120 @@
+import asyncio
+import os
+import threading
+
+import response_cache
+from response_cache import ResponseCache
+
+URL = 'https://api.example/token/holders'
+
+
+def _body(i):
+    return {'holder': i, 'padding': 'x' * 80}
+
+
+def test_size_limit_holds_across_processes(tmp_path):
+    # Du ResponseCache tam pačiam failui - kaip du procesai
+    db_file = str(tmp_path / 'http.db')
+    first = ResponseCache(db_file, max_bytes=1000)
+    second = ResponseCache(db_file, max_bytes=1000)
+    try:
+        # Kiekvienas procesas atskirai įrašo mažiau nei max_bytes, kartu - daugiau
+        for i in range(16):
+            (first if i < 8 else second).put(URL, {'page': i}, _body(i))
+        for cache in (first, second):
+            assert cache.stats()['total_bytes'] <= 1000
+        assert second.evictions > 0
+        # Išmesti seniausi, naujausias liko
+        assert first.get(URL, {'page': 0}) is None
+        assert first.get(URL, {'page': 15}) == _body(15)
+    finally:
+        first.close()
+        second.close()
+
+
+def test_async_access_runs_off_the_event_loop(tmp_path):
+    cache = ResponseCache(str(tmp_path / 'http.db'))
+    threads = []
+    original_get = cache.get
+
+    def spy_get(*args):
+        threads.append(threading.current_thread())
+        return original_get(*args)
+
+    cache.get = spy_get
+
+    async def main():
+        await cache.aput(URL, {'page': 1}, _body(1))
+        return await cache.aget(URL, {'page': 1}), await cache.aget(URL, {'page': 2})
+
+    try:
+        assert asyncio.run(main()) == (_body(1), None)
+    finally:
+        cache.close()
+    assert threads and threading.main_thread() not in threads
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_expired_entries_are_misses(tmp_path):
+    cache = ResponseCache(str(tmp_path / 'http.db'), ttls={'/token/holders': 0.05})
+    try:
+        cache.put(URL, None, _body(1))
+        assert cache.get(URL) == _body(1)
+        threading.Event().wait(0.1)
+        assert cache.get(URL) is None
+        assert cache.expirations == 1
+        assert cache.stats()['total_bytes'] == 0
+    finally:
+        cache.close()
+
+
+def _sum_of_sizes(cache):
+    return cache._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+
+def test_running_total_matches_stored_sizes(tmp_path):
+    cache = ResponseCache(str(tmp_path / 'http.db'), max_bytes=500)
+    try:
+        for i in range(12):
+            cache.put(URL, {'page': i % 9}, _body(i) if i % 2 else {'holder': i})  # Su perrašymais
+        assert cache.evictions > 0
+        cache.get(URL, {'page': 8})
+        assert cache.stats()['total_bytes'] == _sum_of_sizes(cache) <= 500
+        cache.clear()
+        assert cache.stats()['total_bytes'] == 0
+    finally:
+        cache.close()
+
+
+def test_hits_do_not_write_until_flushed(tmp_path):
+    cache = ResponseCache(str(tmp_path / 'http.db'), max_bytes=300)
+    try:
+        cache.put(URL, {'page': 0}, _body(0))
+        cache.put(URL, {'page': 1}, _body(1))
+        changes = cache._conn.total_changes
+        assert cache.get(URL, {'page': 0}) == _body(0)
+        assert cache._conn.total_changes == changes
+        # Kitas put() įrašo sukauptą LRU laiką: išmetamas page 1, ne ką tik naudotas page 0
+        cache.put(URL, {'page': 2}, _body(2))
+        assert cache.get(URL, {'page': 0}) == _body(0)
+        assert cache.get(URL, {'page': 1}) is None
+    finally:
+        cache.close()
+
+
+def test_database_is_opened_on_first_use(tmp_path):
+    db_file = tmp_path / 'data' / 'http.db'
+    cache = ResponseCache(str(db_file))
+    assert not db_file.exists()
+    try:
+        assert cache.get(URL) is None
+        assert db_file.exists()
+    finally:
+        cache.close()
+
+
+def test_default_cache_file_does_not_depend_on_working_directory(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    assert os.path.dirname(response_cache.DEFAULT_CACHE_FILE) == os.path.dirname(os.path.abspath(response_cache.__file__))
+    ResponseCache().close()
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,97 @@
+import asyncio
+
+import aiohttp
+import pytest
+
+from rpc_client import RPCError, SolanaRPCClient
+from rpc_stub import StubRPC
+
+
+def _run(scenario):
+    async def main():
+        async with aiohttp.ClientSession() as session:
+            return await scenario(session)
+    return asyncio.run(main())
+
+
+def test_failover_skips_down_endpoint():
+    async def scenario(session):
+        async with StubRPC(status=503) as down, StubRPC() as up:
+            rpc = SolanaRPCClient([down.url, up.url], session=session, hedge=False, backoff=0)
+            assert await rpc.call('getSlot') == {'slot': 1}
+            assert await rpc.call('getSlot') == {'slot': 1}
+            return rpc, len(down.posts), len(up.posts)
+
+    rpc, down_posts, up_posts = _run(scenario)
+    # Vienas retry, po jo nukritęs endpoint'as eina į eilės galą
+    assert (down_posts, up_posts) == (1, 2)
+    assert rpc.stats.retries == 1
+    assert [e['url'] for e in rpc.health_report()][-1] == rpc.endpoints[0].url
+    assert rpc.endpoints[0].cooling_down
+
+
+def test_all_endpoints_down_raises():
+    async def scenario(session):
+        async with StubRPC(status=500) as first, StubRPC(status=502) as second:
+            rpc = SolanaRPCClient([first.url, second.url], session=session, hedge=False,
+                                  backoff=0, max_attempts=3)
+            with pytest.raises(RPCError, match='failed on all endpoints'):
+                await rpc.call('getSlot')
+            return len(first.posts) + len(second.posts)
+
+    assert _run(scenario) == 3
+
+
+def test_jsonrpc_error_is_not_retried():
+    def answer(method, params):
+        return {'getSlot': 7}[method]
+
+    async def scenario(session):
+        async with StubRPC(answer) as stub:
+            rpc = SolanaRPCClient([stub.url], session=session, backoff=0)
+            with pytest.raises(RPCError, match='getBalance'):
+                await rpc.call('getBalance', ['x'])
+            return rpc, len(stub.posts)
+
+    rpc, posts = _run(scenario)
+    assert posts == 1
+    assert rpc.stats.retries == 0
+
+
+def test_call_batch_chunks_and_keeps_order():
+    def answer(method, params):
+        if params == ['bad']:
+            raise KeyError(params[0])
+        return f"{method}:{params[0]}"
+
+    requests = [('getBalance', [str(i)]) for i in range(7)]
+    requests[4] = ('getBalance', ['bad'])
+
+    async def scenario(session):
+        async with StubRPC(answer) as stub:
+            rpc = SolanaRPCClient([stub.url], session=session, max_batch_size=3)
+            return rpc, stub.posts, await rpc.call_batch(requests)
+
+    rpc, posts, results = _run(scenario)
+    assert [len(body) for body in posts] == [3, 3, 1]
+    assert rpc.stats.calls == 3
+    assert rpc.stats.batched_calls == 7
+    assert isinstance(results[4], RPCError)
+    assert [r for i, r in enumerate(results) if i != 4] == [f"getBalance:{i}" for i in (0, 1, 2, 3, 5, 6)]
+
+
+def test_hedged_request_wins_over_slow_primary():
+    async def scenario(session):
+        async with StubRPC(delay=1.0) as slow, StubRPC() as fast:
+            rpc = SolanaRPCClient([slow.url, fast.url], session=session, timeout=0.4, min_hedge_delay=0.05)
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            result = await rpc.call('getSlot')
+            return rpc, result, loop.time() - start
+
+    rpc, result, elapsed = _run(scenario)
+    assert result == {'slot': 1}
+    assert elapsed < 0.5
+    assert (rpc.stats.hedges, rpc.stats.hedge_wins) == (1, 1)
+    # Atšauktas lėtasis užklausimas nelaikomas endpoint'o klaida
+    assert rpc.endpoints[0].failures == 0
@@ -0,0 +1,120 @@
+import json
+import os
+import socket
+import stat
+import subprocess
+import sys
+import time
+
+import pytest
+
+import scoring_daemon
+from conftest import REPO_DIR
+from scoring_daemon import DaemonError, DaemonUnavailable, ScoringDaemon, call, daemon_available
+
+# Daemon be modelio: load() tik skaičiuoja užkrovimus, stebimas vienas failas (argv[2])
+DAEMON_SCRIPT = """
+import sys
+import scoring_daemon
+
+def load(self):
+    self.loads = getattr(self, 'loads', 0) + 1
+    self.loaded_state = self.state_key()
+
+scoring_daemon.ScoringDaemon.load = load
+scoring_daemon.ScoringDaemon.watched_files = lambda self: [sys.argv[2]]
+daemon = scoring_daemon.ScoringDaemon(sys.argv[1])
+daemon.actions['loads'] = lambda: daemon.loads
+daemon.actions['echo'] = lambda text: print(text) or text
+daemon.serve()
+"""
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    socket_path = str(tmp_path / 'run' / 'scoring.sock')
+    watched = tmp_path / 'model.pkl'
+    watched.write_bytes(b'v1')
+    env = dict(os.environ, PYTHONPATH=REPO_DIR)
+    process = subprocess.Popen([sys.executable, '-c', DAEMON_SCRIPT, socket_path, str(watched)],
+                               cwd=tmp_path, env=env, stdout=subprocess.DEVNULL)
+    deadline = time.monotonic() + 10
+    while not daemon_available(socket_path):
+        assert process.poll() is None, "daemon exited"
+        assert time.monotonic() < deadline, "daemon did not start"
+        time.sleep(0.05)
+    yield socket_path, watched
+    if daemon_available(socket_path):
+        call('shutdown', socket_path=socket_path)
+    process.wait(timeout=10)
+
+
+def test_request_response_and_output(daemon, capsys):
+    socket_path, _ = daemon
+    assert call('echo', socket_path=socket_path, text='labas') == 'labas'
+    assert capsys.readouterr().out == 'labas\n'
+
+    status = call('ping', socket_path=socket_path)
+    assert status['requests'] == 3  # daemon_available ping + echo + šis
+
+    with pytest.raises(DaemonError, match='unknown action'):
+        call('nope', socket_path=socket_path)
+
+
+def test_invalid_json_is_answered(daemon):
+    socket_path, _ = daemon
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        sock.sendall(b'{not json\n')
+        response = json.loads(sock.makefile('rb').readline())
+    assert response['ok'] is False
+    assert 'invalid JSON' in response['error']
+
+
+def test_socket_is_private_from_bind(daemon):
+    socket_path, _ = daemon
+    assert stat.S_IMODE(os.stat(socket_path).st_mode) == 0o600
+
+
+def test_reloads_when_watched_file_changes(daemon):
+    socket_path, watched = daemon
+    assert call('loads', socket_path=socket_path) == 1
+    assert call('loads', socket_path=socket_path) == 1
+
+    watched.write_bytes(b'retrained')
+    assert call('loads', socket_path=socket_path) == 2
+
+    call('reload', socket_path=socket_path)
+    assert call('loads', socket_path=socket_path) == 3
+
+
+def test_shutdown_removes_socket(daemon):
+    socket_path, _ = daemon
+    assert call('shutdown', socket_path=socket_path) == {'stopping': True}
+    deadline = time.monotonic() + 10
+    while os.path.exists(socket_path) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert not os.path.exists(socket_path)
+    with pytest.raises(DaemonUnavailable):
+        call('ping', socket_path=socket_path)
+
+
+def test_client_refuses_socket_of_other_user(tmp_path, monkeypatch):
+    path = tmp_path / 'scoring.sock'
+    path.touch()
+    monkeypatch.setattr(scoring_daemon, '_uid', lambda: os.stat(path).st_uid + 1)
+    with pytest.raises(DaemonUnavailable, match='belongs to uid'):
+        call('ping', socket_path=str(path))
+
+
+def test_private_socket_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv('XDG_RUNTIME_DIR', str(tmp_path))
+    directory = scoring_daemon.private_socket_dir()
+    assert directory == str(tmp_path / '0xbot')
+
+    ScoringDaemon(os.path.join(directory, 'scoring.sock'))._claim_socket()
+    assert stat.S_IMODE(os.stat(directory).st_mode) == 0o700
+
+    os.chmod(directory, 0o755)
+    with pytest.raises(RuntimeError, match='0700'):
+        ScoringDaemon(os.path.join(directory, 'scoring.sock'))._claim_socket()
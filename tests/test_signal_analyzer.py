@@ -0,0 +1,76 @@
+import json
+import random
+
+import pandas as pd
+import pytest
+
+from chat_fixtures import address, signal_message
+from signal_analyzer import FEATURE_COLUMNS, TelegramSignalAnalyzer
+
+
+def _write_history(path, rows=300):
+    """parsed_telegram_data.csv su tais pačiais stulpeliais kaip TelegramDataParser išvestis"""
+    rng = random.Random(4)
+    records = []
+    for i in range(rows):
+        mc = rng.uniform(40, 160)
+        records.append({
+            'date': f"2025-05-{1 + i % 28:02d} {i % 24:02d}:15:00+00:00", 'type': 'signal',
+            'token_name': f"Token{i}", 'token_symbol': f"TK{i}", 'supply': '1000M',
+            'initial_mc': f"{mc:.2f}K", 'call_mc': f"{mc:.2f}K", 'initial_lp_sol': 85.0,
+            'lp_tokens_percent': 20.0, 'top_holders_percent': round(rng.uniform(10, 40), 1),
+            'wallet_percentages': '[]', 'freeze_disabled': True, 'mint_disabled': i % 3 != 0,
+            'lp_burned': i % 2 == 0, 'has_website': False, 'has_twitter': False, 'has_telegram': False,
+            'strategy': rng.choice(['Cobra Scan', 'Viper Vision', 'Eagle Eye']),
+            'hour_of_day': i % 24, 'day_of_week': 0,
+            # Didesnis MC -> dažniau 5x, kad modelis turėtų ką išmokti
+            'max_gain': (8.0 if mc > 100 else 1.5) if i % 7 else None, 'gains_count': 1.0,
+        })
+    pd.DataFrame(records).to_csv(path, index=False)
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """Darbinis katalogas su istorija ir advanced_ml_report.json (models/ kuriamas čia)"""
+    monkeypatch.chdir(tmp_path)
+    _write_history(tmp_path / 'parsed_telegram_data.csv')
+    (tmp_path / 'advanced_ml_report.json').write_text(json.dumps({'insights': {}}))
+    return tmp_path
+
+
+def _message(i):
+    return signal_message(f"Moon{i}", f"MN{i}", address(f"deployer-{i}"),
+                          [address(f"holder-{i}-{j}") for j in range(3)], mc=f"{50 + i * 20}K")
+
+
+def test_trains_saves_and_reloads_artifact(workdir, capsys):
+    first = TelegramSignalAnalyzer()
+    assert first.load_model()
+    assert first.trained
+    assert first.feature_columns == FEATURE_COLUMNS
+    assert 'Model trained on' in capsys.readouterr().out
+    assert (workdir / first.model_store.path).exists()
+
+    second = TelegramSignalAnalyzer()
+    assert second.load_model()
+    assert f"Model loaded from {second.model_store.path}" in capsys.readouterr().out
+    assert second.feature_columns == FEATURE_COLUMNS
+
+    message = _message(3)
+    assert (first.analyze_signal(message)['ml_prediction']['success_probability']
+            == second.analyze_signal(message)['ml_prediction']['success_probability'])
+    assert second.analyze_signal(message)['ml_prediction']['model_available']
+
+
+def test_artifact_with_other_feature_columns_is_retrained(workdir, capsys):
+    analyzer = TelegramSignalAnalyzer()
+    analyzer.load_model()
+    artifact = analyzer.model_store.load(analyzer.data_file)
+    analyzer.model_store.save(analyzer.data_file, artifact['model'], artifact['scaler'], FEATURE_COLUMNS[:-1])
+    capsys.readouterr()
+
+    reloaded = TelegramSignalAnalyzer()
+    assert reloaded.load_model()
+    out = capsys.readouterr().out
+    assert 'Feature columns changed' in out and 'Model trained on' in out
+    assert reloaded.feature_columns == FEATURE_COLUMNS
@@ -0,0 +1,98 @@
+import re
+
+import pytest
+
+from chat_fixtures import address, gains_message, signal_message
+from signal_parser import EMPTY_SIGNAL, parse_signal, parse_signal_uncached
+from telegram_analyzer import CoinMatcher, TelegramCoinAnalyzer
+
+DEPLOYER = address('deployer')
+HOLDERS = [address(f"holder-{i}") for i in range(3)]
+
+
+def test_full_0xbot_signal():
+    signal = parse_signal(signal_message('Moon Cat', 'MCAT', DEPLOYER, HOLDERS, mc='52.3K',
+                                         strategy='Tiger Trace 2'))
+    assert (signal.token_name, signal.token_symbol, signal.platform) == ('Moon Cat', 'MCAT', 'Pump.Fun💊')
+    assert signal.token_address == address('token-Moon Cat')
+    assert (signal.supply, signal.initial_mc, signal.call_mc, signal.mc) == ('1000M', '52.3K', '52.3K', '52.3K')
+    assert (signal.initial_lp_sol, signal.call_liquidity_sol, signal.lp_tokens_percent) == (85.0, 85.0, 20.0)
+    assert signal.top_holders_percent == 21.5
+    assert signal.holder_addresses == HOLDERS
+    assert signal.wallet_percentages == [3.1, 3.0, 2.9]
+    assert signal.deployer_address == DEPLOYER
+    assert (signal.freeze_disabled, signal.mint_disabled, signal.lp_burned) == (True, True, False)
+    assert signal.strategy == 'Tiger Trace 2'
+    assert not signal.is_gains_update
+
+
+def test_short_viper_format_with_inline_labels():
+    token = address('viper-token')
+    text = (f"🔍 Viper Vision spotted $DOGE2\n"
+            f"CA: {token}\n"
+            f"MC: $52K | 💧 Liquidity: $1.2K\n"
+            f"LP: 12.5 SOL (Burned)\n"
+            f"Free/Mint: ✅/❌\n"
+            f"SOCIALS: WEB (https://doge.example) | TG (https://t.me/doge)")
+    signal = parse_signal(text)
+    assert signal.strategy == 'Viper Vision'
+    assert signal.token_symbol == 'DOGE2'
+    assert signal.token_address == token
+    assert (signal.market_cap, signal.liquidity, signal.mc) == ('52K', '1.2K', '52K')
+    assert (signal.initial_lp_sol, signal.lp_burned) == (12.5, True)
+    assert (signal.freeze_disabled, signal.mint_disabled) == (True, False)
+    assert (signal.has_website, signal.has_twitter, signal.has_telegram) == (True, False, True)
+
+
+def test_gains_update():
+    signal = parse_signal(gains_message('MCAT', 5.2))
+    assert signal.is_gains_update
+    assert (signal.gains_token, signal.gain_multiplier) == ('MCAT', 5.2)
+    assert (signal.call_mc, signal.current_mc) == ('70K', '364.0K')
+
+
+def test_token_address_on_the_next_line_without_emoji():
+    token = address('next-line')
+    signal = parse_signal(f"Token Address:\n`{token}`\nStrategy: Eagle Eye")
+    assert signal.token_address == token
+    assert signal.strategy == 'Eagle Eye'
+
+
+def test_empty_and_non_text_input():
+    assert parse_signal('') is EMPTY_SIGNAL
+    assert parse_signal(None) is EMPTY_SIGNAL
+    assert parse_signal(float('nan')) is EMPTY_SIGNAL
+    assert parse_signal('gm everyone') == EMPTY_SIGNAL
+
+
+def test_results_are_cached_by_text():
+    text = signal_message('Cached', 'CCH', DEPLOYER, HOLDERS)
+    assert parse_signal(text) is parse_signal(text)
+    assert parse_signal(text) == parse_signal_uncached(text)
+
+
+BASELINE_COIN_GAINS = re.compile(r'(\w+)\s+gains\s+🚀\s+([0-9]+\.?[0-9]*)x\s+🚀')  # Senasis TelegramCoinAnalyzer
+
+
+@pytest.mark.parametrize('symbol', ['früg', 'RAT²', 'Nu_Pepe', 'ПЕПЕ', 'MCAT', 'tk9'])
+def test_gains_token_matches_baseline_for_unicode_symbols(symbol):
+    text = gains_message(symbol, 3)
+    signal = parse_signal(text)
+    assert signal.gains_token == symbol
+    assert signal.gains_token == BASELINE_COIN_GAINS.search(text).group(1)
+    assert TelegramCoinAnalyzer().extract_coin_gains(text) == (symbol, 3.0)
+
+
+def test_cashtag_gains_token_keeps_baseline_name():
+    assert TelegramCoinAnalyzer().extract_coin_gains(gains_message('$früg', 2)) == ('früg', 2.0)
+
+
+def test_coin_matcher_uses_whole_unicode_words():
+    matcher = CoinMatcher()
+    for coin in ('früg', 'RAT²', 'Nu_Pepe'):
+        matcher.add(coin)
+    assert matcher.first_match('anyone aped früg?') == 'früg'
+    assert matcher.first_match('rat² to the moon') == 'RAT²'
+    assert matcher.first_match('nu_pepe chart') == 'Nu_Pepe'
+    # Sutrumpintas 'g' nebeįrašomas, todėl nesusijusios žinutės jam nepriskiriamos
+    assert matcher.first_match('gm degens') is None
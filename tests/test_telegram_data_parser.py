@@ -0,0 +1,149 @@
+import pytest
+
+import telegram_data_parser
+from chat_fixtures import address, gains_message, signal_message, write_export
+from telegram_data_parser import MIN_SHARD_ROWS, SHARDS_PER_WORKER, TelegramDataParser, shard_rows
+
+
+def _texts(signals):
+    """Signalai, po kiekvieno - gains update ankstesniam ir pokalbio žinutė"""
+    texts = []
+    for i in range(signals):
+        texts.append(signal_message(f"Token{i}", f"TK{i}", address(f"deployer-{i % 3}"),
+                                    [address(f"holder-{(i + j) % 9}") for j in range(5)], mc=f"{60 + i}K"))
+        if i:
+            texts.append(gains_message(f"TK{i - 1}", 2 + i % 5))
+        texts.append(f"gm TK{i} holders")
+    return texts
+
+
+def _parse(path, workers):
+    parser = TelegramDataParser()
+    assert parser.load_raw_data(str(path))
+    return parser.parse_signals(workers=workers)
+
+
+def test_shard_rows_gives_several_shards_per_worker():
+    assert shard_rows(200_000, 4) == 200_000 // (4 * SHARDS_PER_WORKER)
+    assert shard_rows(100, 4) == MIN_SHARD_ROWS
+    assert shard_rows(10_000_000, 2) == telegram_data_parser.CHUNK_SIZE
+
+
+def test_parallel_parse_matches_serial_across_shards(tmp_path, monkeypatch):
+    path = tmp_path / 'export.csv'
+    write_export(path, _texts(60))
+    # 179 eilučių eksportas -> 2 workeriai x 4 = 8 shard'ai
+    monkeypatch.setattr(telegram_data_parser, 'MIN_SHARD_ROWS', 1)
+    shards = []
+    original = telegram_data_parser.iter_chat_chunks
+
+    def spy(*args, **kwargs):
+        for shard in original(*args, **kwargs):
+            shards.append(len(shard))
+            yield shard
+
+    monkeypatch.setattr(telegram_data_parser, 'iter_chat_chunks', spy)
+    parallel = _parse(path, workers=2)
+    assert len(shards) == 2 * SHARDS_PER_WORKER
+
+    serial = _parse(path, workers=1)
+    assert parallel == serial
+    assert len(serial) == 60
+
+
+def _run(export, output, incremental=True):
+    """Vienas parser paleidimas kaip main(): parse, išsaugojimas ir checkpoint"""
+    parser = TelegramDataParser()
+    assert parser.load_raw_data(str(export))
+    signals = parser.parse_incremental(str(output)) if incremental else parser.parse_signals()
+    parser.save_parsed_data(str(output))
+    parser.save_checkpoint(str(output))
+    return signals
+
+
+@pytest.fixture
+def resumed(tmp_path, monkeypatch):
+    """Eksportas suparsintas su checkpoint'u; starts - iter_chat_chunks start poslinkiai"""
+    texts = _texts(40)
+    export = tmp_path / 'export.csv'
+    write_export(export, texts[:70])
+    _run(export, tmp_path / 'parsed.csv', incremental=False)
+
+    starts = []
+    original = telegram_data_parser.iter_chat_chunks
+
+    def spy(*args, start=0, **kwargs):
+        starts.append(start)
+        return original(*args, start=start, **kwargs)
+
+    monkeypatch.setattr(telegram_data_parser, 'iter_chat_chunks', spy)
+    return texts, export, starts
+
+
+def test_resume_reads_only_appended_rows(tmp_path, resumed, capsys):
+    texts, export, starts = resumed
+    parsed_size = export.stat().st_size
+    write_export(export, texts)
+
+    signals = _run(export, tmp_path / 'parsed.csv')
+    assert starts == [parsed_size]
+    assert 'PARSING MESSAGES SINCE LAST RUN' in capsys.readouterr().out
+    assert signals == _parse(export, workers=1)
+
+    # Antras paleidimas be naujų eilučių nieko neskaito
+    starts.clear()
+    assert _run(export, tmp_path / 'parsed.csv') == signals
+    assert starts == [export.stat().st_size]
+
+
+def test_checkpoint_from_other_export_is_not_applied(tmp_path, resumed, capsys):
+    texts, _, starts = resumed
+    other = tmp_path / 'other_export.csv'
+    write_export(other, texts)
+
+    signals = _run(other, tmp_path / 'parsed.csv')
+    assert 'Checkpoint was made for' in capsys.readouterr().out
+    assert starts == [0]
+    assert signals == _parse(other, workers=1)
+
+
+def test_edited_history_forces_full_reparse(tmp_path, resumed, capsys):
+    texts, export, starts = resumed
+    edited = list(texts)
+    edited[0] = edited[0].replace('Token0', 'Tokex0')
+    write_export(export, edited)
+
+    signals = _run(export, tmp_path / 'parsed.csv')
+    assert 'Export changed before the checkpoint' in capsys.readouterr().out
+    assert starts == [0]
+    assert signals[0]['token_name'] == 'Tokex0'
+    assert signals == _parse(export, workers=1)
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_rows_appended_during_parse_are_parsed_once(tmp_path, monkeypatch, workers):
+    texts = _texts(40)
+    export = tmp_path / 'export.csv'
+    write_export(export, texts[:70])
+    original = telegram_data_parser.iter_chat_chunks
+    appended = []
+
+    def append_then_read(*args, **kwargs):
+        # Eksportas papildomas, kai dydis jau užfiksuotas, bet skaitymas dar neprasidėjo
+        if not appended:
+            appended.append(export.stat().st_size)
+            write_export(export, texts)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(telegram_data_parser, 'iter_chat_chunks', append_then_read)
+    parser = TelegramDataParser()
+    assert parser.load_raw_data(str(export))
+    first = parser.parse_signals(workers=workers)
+    assert parser.raw_size == appended[0]
+    assert [s['token_symbol'] for s in first] == [f"TK{i}" for i in range(24)]
+    parser.save_parsed_data(str(tmp_path / 'parsed.csv'))
+    parser.save_checkpoint(str(tmp_path / 'parsed.csv'))
+
+    signals = _run(export, tmp_path / 'parsed.csv')
+    assert [s['token_symbol'] for s in signals] == [f"TK{i}" for i in range(40)]
+    assert signals == _parse(export, workers=1)
@@ -0,0 +1,75 @@
+import asyncio
+import base64
+import hashlib
+import struct
+
+import aiohttp
+import pytest
+
+from enhanced_signal_processor import EnhancedSignalProcessor
+from rpc_client import SolanaRPCClient
+from rpc_stub import StubRPC
+from spl_token import base58_encode, parse_compact_accounts
+
+DECIMALS = 6
+MINTS = ['MintKnownDecimals111111111111111111111111111', 'MintSupplyFails1111111111111111111111111111']
+AMOUNTS = [5_000_000, 250_000_000, 0, 1_500_000]
+
+
+def _owner(i):
+    return hashlib.sha256(f"owner-{i}".encode()).digest()
+
+
+def _account(mint, i, amount, compact):
+    if compact:
+        data = [base64.b64encode(_owner(i) + struct.pack('<Q', amount)).decode(), 'base64']
+    else:
+        data = {'parsed': {'info': {
+            'mint': mint, 'owner': base58_encode(_owner(i)),
+            'tokenAmount': {'amount': str(amount), 'decimals': DECIMALS, 'uiAmount': amount / 10 ** DECIMALS}
+        }}}
+    return {'pubkey': f"{mint[:8]}-acc{i}", 'account': {'data': data}}
+
+
+def _answer(method, params):
+    if method == 'getTokenSupply':
+        if params[0] == MINTS[1]:
+            raise KeyError('mint')
+        return {'value': {'amount': '1', 'decimals': DECIMALS}}
+    config = params[1]
+    mint = config['filters'][1]['memcmp']['bytes']
+    compact = config['encoding'] == 'base64'
+    return [_account(mint, i, amount, compact) for i, amount in enumerate(AMOUNTS)]
+
+
+def _fetch(compact):
+    async def main():
+        async with aiohttp.ClientSession() as session, StubRPC(_answer) as stub:
+            processor = EnhancedSignalProcessor(session=session, compact_accounts=compact)
+            processor.rpc = SolanaRPCClient([stub.url], session=session)
+            return await processor.get_token_accounts_batch(MINTS), stub.posts
+    return asyncio.run(main())
+
+
+def test_compact_accounts_match_json_parsed():
+    compact, _ = _fetch(True)
+    parsed, _ = _fetch(False)
+    assert compact == parsed
+    assert [a['balance'] for a in parsed[MINTS[0]]] == [250.0, 5.0, 1.5]
+
+
+def test_unknown_decimals_are_refetched_not_returned_raw():
+    accounts, posts = _fetch(True)
+    balances = [a['balance'] for a in accounts[MINTS[1]]]
+    assert balances == [250.0, 5.0, 1.5]
+    # Antras POST - tik mint'ui be decimals, jsonParsed formatu
+    refetch = posts[1]
+    assert len(refetch) == 1
+    assert refetch[0]['params'][1]['encoding'] == 'jsonParsed'
+    assert refetch[0]['params'][1]['filters'][1]['memcmp']['bytes'] == MINTS[1]
+
+
+def test_parse_compact_accounts_requires_decimals():
+    result = [_account(MINTS[0], 0, 10, True)]
+    with pytest.raises(ValueError):
+        parse_compact_accounts(result, None)
@@ -0,0 +1,157 @@
+import os
+import sqlite3
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+import wallet_database_builder as wdb
+from chat_fixtures import address, signal_message, write_export
+
+DEPLOYERS = [address(f"deployer-{i}") for i in range(3)]
+HOLDERS = [address(f"holder-{i}") for i in range(8)]
+
+
+def _signals(count, start=0):
+    """(token name, export text) signalams start..start+count"""
+    signals = []
+    for i in range(start, start + count):
+        holders = [HOLDERS[(i + k) % len(HOLDERS)] for k in range(3)]
+        name = f"Token{i}"
+        signals.append((name, signal_message(name, f"T{i}", DEPLOYERS[i % len(DEPLOYERS)], holders)))
+    return signals
+
+
+def _write_history(directory, main, gold, gains):
+    write_export(os.path.join(directory, wdb.CHAT_EXPORT_FILES[0]), [text for _, text in main])
+    write_export(os.path.join(directory, wdb.CHAT_EXPORT_FILES[1]), [text for _, text in gold], start_id=10_000)
+    names = [name for name, _ in main + gold]
+    pd.DataFrame({
+        'token_name': names,
+        'max_gain': [gains.get(name, 0.0) for name in names],
+        'date': '2025-01-01 00:00:00+00:00',
+        'strategy': 'Cobra Scan',
+    }).to_csv(os.path.join(directory, 'parsed_telegram_data.csv'), index=False)
+
+
+def _gains(signals, bump=0.0):
+    return {name: round(1.2 + (i % 7) * 1.9 + bump * (i % 2), 2) for i, (name, _) in enumerate(signals)}
+
+
+def _builder(db_file):
+    builder = wdb.WalletDatabaseBuilder()
+    builder.db_file = str(db_file)
+    return builder
+
+
+def _tables(db_file):
+    with sqlite3.connect(db_file) as conn:
+        tables = {table: sorted(conn.execute(f"SELECT * FROM {table}"))
+                  for table in ('deployers', 'top_holders', 'wallet_aggregates', 'wallet_tokens',
+                                'ingested_signals', 'token_gains')}
+        tables['wallet_associations'] = sorted(conn.execute(
+            "SELECT deployer_address, holder_address, token_name, gain, date, signal_idx FROM wallet_associations"))
+    return tables
+
+
+@pytest.fixture
+def history(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    signals = _signals(40)
+    main, gold = signals[:30], signals[30:]
+    _write_history(tmp_path, main, gold, _gains(signals))
+    return tmp_path, main, gold
+
+
+def _grow(directory, main, gold):
+    """Abu eksportai papildomi, dalies senų signalų gains padidėja"""
+    more = _signals(12, start=40)
+    main, gold = main + more[:8], gold + more[8:]
+    _write_history(directory, main, gold, _gains(main + gold, bump=3.0))
+    return main, gold
+
+
+def test_update_matches_full_rebuild(history):
+    directory, main, gold = history
+    _builder('incremental.db').build_complete_database()
+    _grow(directory, main, gold)
+
+    _builder('incremental.db').update_database()
+    _builder('full.db').build_complete_database()
+
+    assert _tables('incremental.db') == _tables('full.db')
+
+
+def test_update_without_changes_touches_nothing(history, capsys):
+    _builder('wallets.db').build_complete_database()
+    before = _tables('wallets.db')
+    capsys.readouterr()
+
+    _builder('wallets.db').update_database()
+
+    assert '0 new signals, 0 with changed gains, 0 removed, 0 renumbered' in capsys.readouterr().out
+    assert _tables('wallets.db') == before
+
+
+def test_update_then_full_rebuild_then_lookup(history):
+    directory, main, gold = history
+    db_file = str(directory / 'wallets.db')
+    _builder(db_file).build_complete_database()
+    lookup = wdb.WalletIntelligenceLookup(db_file, cache_size=0)
+    assert lookup.get_deployer_intelligence(DEPLOYERS[0]) is not None  # Skaitytojas prisijungęs per rebuild
+
+    main, gold = _grow(directory, main, gold)
+    _builder(db_file).update_database()
+    updated = lookup.get_deployer_intelligence(DEPLOYERS[0])
+
+    _builder(db_file).build_complete_database()
+    rebuilt = lookup.get_deployer_intelligence(DEPLOYERS[0])
+
+    # Ta pati istorija - tie patys skaičiai; naujas failas be seno WAL likučių
+    assert rebuilt == updated
+    with sqlite3.connect(db_file) as conn:
+        assert conn.execute("PRAGMA integrity_check").fetchone() == ('ok',)
+        expected_total = conn.execute("SELECT COUNT(*) FROM wallet_tokens WHERE wallet_address = ? AND role = 'deployer'",
+                                      (DEPLOYERS[0],)).fetchone()[0]
+    assert rebuilt['total_tokens'] == expected_total
+    assert not os.path.exists(f"{db_file}.build")
+    if os.path.exists(f"{db_file}-wal"):
+        assert os.path.getsize(f"{db_file}-wal") == 0
+    lookup.close()
+
+    fresh = wdb.WalletIntelligenceLookup(db_file, cache_size=0)
+    assert fresh.get_deployer_intelligence(DEPLOYERS[0]) == rebuilt
+    fresh.close()
+
+
+def test_full_rebuild_leaves_no_stale_sidecars(history):
+    directory, _, _ = history
+    db_file = str(directory / 'wallets.db')
+    _builder(db_file).build_complete_database()
+    _builder(db_file).update_database()  # Įjungia WAL gyvai DB
+
+    _builder(db_file).build_complete_database()
+
+    assert not os.path.exists(f"{db_file}-wal")
+    assert not os.path.exists(f"{db_file}-shm")
+
+
+def test_writers_are_serialized(history):
+    directory, _, _ = history
+    db_file = str(directory / 'wallets.db')
+    _builder(db_file).build_complete_database()
+
+    finished = threading.Event()
+
+    def update():
+        _builder(db_file).update_database()
+        finished.set()
+
+    with wdb.database_lock(db_file):
+        worker = threading.Thread(target=update)
+        worker.start()
+        time.sleep(0.3)
+        assert not finished.is_set()  # Laukia, kol kitas rašytojas atleis užraktą
+    worker.join(timeout=30)
+    assert finished.is_set()
@@ -6,14 +6,146 @@ Analizuoja visus istorinius duomenis ir sukuria wallet intelligence DB
 
 import pandas as pd
 import numpy as np
-import json
 import re
+import hashlib
 from datetime import datetime
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 import sqlite3
+import os
+import threading
+import time
 import asyncio
 import aiohttp
-from typing import Dict, List, Any
+from contextlib import contextmanager
+from typing import Dict, List, Any, Tuple
+from signal_store import load_signal_data
+from chat_export_reader import iter_chat_messages
+
+try:
+    import fcntl
+except ImportError:  # Windows: be tarpprocesinio užrakto
+    fcntl = None
+
+CHAT_EXPORT_FILES = [
+    'telegram_chat_0xBot_AI_Agent___Solana_network.csv',
+    'telegram_chat_0xBot_Solana_calls_-_Gold.csv'
+]
+SIGNAL_MARKER = '🛒 Token Address:'
+
+# Greitas bulk load: WAL + be fsync kiekvienam commit (DB perkuriama iš naujo, jei nutrūksta)
+BUILD_PRAGMAS = [
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=OFF",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+]
+
+DATABASE_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS idx_wallet_tokens_wallet ON wallet_tokens(wallet_address, role)",
+    "CREATE INDEX IF NOT EXISTS idx_wallet_tokens_signal ON wallet_tokens(signal_idx)",
+    "CREATE INDEX IF NOT EXISTS idx_associations_deployer ON wallet_associations(deployer_address)",
+    "CREATE INDEX IF NOT EXISTS idx_associations_holder ON wallet_associations(holder_address)",
+    "CREATE INDEX IF NOT EXISTS idx_associations_signal ON wallet_associations(signal_idx)",
+]
+
+INSERT_DEPLOYER = "INSERT OR REPLACE INTO deployers VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+INSERT_HOLDER = "INSERT OR REPLACE INTO top_holders VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+INSERT_AGGREGATE = "INSERT OR REPLACE INTO wallet_aggregates VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+INSERT_WALLET_TOKEN = "INSERT INTO wallet_tokens VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+INSERT_ASSOCIATION = '''
+    INSERT INTO wallet_associations
+    (deployer_address, holder_address, token_name, gain, date, signal_idx)
+    VALUES (?, ?, ?, ?, ?, ?)
+'''
+
+
+# Gyvos DB WAL checkpoint bandymai prieš pakeitimą (kol skaitytojai baigia transakcijas)
+SWAP_CHECKPOINT_ATTEMPTS = 50
+SWAP_CHECKPOINT_DELAY = 0.1
+
+
+def database_size(db_file: str) -> int:
+    """DB failo dydis baitais (su WAL failu, jei yra)"""
+    return sum(os.path.getsize(path) for path in (db_file, f"{db_file}-wal") if os.path.exists(path))
+
+
+@contextmanager
+def database_lock(db_file: str):
+    """Vienas rašytojas DB: pilnas perkūrimas ir update_database laiko <db>.lock (flock)"""
+    with open(f"{db_file}.lock", 'a') as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+class WalletAggregate:
+    """Vieno walleto (vienoje rolėje) running suvestinė: skaitikliai, gains suma, min/max datos
+    
+    Gains sumuojami signal_idx tvarka, todėl papildžius naujais signalais suma lygiai tokia pati,
+    kaip perskaičiavus visą istoriją. Iš jos skaičiuojamos deployers / top_holders eilutės.
+    """
+    
+    def __init__(self, row: tuple = None):
+        if row is None:
+            row = (0, 0.0, None, 0, 0, 0, 0, 0, 0, None, None, None)
+        (self.total_tokens, self.gain_sum, self.max_gain,
+         self.count_2x, self.count_5x, self.count_10x, self.count_100x,
+         self.profitable_count, self.rug_count,
+         self.first_activity, self.last_activity, self.last_signal_idx) = row
+    
+    @classmethod
+    def from_tokens(cls, tokens) -> 'WalletAggregate':
+        """Suvestinė iš (gain, date, signal_idx) įrašų, surikiuotų pagal signal_idx"""
+        aggregate = cls()
+        for gain, date, signal_idx in tokens:
+            aggregate.add(gain, date, signal_idx)
+        return aggregate
+    
+    def add(self, gain: float, date: str, signal_idx: int):
+        """Prideda vieną signalą (signal_idx didesnis už visus ankstesnius)"""
+        gain = float(gain)
+        self.total_tokens += 1
+        self.gain_sum += gain
+        self.max_gain = gain if self.max_gain is None else max(self.max_gain, gain)
+        self.count_2x += gain >= 2
+        self.count_5x += gain >= 5
+        self.count_10x += gain >= 10
+        self.count_100x += gain >= 100
+        self.profitable_count += gain > 1
+        self.rug_count += gain < 0.5
+        self.first_activity = date if self.first_activity is None else min(self.first_activity, date)
+        self.last_activity = date if self.last_activity is None else max(self.last_activity, date)
+        self.last_signal_idx = signal_idx
+    
+    def row(self) -> tuple:
+        """wallet_aggregates stulpeliai (be address / role)"""
+        return (self.total_tokens, self.gain_sum, self.max_gain,
+                self.count_2x, self.count_5x, self.count_10x, self.count_100x,
+                self.profitable_count, self.rug_count,
+                self.first_activity, self.last_activity, self.last_signal_idx)
+    
+    def stats(self) -> Dict:
+        """Tos pačios reikšmės kaip calculate_wallet_stats (tos, kurios saugomos DB)"""
+        total = self.total_tokens
+        return {
+            'total_tokens': total,
+            'total_gain': self.gain_sum,
+            'average_gain': self.gain_sum / total,
+            'max_gain': self.max_gain,
+            'success_rate_2x': self.count_2x / total,
+            'success_rate_5x': self.count_5x / total,
+            'success_rate_10x': self.count_10x / total,
+            'success_rate_100x': self.count_100x / total,
+            'profitable_rate': self.profitable_count / total,
+            'rug_rate': self.rug_count / total,
+            'last_activity': self.last_activity,
+            'first_activity': self.first_activity
+        }
+
 
 class WalletDatabaseBuilder:
     def __init__(self):
@@ -21,24 +153,21 @@ class WalletDatabaseBuilder:
         self.deployer_stats = defaultdict(dict)
         self.holder_stats = defaultdict(dict)
         self.db_file = 'wallet_intelligence.db'
+        self.token_gains_map = {}
+        self.ingested_signals = []  # (signal_key, signal_idx, token_key) - incremental atnaujinimui
         
     def load_historical_data(self):
-        """Pakrauna visus istorinius duomenis"""
+        """Istoriniai signalai iš abiejų eksportų - generatorius (skaitoma gabalais, be gains update'ų)"""
         print("📊 Loading historical data...")
         
         try:
-            # Load original Telegram data with signal texts
-            df1 = pd.read_csv('telegram_chat_0xBot_AI_Agent___Solana_network.csv')
-            df2 = pd.read_csv('telegram_chat_0xBot_Solana_calls_-_Gold.csv')
+            # Patikrinami tik antraštės, pati žinučių srovė skaitoma analizės metu
+            for path in CHAT_EXPORT_FILES:
+                if 'text' not in pd.read_csv(path, nrows=0).columns:
+                    raise ValueError(f"no 'text' column in {path}")
             
-            # Combine both datasets
-            df = pd.concat([df1, df2], ignore_index=True)
-            
-            # Filter only signals (not gain updates)
-            signals_df = df[df['text'].str.contains('🛒 Token Address:', na=False)].copy()
-            
-            print(f"✅ Loaded {len(signals_df)} historical signals from Telegram data")
-            return signals_df
+            print(f"✅ Streaming historical signals from {len(CHAT_EXPORT_FILES)} Telegram exports")
+            return iter_chat_messages(CHAT_EXPORT_FILES, (SIGNAL_MARKER,))
         except Exception as e:
             print(f"❌ Error loading data: {e}")
             return None
@@ -102,45 +231,28 @@ class WalletDatabaseBuilder:
         """Analizuoja visų walletų istorinį performance"""
         print("🔍 Analyzing historical wallet performance...")
         
-        # Load Telegram data
-        telegram_df = self.load_historical_data()
-        if telegram_df is None:
+        # Load Telegram data (signal messages stream)
+        telegram_signals = self.load_historical_data()
+        if telegram_signals is None:
             return
         
         # Load parsed data with gains
-        try:
-            parsed_df = pd.read_csv('parsed_telegram_data.csv')
-            print(f"📈 Loaded {len(parsed_df)} parsed signals with gains data")
-        except Exception as e:
-            print(f"❌ Error loading parsed data: {e}")
+        token_gains_map = self.load_token_gains()
+        if token_gains_map is None:
             return
-        
-        # Match signals by token address (extract from text)
-        token_gains_map = {}
-        
-        # Create mapping from parsed data
-        for _, row in parsed_df.iterrows():
-            token_name = str(row.get('token_name', '')).lower().strip()
-            max_gain = row.get('max_gain', 0)
-            if token_name and pd.notna(max_gain):
-                token_gains_map[token_name] = {
-                    'max_gain': float(max_gain),
-                    'initial_mc_value': row.get('initial_mc_value', 0),
-                    'date': row.get('date', ''),
-                    'strategy': row.get('strategy', '')
-                }
-        
-        print(f"� Created gains mapping for {len(token_gains_map)} tokens")
+        self.token_gains_map = token_gains_map
+        self.ingested_signals = []
         
         wallet_performance = defaultdict(list)
         deployer_tokens = defaultdict(list)
         holder_tokens = defaultdict(list)
+        occurrences = defaultdict(int)
         
         processed_count = 0
-        for idx, row in telegram_df.iterrows():
+        for message in telegram_signals:
+            idx, date = message.index, message.date
             try:
-                signal_text = str(row.get('text', ''))
-                date = row.get('date', '')
+                signal_text = str(message.text)
                 
                 # Extract token name from signal
                 token_name = self._extract_token_name(signal_text)
@@ -152,34 +264,24 @@ class WalletDatabaseBuilder:
                 gains_data = token_gains_map.get(token_key, {})
                 max_gain = gains_data.get('max_gain', 0)
                 
+                # Įsimenami ir signalai be gains - vėliau jų gain gali atsirasti
+                self.ingested_signals.append((self._signal_key(message, occurrences), idx, token_key))
+                
                 # Skip if no gains data
                 if max_gain <= 0:
                     continue
                 
                 # Extract wallets from signal
                 wallets = self.extract_wallet_addresses(signal_text)
+                token = self._token_entry(token_name, gains_data, date, idx)
                 
                 # Track deployer performance
                 for deployer in wallets['deployers']:
-                    deployer_tokens[deployer].append({
-                        'token': token_name,
-                        'gain': max_gain,
-                        'initial_mc': gains_data.get('initial_mc_value', 0),
-                        'date': date,
-                        'signal_idx': idx,
-                        'strategy': gains_data.get('strategy', '')
-                    })
+                    deployer_tokens[deployer].append(token)
                 
                 # Track holder performance
                 for holder in wallets['top_holders']:
-                    holder_tokens[holder].append({
-                        'token': token_name,
-                        'gain': max_gain,
-                        'initial_mc': gains_data.get('initial_mc_value', 0),
-                        'date': date,
-                        'signal_idx': idx,
-                        'strategy': gains_data.get('strategy', '')
-                    })
+                    holder_tokens[holder].append(token)
                 
                 processed_count += 1
                 if processed_count % 1000 == 0:
@@ -195,6 +297,71 @@ class WalletDatabaseBuilder:
         
         return deployer_tokens, holder_tokens
     
+    def load_token_gains(self) -> Dict[str, Dict]:
+        """token name (lower) -> max_gain / initial_mc_value / date / strategy iš parsed signalų"""
+        try:
+            parsed_df = load_signal_data(columns=['token_name', 'max_gain', 'initial_mc_value', 'date', 'strategy'])
+            print(f"📈 Loaded {len(parsed_df)} parsed signals with gains data")
+        except Exception as e:
+            print(f"❌ Error loading parsed data: {e}")
+            return None
+        
+        def column(name, default):
+            return parsed_df[name].tolist() if name in parsed_df.columns else [default] * len(parsed_df)
+        
+        # Create mapping from parsed data (later signals of the same token win)
+        token_gains_map = {}
+        for token_name, max_gain, initial_mc, date, strategy in zip(
+                column('token_name', ''), column('max_gain', 0), column('initial_mc_value', 0),
+                column('date', ''), column('strategy', '')):
+            token_name = str(token_name).lower().strip()
+            if token_name and pd.notna(max_gain):
+                token_gains_map[token_name] = {
+                    'max_gain': float(max_gain),
+                    'initial_mc_value': initial_mc,
+                    'date': date,
+                    'strategy': strategy
+                }
+        
+        print(f"🗺️ Created gains mapping for {len(token_gains_map)} tokens")
+        return token_gains_map
+    
+    @staticmethod
+    def _token_entry(token_name: str, gains_data: Dict, date, signal_idx: int) -> Dict:
+        """Vieno signalo įrašas walleto token sąraše"""
+        return {
+            'token': token_name,
+            'gain': gains_data.get('max_gain', 0),
+            'initial_mc': gains_data.get('initial_mc_value', 0),
+            'date': date,
+            'signal_idx': signal_idx,
+            'strategy': gains_data.get('strategy', '')
+        }
+    
+    @staticmethod
+    def _signal_key(message, occurrences: Dict[str, int]) -> str:
+        """Signalo raktas iš date + text (ir kelintas toks pat) - nepriklauso nuo eilutės numerio"""
+        digest = hashlib.sha256(f"{message.date}\x1f{message.text}".encode()).hexdigest()
+        occurrences[digest] += 1
+        return f"{digest}:{occurrences[digest]}"
+    
+    @staticmethod
+    def _token_gains_values(gains_data: Dict) -> tuple:
+        """token_gains eilutė (be rakto) - palyginimui su ankstesniu atnaujinimu"""
+        initial_mc = float(gains_data.get('initial_mc_value') or 0)
+        strategy = gains_data.get('strategy')
+        return (
+            float(gains_data['max_gain']),
+            0.0 if np.isnan(initial_mc) else initial_mc,
+            strategy if isinstance(strategy, str) else ''
+        )
+    
+    @staticmethod
+    def _aggregate_of(tokens: List[Dict]) -> WalletAggregate:
+        return WalletAggregate.from_tokens(
+            (token['gain'], str(token.get('date', '')), int(token['signal_idx'])) for token in tokens
+        )
+    
     def _extract_token_name(self, signal_text: str) -> str:
         """Ištraukia token name iš signalo teksto"""
         import re
@@ -234,11 +401,11 @@ class WalletDatabaseBuilder:
         
         return stats
     
-    def create_database(self):
+    def create_database(self, db_file: str = None):
         """Sukuria SQLite duomenų bazę"""
         print("🏗️ Creating wallet intelligence database...")
         
-        conn = sqlite3.connect(self.db_file)
+        conn = sqlite3.connect(db_file or self.db_file)
         cursor = conn.cursor()
         
         # Deployers table
@@ -256,8 +423,7 @@ class WalletDatabaseBuilder:
                 rug_rate REAL,
                 reputation_score REAL,
                 last_activity TEXT,
-                first_activity TEXT,
-                raw_data TEXT
+                first_activity TEXT
             )
         ''')
         
@@ -275,8 +441,21 @@ class WalletDatabaseBuilder:
                 profitable_rate REAL,
                 diamond_hands_score REAL,
                 last_activity TEXT,
-                first_activity TEXT,
-                raw_data TEXT
+                first_activity TEXT
+            )
+        ''')
+        
+        # Token history per wallet (role = 'deployer' / 'holder')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS wallet_tokens (
+                wallet_address TEXT NOT NULL,
+                role TEXT NOT NULL,
+                token_name TEXT,
+                gain REAL,
+                initial_mc REAL,
+                date TEXT,
+                signal_idx INTEGER,
+                strategy TEXT
             )
         ''')
         
@@ -293,109 +472,435 @@ class WalletDatabaseBuilder:
             )
         ''')
         
+        # Running aggregates per wallet and role (update_database updates them in place)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS wallet_aggregates (
+                wallet_address TEXT NOT NULL,
+                role TEXT NOT NULL,
+                total_tokens INTEGER,
+                gain_sum REAL,
+                max_gain REAL,
+                count_2x INTEGER,
+                count_5x INTEGER,
+                count_10x INTEGER,
+                count_100x INTEGER,
+                profitable_count INTEGER,
+                rug_count INTEGER,
+                first_activity TEXT,
+                last_activity TEXT,
+                last_signal_idx INTEGER,
+                PRIMARY KEY (wallet_address, role)
+            )
+        ''')
+        
+        # Ingest state: signals already seen (incl. ones without gains) and the gains they used
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS ingested_signals (
+                signal_key TEXT PRIMARY KEY,
+                signal_idx INTEGER,
+                token_key TEXT
+            )
+        ''')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS token_gains (
+                token_key TEXT PRIMARY KEY,
+                max_gain REAL,
+                initial_mc REAL,
+                strategy TEXT
+            )
+        ''')
+        
         conn.commit()
         conn.close()
         print("✅ Database created successfully")
     
+    def create_indexes(self, conn: sqlite3.Connection):
+        """Sukuria indeksus (po bulk insert - greičiau nei kiekvienam INSERT)"""
+        for statement in DATABASE_INDEXES:
+            conn.execute(statement)
+    
+    def _deployer_row(self, deployer_addr: str, aggregate: WalletAggregate) -> tuple:
+        """deployers lentelės eilutė"""
+        stats = aggregate.stats()
+        
+        # Calculate reputation score (weighted by success and volume)
+        reputation = (
+            stats['success_rate_5x'] * 0.4 +
+            stats['profitable_rate'] * 0.3 +
+            (1 - stats['rug_rate']) * 0.2 +
+            min(stats['total_tokens'] / 10, 1) * 0.1
+        )
+        
+        return (
+            deployer_addr,
+            stats['total_tokens'],
+            stats['average_gain'],
+            stats['max_gain'],
+            stats['success_rate_2x'],
+            stats['success_rate_5x'],
+            stats['success_rate_10x'],
+            stats['success_rate_100x'],
+            stats['profitable_rate'],
+            stats['rug_rate'],
+            reputation,
+            stats['last_activity'],
+            stats['first_activity']
+        )
+    
+    def _holder_row(self, holder_addr: str, aggregate: WalletAggregate) -> tuple:
+        """top_holders lentelės eilutė"""
+        stats = aggregate.stats()
+        
+        # Calculate diamond hands score
+        diamond_score = (
+            stats['success_rate_5x'] * 0.5 +
+            stats['profitable_rate'] * 0.3 +
+            min(stats['total_tokens'] / 20, 1) * 0.2
+        )
+        
+        return (
+            holder_addr,
+            stats['total_tokens'],
+            stats['average_gain'],
+            stats['max_gain'],
+            stats['success_rate_2x'],
+            stats['success_rate_5x'],
+            stats['success_rate_10x'],
+            stats['success_rate_100x'],
+            stats['profitable_rate'],
+            diamond_score,
+            stats['last_activity'],
+            stats['first_activity']
+        )
+    
+    def _wallet_token_rows(self, wallet_data: Dict, role: str):
+        """wallet_tokens eilutės (vietoj JSON raw_data)"""
+        for address, tokens in wallet_data.items():
+            for token in tokens:
+                yield (
+                    address,
+                    role,
+                    token['token'],
+                    float(token['gain']),
+                    float(token.get('initial_mc') or 0),
+                    str(token.get('date', '')),
+                    int(token['signal_idx']),
+                    token.get('strategy', '')
+                )
+    
+    def build_wallet_associations(self, deployer_data: Dict, holder_data: Dict) -> List[tuple]:
+        """Deployer + holder poros, pasirodžiusios tame pačiame signale (grupuojant pagal signal_idx)"""
+        holders_by_signal = defaultdict(list)
+        for holder_addr, holder_tokens in holder_data.items():
+            for holder_token in holder_tokens:
+                holders_by_signal[(holder_token['signal_idx'], holder_token['token'])].append(holder_addr)
+        
+        associations = []
+        for deployer_addr, deployer_tokens in deployer_data.items():
+            for token_data in deployer_tokens:
+                for holder_addr in holders_by_signal.get((token_data['signal_idx'], token_data['token']), ()):
+                    associations.append((
+                        deployer_addr,
+                        holder_addr,
+                        token_data['token'],
+                        token_data['gain'],
+                        token_data['date'],
+                        token_data['signal_idx']
+                    ))
+        
+        return associations
+    
     def build_complete_database(self):
-        """Sukuria pilną wallet intelligence duomenų bazę"""
+        """Sukuria pilną wallet intelligence duomenų bazę (laikant database_lock)"""
+        with database_lock(self.db_file):
+            return self._build_complete_database()
+    
+    def _build_complete_database(self):
         print("🚀 Building complete wallet intelligence database...")
+        start_time = time.perf_counter()
+        size_before = database_size(self.db_file)
         
         # 1. Analyze historical data
-        deployer_data, holder_data = self.analyze_historical_performance()
+        history = self.analyze_historical_performance()
+        if not history:
+            print("❌ No historical data - database not built")
+            return
+        deployer_data, holder_data = history
         
-        # 2. Create database
-        self.create_database()
+        # 2. Create database (naujas failas, pakeičiamas atomiškai pabaigoje)
+        build_file = f"{self.db_file}.build"
+        for path in (build_file, f"{build_file}-wal", f"{build_file}-shm"):
+            if os.path.exists(path):
+                os.remove(path)
+        self.create_database(build_file)
         
-        # 3. Calculate stats and save to DB
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
+        # 3. Calculate stats and bulk-load in one transaction
+        conn = sqlite3.connect(build_file)
+        for pragma in BUILD_PRAGMAS:
+            conn.execute(pragma)
+        
+        deployer_aggregates = {address: self._aggregate_of(tokens) for address, tokens in deployer_data.items()}
+        holder_aggregates = {address: self._aggregate_of(tokens) for address, tokens in holder_data.items()}
         
-        print("💾 Saving deployer data...")
-        for deployer_addr, tokens in deployer_data.items():
-            stats = self.calculate_wallet_stats(tokens)
+        with conn:
+            print("💾 Saving deployer data...")
+            conn.executemany(
+                INSERT_DEPLOYER,
+                [self._deployer_row(address, aggregate) for address, aggregate in deployer_aggregates.items()]
+            )
             
-            # Calculate reputation score (weighted by success and volume)
-            reputation = (
-                stats['success_rate_5x'] * 0.4 +
-                stats['profitable_rate'] * 0.3 +
-                (1 - stats['rug_rate']) * 0.2 +
-                min(stats['total_tokens'] / 10, 1) * 0.1
+            print("🐋 Saving holder data...")
+            conn.executemany(
+                INSERT_HOLDER,
+                [self._holder_row(address, aggregate) for address, aggregate in holder_aggregates.items()]
             )
             
-            cursor.execute('''
-                INSERT OR REPLACE INTO deployers VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                deployer_addr,
-                stats['total_tokens'],
-                stats['average_gain'],
-                stats['max_gain'],
-                stats['success_rate_2x'],
-                stats['success_rate_5x'],
-                stats['success_rate_10x'],
-                stats['success_rate_100x'],
-                stats['profitable_rate'],
-                stats['rug_rate'],
-                reputation,
-                stats['last_activity'],
-                stats['first_activity'],
-                json.dumps(tokens)
-            ))
+            print("🧮 Saving running aggregates and ingest state...")
+            for role, aggregates in (('deployer', deployer_aggregates), ('holder', holder_aggregates)):
+                conn.executemany(INSERT_AGGREGATE, [(address, role) + aggregate.row()
+                                                    for address, aggregate in aggregates.items()])
+            conn.executemany("INSERT OR REPLACE INTO ingested_signals VALUES (?, ?, ?)", self.ingested_signals)
+            conn.executemany("INSERT OR REPLACE INTO token_gains VALUES (?, ?, ?, ?)",
+                             [(key, *self._token_gains_values(data)) for key, data in self.token_gains_map.items()])
+            
+            print("📜 Saving wallet token history...")
+            conn.executemany(INSERT_WALLET_TOKEN, self._wallet_token_rows(deployer_data, 'deployer'))
+            conn.executemany(INSERT_WALLET_TOKEN, self._wallet_token_rows(holder_data, 'holder'))
+            
+            print("🔗 Saving wallet associations...")
+            # Save associations between deployers and holders
+            associations = self.build_wallet_associations(deployer_data, holder_data)
+            conn.executemany(INSERT_ASSOCIATION, associations)
+            print(f"   {len(associations)} associations saved")
+            
+            self.create_indexes(conn)
+        
+        # Build failas - savarankiškas (be -wal/-shm) ir įrašytas į diską prieš pakeitimą
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        conn.execute("PRAGMA journal_mode=DELETE")
+        conn.close()
+        with open(build_file, 'rb') as f:
+            os.fsync(f.fileno())
+        
+        if not self._release_live_database():
+            os.remove(build_file)
+            print(f"❌ Readers kept {self.db_file} busy - new database not installed")
+            return
+        os.replace(build_file, self.db_file)
+        
+        elapsed = time.perf_counter() - start_time
+        size_after = database_size(self.db_file)
+        print("✅ Wallet intelligence database created successfully!")
+        print(f"⏱️ Build time: {elapsed:.2f}s")
+        print(f"💽 DB size: {size_before / 1024:.1f} KB -> {size_after / 1024:.1f} KB")
+        self.print_database_summary()
+    
+    def _release_live_database(self) -> bool:
+        """Ištuština gyvos DB WAL prieš os.replace (False - skaitytojai neleido checkpoint)
         
-        print("🐋 Saving holder data...")
-        for holder_addr, tokens in holder_data.items():
-            stats = self.calculate_wallet_stats(tokens)
+        -wal/-shm failai susieti su keliu, ne su failu: po pakeitimo nauji connection'ai
+        pasiimtų senus sidecar failus. Todėl WAL perkeliamas į seną failą ir sutrumpinamas
+        iki 0 (checkpoint TRUNCATE), o jei DB niekas nebeskaito - perjungiama į DELETE režimą
+        ir sidecar failai pašalinami. Rašytojų nėra - laikomas database_lock.
+        """
+        if not os.path.exists(self.db_file):
+            return True
+        
+        conn = sqlite3.connect(self.db_file, timeout=SWAP_CHECKPOINT_DELAY)
+        try:
+            for _ in range(SWAP_CHECKPOINT_ATTEMPTS):
+                busy, _, _ = conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone()
+                if not busy:
+                    break
+                time.sleep(SWAP_CHECKPOINT_DELAY)
+            else:
+                return False
             
-            # Calculate diamond hands score
-            diamond_score = (
-                stats['success_rate_5x'] * 0.5 +
-                stats['profitable_rate'] * 0.3 +
-                min(stats['total_tokens'] / 20, 1) * 0.2
-            )
+            try:
+                conn.execute("PRAGMA journal_mode=DELETE")
+            except sqlite3.OperationalError:
+                pass  # Skaitytojai dar prisijungę: WAL tuščias, jie persijungia pagal inode
+        finally:
+            conn.close()
+        return True
+    
+    def _load_ingest_state(self):
+        """(signal_key -> (signal_idx, token_key), token_key -> token_gains reikšmės) arba None"""
+        if not os.path.exists(self.db_file):
+            print("ℹ️ No wallet database yet - full build")
+            return None
+        
+        conn = sqlite3.connect(self.db_file)
+        try:
+            known = {key: (idx, token_key) for key, idx, token_key in
+                     conn.execute("SELECT signal_key, signal_idx, token_key FROM ingested_signals")}
+            snapshot = {row[0]: tuple(row[1:]) for row in
+                        conn.execute("SELECT token_key, max_gain, initial_mc, strategy FROM token_gains")}
+            conn.execute("SELECT 1 FROM wallet_aggregates LIMIT 1").fetchall()
+        except sqlite3.OperationalError as e:
+            print(f"ℹ️ Database has no incremental state ({e}) - full rebuild")
+            return None
+        finally:
+            conn.close()
+        return known, snapshot
+    
+    def update_database(self):
+        """Papildo esamą DB tik naujais signalais (be incremental būsenos - pilnas perkūrimas)
+        
+        Jau apdoroti signalai atpažįstami pagal turinio raktą (ingested_signals), todėl pasislinkę
+        eilučių numeriai tik pernumeruojami. Signalai, kurių token gains pasikeitė nuo praeito
+        karto (token_gains), apdorojami iš naujo. Walleto suvestinė papildoma vietoje, jei jo
+        signalai tik pridėti po ankstesnių, kitaip perskaičiuojama iš wallet_tokens;
+        deployers / top_holders eilutės perrašomos tik paliestiems walletams.
+        Laikomas database_lock, todėl nesutampa su pilnu perkūrimu.
+        """
+        with database_lock(self.db_file):
+            return self._update_database()
+    
+    def _update_database(self):
+        state = self._load_ingest_state()
+        if state is None:
+            return self._build_complete_database()
+        known, snapshot = state
+        
+        print("🔄 Updating wallet intelligence database...")
+        start_time = time.perf_counter()
+        
+        telegram_signals = self.load_historical_data()
+        if telegram_signals is None:
+            return
+        token_gains_map = self.load_token_gains()
+        if token_gains_map is None:
+            return
+        
+        current = {key: self._token_gains_values(data) for key, data in token_gains_map.items()}
+        changed = {key for key in snapshot.keys() | current.keys() if snapshot.get(key) != current.get(key)}
+        
+        # 1. Which signals are new, moved or need their gains re-applied
+        occurrences = defaultdict(int)
+        seen, renumbered, pending, new_signals = set(), {}, [], []
+        for message in telegram_signals:
+            key = self._signal_key(message, occurrences)
+            if key in known:
+                old_idx, token_key = known[key]
+                seen.add(key)
+                if old_idx != message.index:
+                    renumbered[old_idx] = message.index
+                if token_key in changed:
+                    pending.append(message)
+                continue
             
-            cursor.execute('''
-                INSERT OR REPLACE INTO top_holders VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                holder_addr,
-                stats['total_tokens'],
-                stats['average_gain'],
-                stats['max_gain'],
-                stats['success_rate_2x'],
-                stats['success_rate_5x'],
-                stats['success_rate_10x'],
-                stats['success_rate_100x'],
-                stats['profitable_rate'],
-                diamond_score,
-                stats['last_activity'],
-                stats['first_activity'],
-                json.dumps(tokens)
-            ))
+            token_name = self._extract_token_name(str(message.text))
+            if token_name:
+                new_signals.append((key, message.index, token_name.lower().strip()))
+                pending.append(message)
         
-        print("🔗 Saving wallet associations...")
-        # Save associations between deployers and holders
-        for deployer_addr, deployer_tokens in deployer_data.items():
-            for token_data in deployer_tokens:
-                for holder_addr, holder_tokens in holder_data.items():
-                    for holder_token in holder_tokens:
-                        if (holder_token['signal_idx'] == token_data['signal_idx'] and
-                            holder_token['token'] == token_data['token']):
-                            cursor.execute('''
-                                INSERT INTO wallet_associations 
-                                (deployer_address, holder_address, token_name, gain, date, signal_idx)
-                                VALUES (?, ?, ?, ?, ?, ?)
-                            ''', (
-                                deployer_addr,
-                                holder_addr,
-                                token_data['token'],
-                                token_data['gain'],
-                                token_data['date'],
-                                token_data['signal_idx']
-                            ))
+        removed_keys = known.keys() - seen
+        removed = [known[key][0] for key in removed_keys]
+        moved = [renumbered.get(idx, idx) for idx, _ in sorted(known[key] for key in seen)]
+        if any(a >= b for a, b in zip(moved, moved[1:])):
+            print("⚠️ Exports were reordered - full rebuild")
+            return self._build_complete_database()
         
-        conn.commit()
+        print(f"🆕 {len(new_signals)} new signals, {len(pending) - len(new_signals)} with changed gains, "
+              f"{len(removed)} removed, {len(renumbered)} renumbered")
+        
+        # 2. Wallets of new / re-applied signals (only those with gains, as in a full build)
+        deployer_data = defaultdict(list)
+        holder_data = defaultdict(list)
+        for message in pending:
+            signal_text = str(message.text)
+            token_name = self._extract_token_name(signal_text)
+            gains_data = token_gains_map.get(token_name.lower().strip(), {})
+            if gains_data.get('max_gain', 0) <= 0:
+                continue
+            wallets = self.extract_wallet_addresses(signal_text)
+            token = self._token_entry(token_name, gains_data, message.date, message.index)
+            for deployer in wallets['deployers']:
+                deployer_data[deployer].append(token)
+            for holder in wallets['top_holders']:
+                holder_data[holder].append(token)
+        
+        conn = sqlite3.connect(self.db_file)
+        try:
+            # Skaitytojai (WalIntelligenceLookup) netrukdo rašymui vietoje
+            conn.execute("PRAGMA journal_mode=WAL")
+        except sqlite3.OperationalError:
+            pass
+        with conn:
+            # 3. Drop rows of removed signals, renumber moved ones, drop rows that get new gains
+            cleared = defaultdict(set)  # role -> wallets that lost rows
+            
+            def clear_signals(indexes):
+                conn.execute("DELETE FROM temp.signal_batch")
+                conn.executemany("INSERT OR IGNORE INTO temp.signal_batch VALUES (?)", ((idx,) for idx in indexes))
+                for address, role in conn.execute(
+                        "SELECT wallet_address, role FROM wallet_tokens "
+                        "WHERE signal_idx IN (SELECT signal_idx FROM temp.signal_batch)"):
+                    cleared[role].add(address)
+                for table in ('wallet_tokens', 'wallet_associations'):
+                    conn.execute(f"DELETE FROM {table} WHERE signal_idx IN (SELECT signal_idx FROM temp.signal_batch)")
+            
+            conn.execute("CREATE TEMP TABLE IF NOT EXISTS signal_batch (signal_idx INTEGER PRIMARY KEY)")
+            conn.execute("CREATE TEMP TABLE IF NOT EXISTS signal_renumber (old_idx INTEGER PRIMARY KEY, new_idx INTEGER)")
+            clear_signals(removed)
+            conn.executemany("DELETE FROM ingested_signals WHERE signal_key = ?", ((key,) for key in removed_keys))
+            
+            if renumbered:
+                conn.executemany("INSERT INTO temp.signal_renumber VALUES (?, ?)", renumbered.items())
+                for table, column in (('wallet_tokens', 'signal_idx'), ('wallet_associations', 'signal_idx'),
+                                      ('ingested_signals', 'signal_idx'), ('wallet_aggregates', 'last_signal_idx')):
+                    conn.execute(f"UPDATE {table} SET {column} = (SELECT new_idx FROM temp.signal_renumber "
+                                 f"WHERE old_idx = {table}.{column}) "
+                                 f"WHERE {column} IN (SELECT old_idx FROM temp.signal_renumber)")
+            
+            clear_signals(message.index for message in pending)
+            
+            # 4. New rows
+            conn.executemany(INSERT_WALLET_TOKEN, self._wallet_token_rows(deployer_data, 'deployer'))
+            conn.executemany(INSERT_WALLET_TOKEN, self._wallet_token_rows(holder_data, 'holder'))
+            conn.executemany(INSERT_ASSOCIATION, self.build_wallet_associations(deployer_data, holder_data))
+            conn.executemany("INSERT INTO ingested_signals VALUES (?, ?, ?)", new_signals)
+            conn.executemany("DELETE FROM token_gains WHERE token_key = ?",
+                             ((key,) for key in changed if key not in current))
+            conn.executemany("INSERT OR REPLACE INTO token_gains VALUES (?, ?, ?, ?)",
+                             [(key, *current[key]) for key in changed if key in current])
+            
+            # 5. Aggregates and scores only for touched wallets
+            touched = 0
+            for role, data, table, make_row, insert in (
+                    ('deployer', deployer_data, 'deployers', self._deployer_row, INSERT_DEPLOYER),
+                    ('holder', holder_data, 'top_holders', self._holder_row, INSERT_HOLDER)):
+                for address in cleared[role] | data.keys():
+                    added = data.get(address, [])
+                    row = conn.execute(
+                        "SELECT total_tokens, gain_sum, max_gain, count_2x, count_5x, count_10x, count_100x, "
+                        "profitable_count, rug_count, first_activity, last_activity, last_signal_idx "
+                        "FROM wallet_aggregates WHERE wallet_address = ? AND role = ?", (address, role)).fetchone()
+                    
+                    if address not in cleared[role] and (row is None or row[-1] < added[0]['signal_idx']):
+                        # Only appended after everything already counted: update in place
+                        aggregate = WalletAggregate(row)
+                        for token in added:
+                            aggregate.add(token['gain'], str(token.get('date', '')), int(token['signal_idx']))
+                    else:
+                        aggregate = WalletAggregate.from_tokens(conn.execute(
+                            "SELECT gain, date, signal_idx FROM wallet_tokens "
+                            "WHERE wallet_address = ? AND role = ? ORDER BY signal_idx", (address, role)))
+                    
+                    if aggregate.total_tokens:
+                        conn.execute(INSERT_AGGREGATE, (address, role) + aggregate.row())
+                        conn.execute(insert, make_row(address, aggregate))
+                    else:
+                        conn.execute("DELETE FROM wallet_aggregates WHERE wallet_address = ? AND role = ?",
+                                     (address, role))
+                        conn.execute(f"DELETE FROM {table} WHERE address = ?", (address,))
+                    touched += 1
         conn.close()
         
-        print("✅ Wallet intelligence database created successfully!")
+        elapsed = time.perf_counter() - start_time
+        print(f"✅ Wallet intelligence database updated: {touched} wallets recalculated")
+        print(f"⏱️ Update time: {elapsed:.2f}s")
         self.print_database_summary()
     
     def print_database_summary(self):
@@ -456,76 +961,237 @@ class WalletDatabaseBuilder:
         conn.close()
         print("="*60)
 
+class ReputationCache:
+    """Ribotas LRU + TTL kešas wallet reputacijoms (saugo ir 'nėra DB' rezultatus)"""
+    
+    MISSING = object()  # neigiamas rezultatas: adreso DB nėra
+    
+    def __init__(self, max_size: int = 10000, ttl: float = 600.0):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+    
+    def get(self, key):
+        """Grąžina reikšmę, MISSING (neigiamas įrašas) arba None (nėra keše)"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry[0] <= now:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+    
+    def put(self, key, value):
+        expires_at = time.monotonic() + self.ttl
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+    
+    def clear(self):
+        with self._lock:
+            if self._entries:
+                self.invalidations += 1
+            self._entries.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss skaitikliai kešo dydžiui parinkti"""
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'max_size': self.max_size,
+            'ttl': self.ttl,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'invalidations': self.invalidations
+        }
+
+
 class WalletIntelligenceLookup:
-    """Klases walletų paieškai duomenų bazėje"""
+    """Klases walletų paieškai duomenų bazėje
     
-    def __init__(self):
-        self.db_file = 'wallet_intelligence.db'
+    Kiekviena gija naudoja vieną ilgalaikį read-only connection; jis atidaromas iš naujo,
+    kai DB failas pakeičiamas (build_complete_database prieš os.replace ištuština gyvos DB
+    WAL, todėl senas connection'as nepaima naujo failo puslapių). update_database rašo vietoje.
+    Pasirenkamas ReputationCache (cache_size=0 - išjungtas) išvalomas perkūrus DB
+    arba kai kitas connection įrašo pakeitimus (PRAGMA data_version).
+    """
     
-    def get_deployer_intelligence(self, deployer_address: str) -> Dict:
-        """Gauna deployer intelligence iš DB"""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
+    DEPLOYER_QUERY = "SELECT * FROM deployers WHERE address IN ({})"
+    HOLDER_QUERY = "SELECT * FROM top_holders WHERE address IN ({})"
+    MAX_QUERY_PARAMS = 900  # < SQLITE_MAX_VARIABLE_NUMBER senose versijose
+    
+    def __init__(self, db_file: str = 'wallet_intelligence.db', cache_size: int = 10000, cache_ttl: float = 600.0):
+        self.db_file = db_file
+        self._local = threading.local()
+        self.cache = ReputationCache(cache_size, cache_ttl) if cache_size > 0 else None
+    
+    def _connection(self) -> sqlite3.Connection:
+        """Šios gijos connection (perjungiamas, jei DB failas buvo perkurtas)"""
+        inode = os.stat(self.db_file).st_ino
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None and self._local.inode == inode:
+            if self.cache is not None:
+                data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+                if data_version != self._local.data_version:
+                    self._local.data_version = data_version
+                    self.cache.clear()
+            return conn
         
-        cursor.execute("SELECT * FROM deployers WHERE address = ?", (deployer_address,))
-        result = cursor.fetchone()
-        conn.close()
+        if conn is not None:
+            conn.close()
+        conn = sqlite3.connect(f"file:{self.db_file}?mode=ro", uri=True, cached_statements=256)
+        self._local.conn = conn
+        self._local.inode = inode
+        self._local.data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+        if self.cache is not None:
+            self.cache.clear()
+        return conn
+    
+    def invalidate_cache(self):
+        """Išvalo reputacijų kešą (pvz. po DB atnaujinimo kitame procese)"""
+        if self.cache is not None:
+            self.cache.clear()
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """Kešo statistika (tuščia, jei kešas išjungtas)"""
+        return self.cache.stats() if self.cache is not None else {}
+    
+    def close(self):
+        """Uždaro šios gijos connection"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+    
+    def _fetch_by_address(self, query: str, addresses) -> Dict[str, tuple]:
+        """address -> eilutė, vienas IN (...) query kiekvienam MAX_QUERY_PARAMS blokui"""
+        unique = list(dict.fromkeys(address for address in addresses if address))
+        if not unique:
+            return {}
         
-        if result:
-            return {
-                'address': result[0],
-                'total_tokens': result[1],
-                'average_gain': result[2],
-                'max_gain': result[3],
-                'success_rate_2x': result[4],
-                'success_rate_5x': result[5],
-                'success_rate_10x': result[6],
-                'success_rate_100x': result[7],
-                'profitable_rate': result[8],
-                'rug_rate': result[9],
-                'reputation_score': result[10],
-                'last_activity': result[11],
-                'first_activity': result[12],
-                'intelligence_level': 'HIGH' if result[1] >= 5 else 'MEDIUM' if result[1] >= 2 else 'LOW'
-            }
-        
-        return None
+        conn = self._connection()
+        rows = {}
+        if self.cache is not None:
+            pending = []
+            for address in unique:
+                cached = self.cache.get((query, address))
+                if cached is None:
+                    pending.append(address)
+                elif cached is not ReputationCache.MISSING:
+                    rows[address] = cached
+            unique = pending
+        
+        for start in range(0, len(unique), self.MAX_QUERY_PARAMS):
+            chunk = unique[start:start + self.MAX_QUERY_PARAMS]
+            sql = query.format(', '.join('?' * len(chunk)))
+            found = {row[0]: row for row in conn.execute(sql, chunk)}
+            rows.update(found)
+            
+            if self.cache is not None:
+                for address in chunk:
+                    self.cache.put((query, address), found.get(address, ReputationCache.MISSING))
+        return rows
+    
+    @staticmethod
+    def _deployer_from_row(result: tuple) -> Dict:
+        return {
+            'address': result[0],
+            'total_tokens': result[1],
+            'average_gain': result[2],
+            'max_gain': result[3],
+            'success_rate_2x': result[4],
+            'success_rate_5x': result[5],
+            'success_rate_10x': result[6],
+            'success_rate_100x': result[7],
+            'profitable_rate': result[8],
+            'rug_rate': result[9],
+            'reputation_score': result[10],
+            'last_activity': result[11],
+            'first_activity': result[12],
+            'intelligence_level': 'HIGH' if result[1] >= 5 else 'MEDIUM' if result[1] >= 2 else 'LOW'
+        }
+    
+    @staticmethod
+    def _holder_from_row(result: tuple) -> Dict:
+        return {
+            'address': result[0],
+            'total_appearances': result[1],
+            'average_gain': result[2],
+            'max_gain': result[3],
+            'success_rate_2x': result[4],
+            'success_rate_5x': result[5],
+            'success_rate_10x': result[6],
+            'success_rate_100x': result[7],
+            'profitable_rate': result[8],
+            'diamond_hands_score': result[9],
+            'last_activity': result[10],
+            'first_activity': result[11],
+            'intelligence_level': 'HIGH' if result[1] >= 10 else 'MEDIUM' if result[1] >= 3 else 'LOW'
+        }
+    
+    def get_deployer_intelligence(self, deployer_address: str) -> Dict:
+        """Gauna deployer intelligence iš DB"""
+        result = self._fetch_by_address(self.DEPLOYER_QUERY, [deployer_address]).get(deployer_address)
+        return self._deployer_from_row(result) if result else None
     
     def get_holder_intelligence(self, holder_addresses: List[str]) -> List[Dict]:
-        """Gauna holder intelligence iš DB"""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
+        """Gauna holder intelligence iš DB (vienas query visiems holderiams)"""
+        rows = self._fetch_by_address(self.HOLDER_QUERY, holder_addresses)
+        return [self._holder_from_row(rows[address]) for address in holder_addresses if address in rows]
+    
+    def get_batch_intelligence(self, signals: List[Tuple[str, List[str]]]) -> List[Tuple[Dict, List[Dict]]]:
+        """Keliems signalams [(deployer, [holders]), ...] -> [(deployer_intel, holder_intel), ...]
         
-        results = []
-        for address in holder_addresses:
-            cursor.execute("SELECT * FROM top_holders WHERE address = ?", (address,))
-            result = cursor.fetchone()
-            
-            if result:
-                results.append({
-                    'address': result[0],
-                    'total_appearances': result[1],
-                    'average_gain': result[2],
-                    'max_gain': result[3],
-                    'success_rate_2x': result[4],
-                    'success_rate_5x': result[5],
-                    'success_rate_10x': result[6],
-                    'success_rate_100x': result[7],
-                    'profitable_rate': result[8],
-                    'diamond_hands_score': result[9],
-                    'last_activity': result[10],
-                    'first_activity': result[11],
-                    'intelligence_level': 'HIGH' if result[1] >= 10 else 'MEDIUM' if result[1] >= 3 else 'LOW'
-                })
+        Visi signalų walletai surenkami į du IN (...) query (deployers + holders).
+        """
+        deployer_rows = self._fetch_by_address(self.DEPLOYER_QUERY, [deployer for deployer, _ in signals])
+        holder_rows = self._fetch_by_address(
+            self.HOLDER_QUERY, [address for _, holders in signals for address in holders]
+        )
         
-        conn.close()
+        results = []
+        for deployer, holders in signals:
+            deployer_row = deployer_rows.get(deployer)
+            results.append((
+                self._deployer_from_row(deployer_row) if deployer_row else None,
+                [self._holder_from_row(holder_rows[address]) for address in holders if address in holder_rows]
+            ))
         return results
     
     def calculate_signal_boost(self, deployer_address: str, holder_addresses: List[str]) -> Dict:
         """Skaičiuoja signal boost pagal wallet intelligence"""
         deployer_intel = self.get_deployer_intelligence(deployer_address)
         holder_intel = self.get_holder_intelligence(holder_addresses)
-        
+        return self._signal_boost(deployer_intel, holder_intel)
+    
+    def calculate_signal_boosts(self, signals: List[Tuple[str, List[str]]]) -> List[Dict]:
+        """calculate_signal_boost visam signalų batch'ui vienu DB kreipiniu"""
+        return [
+            self._signal_boost(deployer_intel, holder_intel)
+            for deployer_intel, holder_intel in self.get_batch_intelligence(signals)
+        ]
+    
+    def _signal_boost(self, deployer_intel: Dict, holder_intel: List[Dict]) -> Dict:
+        """Boost skaičiavimas iš jau surinktų deployer / holder duomenų"""
         boost_score = 0
         boost_factors = []
         
@@ -552,10 +1218,20 @@ class WalletIntelligenceLookup:
         }
 
 if __name__ == "__main__":
+    import argparse
+    
+    arg_parser = argparse.ArgumentParser(description='Build the wallet intelligence database')
+    arg_parser.add_argument('--full', action='store_true',
+                            help='rebuild from all history instead of adding only new signals')
+    args = arg_parser.parse_args()
+    
     print("🚀 Starting Wallet Intelligence Database Builder...")
     
     builder = WalletDatabaseBuilder()
-    builder.build_complete_database()
+    if args.full:
+        builder.build_complete_database()
+    else:
+        builder.update_database()
     
     print("\n🧪 Testing database lookup...")
     lookup = WalletIntelligenceLookup()
@@ -11,32 +11,48 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 import re
 
+from http_client import InflightRequests, acquire_session, release_session
+from rate_limiter import TokenBucket, host_limiter
+from response_cache import ResponseCache, default_response_cache
+
+TOP_HOLDERS_ANALYZED = 5  # Kiek signalo top holderių analizuojama
+
 class WalletIntelligenceSystem:
-    def __init__(self):
-        self.session = None
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None,
+                 max_concurrency: int = 5, requests_per_second: Optional[float] = None, burst: int = 10,
+                 response_cache: Optional[ResponseCache] = None):
+        # Perduota sesija priklauso kviečiančiajam; kitaip skolinamasi bendra (http_client)
+        self.session = session
+        self._owns_session = session is None
+        self.timeout = aiohttp.ClientTimeout(total=45)
+        
+        # Lygiagrečių užklausų riba; API rate limit - bendras per hostą (rate_limiter.host_limiter),
+        # nebent requests_per_second duotas šiam objektui
+        self.request_semaphore = asyncio.Semaphore(max_concurrency)
+        self.rate_limiter = None if requests_per_second is None else TokenBucket(requests_per_second, burst)
         
         # API endpoints
         self.solscan_api = "https://public-api.solscan.io"
         self.helius_rpc = "https://rpc.helius.xyz"  # Premium RPC
         self.dexscreener_api = "https://api.dexscreener.com/latest"
         
+        # Persistentinis API atsakymų kešas (išlieka tarp procesų)
+        self.response_cache = response_cache or default_response_cache()
+        self.inflight = InflightRequests()
+        
         # Cache for wallet analysis (avoid duplicate API calls)
         self.wallet_cache = {}
         self.deployer_cache = {}
         
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=45),
-            headers={
-                'User-Agent': 'Mozilla/5.0 (compatible; 0xBot-Intelligence/1.0)',
-                'Accept': 'application/json'
-            }
-        )
+        if self._owns_session:
+            self.session = await acquire_session()
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
+        if self._owns_session and self.session:
+            await release_session(self.session)
+            self.session = None
 
     async def analyze_deployer_deep(self, deployer_address: str) -> Dict[str, Any]:
         """Gili deployer analizė - jo istorija, sėkmė, patterns"""
@@ -53,12 +69,11 @@ class WalletIntelligenceSystem:
             # 2. Find all tokens deployed by this address
             deployed_tokens = await self._extract_deployed_tokens(deployer_txns)
             
-            # 3. Analyze each token's performance
-            token_performances = []
-            for token in deployed_tokens[:10]:  # Analyze last 10 tokens
-                performance = await self._analyze_token_performance(token)
-                if performance:
-                    token_performances.append(performance)
+            # 3. Analyze each token's performance (concurrently, last 10 tokens)
+            performances = await asyncio.gather(
+                *(self._analyze_token_performance(token) for token in deployed_tokens[:10])
+            )
+            token_performances = [p for p in performances if p]
             
             # 4. Calculate deployer metrics
             deployer_metrics = self._calculate_deployer_metrics(token_performances)
@@ -103,19 +118,13 @@ class WalletIntelligenceSystem:
         try:
             print(f"🐋 Analyzing {len(holder_addresses)} top holders...")
             
-            holder_analyses = []
+            top_holders = holder_addresses[:TOP_HOLDERS_ANALYZED]
             
-            for address in holder_addresses[:5]:  # Top 5 holders
-                if address in self.wallet_cache:
-                    analysis = self.wallet_cache[address]
-                else:
-                    analysis = await self._analyze_single_holder(address)
-                    self.wallet_cache[address] = analysis
-                    
-                holder_analyses.append(analysis)
-                
-                # Rate limiting
-                await asyncio.sleep(0.5)
+            # Nekešuoti adresai analizuojami lygiagrečiai (semaphore + token bucket)
+            pending = [a for a in dict.fromkeys(top_holders) if a not in self.wallet_cache]
+            await asyncio.gather(*(self.analyze_holder_cached(a) for a in pending))
+            
+            holder_analyses = [self.wallet_cache[address] for address in top_holders]
             
             # Aggregate analysis
             aggregate_metrics = self._aggregate_holder_metrics(holder_analyses)
@@ -140,6 +149,31 @@ class WalletIntelligenceSystem:
             print(f"❌ Holder analysis error: {e}")
             return self._get_holders_fallback()
 
+    async def analyze_holder_cached(self, holder_address: str) -> Dict:
+        """Holder analizė įrašoma į wallet_cache iškart (kiti batch signalai jos nelaukia iš naujo)"""
+        analysis = await self._analyze_single_holder(holder_address)
+        self.wallet_cache[holder_address] = analysis
+        return analysis
+
+    async def _get_json(self, url: str, params: Dict = None) -> Optional[Dict]:
+        """GET per response cache, o praleidimai - per bendrą concurrency ir rate limitą (None, jei ne 200)"""
+        cached = await self.response_cache.aget(url, params)
+        if cached is not None:
+            return cached
+        # Tas pats adresas keliuose vienu metu analizuojamuose signaluose -> vienas fetch
+        return await self.inflight.run(self.response_cache.make_key(url, params),
+                                       lambda: self._fetch_json(url, params))
+
+    async def _fetch_json(self, url: str, params: Dict = None) -> Optional[Dict]:
+        async with self.request_semaphore:
+            await (self.rate_limiter or host_limiter(url)).acquire()
+            async with self.session.get(url, params=params, timeout=self.timeout) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    await self.response_cache.aput(url, params, data)
+                    return data
+        return None
+
     async def _get_deployer_transactions(self, address: str) -> List[Dict]:
         """Get deployer transaction history"""
         try:
@@ -149,11 +183,10 @@ class WalletIntelligenceSystem:
                 'limit': 200
             }
             
-            async with self.session.get(url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return data.get('data', [])
-        except:
+            data = await self._get_json(url, params)
+            if data is not None:
+                return data.get('data', [])
+        except Exception:
             pass
         return []
 
@@ -181,34 +214,33 @@ class WalletIntelligenceSystem:
             # Get token price history from DexScreener
             url = f"{self.dexscreener_api}/dex/tokens/{token_address}"
             
-            async with self.session.get(url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    pairs = data.get('pairs', [])
+            data = await self._get_json(url)
+            if data is not None:
+                pairs = data.get('pairs', [])
+                
+                if pairs:
+                    pair = pairs[0]  # Main trading pair
+                    
+                    # Calculate performance metrics
+                    current_price = float(pair.get('priceUsd', 0))
+                    price_24h = float(pair.get('priceChange', {}).get('h24', 0))
+                    volume_24h = float(pair.get('volume', {}).get('h24', 0))
+                    liquidity = float(pair.get('liquidity', {}).get('usd', 0))
                     
-                    if pairs:
-                        pair = pairs[0]  # Main trading pair
-                        
-                        # Calculate performance metrics
-                        current_price = float(pair.get('priceUsd', 0))
-                        price_24h = float(pair.get('priceChange', {}).get('h24', 0))
-                        volume_24h = float(pair.get('volume', {}).get('h24', 0))
-                        liquidity = float(pair.get('liquidity', {}).get('usd', 0))
-                        
-                        # Estimate max gain (simplified)
-                        max_gain = max(1, abs(price_24h) / 100 + 1) if price_24h else 1
-                        
-                        return {
-                            "token_address": token_address,
-                            "current_price_usd": current_price,
-                            "price_change_24h": price_24h,
-                            "volume_24h_usd": volume_24h,
-                            "liquidity_usd": liquidity,
-                            "max_gain": max_gain,
-                            "is_active": volume_24h > 1000,  # $1K+ volume = active
-                            "survival_days": 1  # Simplified
-                        }
-        except:
+                    # Estimate max gain (simplified)
+                    max_gain = max(1, abs(price_24h) / 100 + 1) if price_24h else 1
+                    
+                    return {
+                        "token_address": token_address,
+                        "current_price_usd": current_price,
+                        "price_change_24h": price_24h,
+                        "volume_24h_usd": volume_24h,
+                        "liquidity_usd": liquidity,
+                        "max_gain": max_gain,
+                        "is_active": volume_24h > 1000,  # $1K+ volume = active
+                        "survival_days": 1  # Simplified
+                    }
+        except Exception:
             pass
         return None
 
@@ -222,25 +254,24 @@ class WalletIntelligenceSystem:
                 'limit': 100
             }
             
-            async with self.session.get(url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    transactions = data.get('data', [])
-                    
-                    # Analyze trading patterns
-                    trading_analysis = self._analyze_trading_patterns(transactions)
-                    
-                    return {
-                        "holder_address": holder_address,
-                        "total_transactions": len(transactions),
-                        "diamond_hands_score": trading_analysis.get('diamond_hands_score', 5),
-                        "success_rate": trading_analysis.get('success_rate', 0.5),
-                        "total_profit_usd": trading_analysis.get('total_profit_usd', 0),
-                        "avg_hold_time_days": trading_analysis.get('avg_hold_time_days', 10),
-                        "trading_frequency": trading_analysis.get('trading_frequency', 'Medium'),
-                        "risk_level": trading_analysis.get('risk_level', 'Medium')
-                    }
-        except:
+            data = await self._get_json(url, params)
+            if data is not None:
+                transactions = data.get('data', [])
+                
+                # Analyze trading patterns
+                trading_analysis = self._analyze_trading_patterns(transactions)
+                
+                return {
+                    "holder_address": holder_address,
+                    "total_transactions": len(transactions),
+                    "diamond_hands_score": trading_analysis.get('diamond_hands_score', 5),
+                    "success_rate": trading_analysis.get('success_rate', 0.5),
+                    "total_profit_usd": trading_analysis.get('total_profit_usd', 0),
+                    "avg_hold_time_days": trading_analysis.get('avg_hold_time_days', 10),
+                    "trading_frequency": trading_analysis.get('trading_frequency', 'Medium'),
+                    "risk_level": trading_analysis.get('risk_level', 'Medium')
+                }
+        except Exception:
             pass
             
         return {
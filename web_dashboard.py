@@ -20,7 +20,8 @@ import aiohttp
 
 # Import our existing analyzers
 from realtime_signal_analyzer import RealtimeSignalAnalyzer
-from telegram_analyzer import TelegramAnalyzer
+from telegram_analyzer import TelegramCoinAnalyzer
+from dashboard_resources import clear_resources, get_history, get_signal_analyzer
 
 # Configure Streamlit page
 st.set_page_config(
@@ -32,16 +33,16 @@ st.set_page_config(
 
 class CryptoWebDashboard:
     def __init__(self):
-        self.signal_analyzer = RealtimeSignalAnalyzer()
-        self.telegram_analyzer = TelegramAnalyzer()
+        self.telegram_analyzer = TelegramCoinAnalyzer()
         self.load_models()
         
     def load_models(self):
-        """Load ML models and data"""
+        """Load ML models and data (cached across reruns, keyed by data file mtime)"""
         try:
-            self.signal_analyzer.load_model_and_insights()
+            self.signal_analyzer = get_signal_analyzer()
             st.success("✅ AI Models loaded successfully!")
         except Exception as e:
+            self.signal_analyzer = RealtimeSignalAnalyzer()
             st.error(f"❌ Error loading models: {e}")
     
     def fetch_wallet_analysis(self, token_address: str) -> Dict:
@@ -111,6 +112,9 @@ def main():
     
     # Sidebar navigation
     st.sidebar.title("🤖 0xBot Dashboard")
+    if st.sidebar.button("🔄 Reload model", help="Reload the ML model and historical data from disk"):
+        clear_resources()
+        st.rerun()
     st.sidebar.markdown("---")
     
     page = st.sidebar.selectbox(
@@ -555,7 +559,7 @@ def show_historical_page(dashboard):
     
     # Load historical data
     try:
-        df = pd.read_csv('/workspaces/0xbot/parsed_telegram_data.csv')
+        df = get_history('/workspaces/0xbot/parsed_telegram_data.csv')
         st.success(f"✅ Loaded {len(df)} historical signals")
         
         # Performance metrics